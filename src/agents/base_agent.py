@@ -9,6 +9,7 @@ from pathlib import Path
 from random import Random
 from typing import TYPE_CHECKING, Self
 
+from schemas.actions import actions_from_mask
 from schemas.constants import BASE_OUTPUT_DIR
 from schemas.observation import encode_state_key
 
@@ -115,6 +116,18 @@ class BaseAgent:
         state_key = encode_state_key(observation)
         return self._epsilon_greedy_action(state_key, valid_actions)
 
+    def select_action_masked(self, observation: Observation, mask: int) -> int:
+        """Choose an action from a bitmask of valid actions.
+
+        Args:
+            observation: Agent observation dict.
+            mask: Bitmask with bit `code` set for every valid action code.
+
+        Returns:
+            The chosen action code as an integer.
+        """
+        return self.select_action(observation, actions_from_mask(mask))
+
     def update(self, episode_trajectory: list[tuple[str, int, float]]) -> None:
         """Update agent from an episode trajectory.
 
@@ -2,10 +2,9 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from schemas.actions import ActionCode
+from schemas.actions import ActionCode, mask_from_actions
 from schemas.constants import SUIT_TO_INDEX
 from schemas.observation import encode_state_key
-from schemas.round_state import TRUCO_STATE_TO_INDEX
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -13,48 +12,74 @@ if TYPE_CHECKING:
     from agents.base_agent import BaseAgent, Observation
     from models.player import Player
     from models.round import Round
-    from schemas.player_state import PlayerState
+    from schemas.player_state import SupportsPlayerState
 
 
 def _available_int_codes(actions: list[ActionCode]) -> list[int]:
     return [int(a) for a in actions]
 
 
-def _build_observation_for_round(round_obj: Round | None, player_state: PlayerState) -> Observation:
+def _build_observation_for_round(
+    round_obj: Round | None, player: Player, player_state: SupportsPlayerState
+) -> Observation:
     numbers = [-1, -1, -1]
     suits = [-1, -1, -1]
+    ids = [-1, -1, -1]
     suit_to_int = SUIT_TO_INDEX
-    truco_to_int = TRUCO_STATE_TO_INDEX
 
     for idx, card in enumerate(player_state.player_cards):
-        numbers[idx] = int(card.number)
+        numbers[idx] = card.number
         suits[idx] = suit_to_int[card.suit]
-
-    if round_obj is None:
-        truco_state = 0
-        muestra_number = 0
-        muestra_suit = 0
-    else:
-        truco_state = truco_to_int[round_obj.round_state.truco_state]
-        muestra_number = int(round_obj.muestra.number)
-        muestra_suit = suit_to_int[round_obj.muestra.suit]
+        ids[idx] = card.id
+
+    truco_state = 0
+    muestra_number = 0
+    muestra_suit = 0
+    muestra_id = -1
+    hand_envido = 0
+    hand_flor = 0
+    hand_piezas = 0
+    if round_obj is not None:
+        truco_state = round_obj.round_state.truco
+        seat = round_obj.seats.seat_of[player]
+        hand_envido = round_obj.hand_envido[seat]
+        hand_flor = int(round_obj.hand_flor[seat])
+        hand_piezas = round_obj.hand_piezas[seat]
+        muestra = round_obj.muestra
+        if muestra is not None:
+            muestra_number = muestra.number
+            muestra_suit = suit_to_int[muestra.suit]
+            muestra_id = muestra.id
 
     return {
         "hand_numbers": numbers,
         "hand_suits": suits,
+        "hand_ids": ids,
         "truco_state": truco_state,
         "muestra_number": muestra_number,
         "muestra_suit": muestra_suit,
+        "muestra_id": muestra_id,
+        "hand_envido": hand_envido,
+        "hand_flor": hand_flor,
+        "hand_piezas": hand_piezas,
     }
 
 
 class RoundActionProvider:
     """Callable adapter implementing the `ActionProvider` protocol."""
 
-    def __init__(self, agent: BaseAgent, opponent: BaseAgent, learner_name: str = "Agent") -> None:
+    def __init__(
+        self,
+        agent: BaseAgent,
+        opponent: BaseAgent,
+        learner_name: str = "Agent",
+        *,
+        record_forced: bool = False,
+    ) -> None:
         self._agent: BaseAgent = agent
         self._opponent: BaseAgent = opponent
         self._learner_name = learner_name
+        self._record_forced = record_forced
         self._round: Round | None = None
         self.trajectory: list[tuple[str, int, float]] = []
 
@@ -67,17 +92,33 @@ class RoundActionProvider:
         self.trajectory = []
 
     def __call__(
-        self, player: Player, player_state: PlayerState, available: list[ActionCode]
+        self, player: Player, player_state: SupportsPlayerState, available: list[ActionCode]
     ) -> ActionCode:
-        obs = _build_observation_for_round(self._round, player_state)
-        valid = _available_int_codes(available)
+        return self.select_masked(player, player_state, mask_from_actions(available))
+
+    def select_masked(
+        self, player: Player, player_state: SupportsPlayerState, mask: int
+    ) -> ActionCode:
+        """Choose an action for `player` among the actions set in `mask`."""
+        obs = _build_observation_for_round(self._round, player, player_state)
         if player.name == self._learner_name:
-            action = self._agent.select_action(obs, valid)
+            action = self._agent.select_action_masked(obs, mask)
             self.trajectory.append((encode_state_key(obs), action, 0.0))
             return ActionCode(action)
-        opp_action = self._opponent.select_action(obs, valid)
+        opp_action = self._opponent.select_action_masked(obs, mask)
         return ActionCode(opp_action)
 
+    def observe_forced(
+        self, player: Player, player_state: SupportsPlayerState, action: ActionCode
+    ) -> None:
+        """Add a learner action the round applied on its own to the trajectory.
+
+        Only recorded when the provider was created with `record_forced=True`.
+        """
+        if self._record_forced and player.name == self._learner_name:
+            obs = _build_observation_for_round(self._round, player, player_state)
+            self.trajectory.append((encode_state_key(obs), int(action), 0.0))
+
 
 class HumanVsAgentProvider:
     """Action provider that pairs a human CLI with an agent opponent.
@@ -91,11 +132,13 @@ class HumanVsAgentProvider:
         self,
         agent: BaseAgent,
         human_player_name: str,
-        cli_callback: Callable[[Player, PlayerState, list[ActionCode]], ActionCode],
+        cli_callback: Callable[[Player, SupportsPlayerState, list[ActionCode]], ActionCode],
     ) -> None:
         self._agent = agent
         self._human_name = human_player_name
-        self._cli: Callable[[Player, PlayerState, list[ActionCode]], ActionCode] = cli_callback
+        self._cli: Callable[[Player, SupportsPlayerState, list[ActionCode]], ActionCode] = (
+            cli_callback
+        )
         self._round: Round | None = None
 
     def set_round(self, round_obj: Round) -> None:
@@ -104,12 +147,12 @@ class HumanVsAgentProvider:
     # --- Internals --------------------------------------------------------------
 
     def __call__(
-        self, player: Player, player_state: PlayerState, available: list[ActionCode]
+        self, player: Player, player_state: SupportsPlayerState, available: list[ActionCode]
     ) -> ActionCode:
         if player.name == self._human_name:
             return self._cli(player, player_state, available)
 
-        obs = _build_observation_for_round(self._round, player_state)
+        obs = _build_observation_for_round(self._round, player, player_state)
         valid = _available_int_codes(available)
         action = self._agent.select_action(obs, valid)
         return ActionCode(action)
@@ -0,0 +1,226 @@
+"""Turn-based multi-agent Truco environment in the PettingZoo AEC style.
+
+The API mirrors PettingZoo's `AECEnv` (`agents`, `agent_selection`, `last`, `observe`,
+`step`, `agent_iter`, `rewards`, `terminations`, ...) without depending on it. Only
+the agent on turn is observed: `step` never builds observations, and `observe` and
+`last` build a single one on demand, so the per-step cost does not grow with the
+size of the table.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from gymnasium import spaces
+from gymnasium.utils import seeding
+
+from envs.table import make_table_round, observation_nvec, write_observation
+from models.rules import get_rules
+from schemas.actions import ACTION_COUNT
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    import numpy.typing as npt
+
+    from schemas.constants import RulesName
+
+# Team sizes the environment supports: 1v1, 2v2 and 3v3.
+TEAM_SIZES = (1, 2, 3)
+
+
+class TrucoAECEnv:
+    """Team Truco round for 2, 4 or 6 agents, one agent acting per step.
+
+    Agents are named `player_<seat>`; even seats form team 1 and odd seats team 2,
+    seated interleaved as in `Game`. Each episode is one round. When the round ends
+    every agent is rewarded its team's points minus the other team's points, all
+    agents are terminated and, as in PettingZoo, each must then be stepped with
+    `None` to leave `agents`.
+
+    Observations are dicts with an int64 `"observation"` vector and an int8
+    `"action_mask"`, written into buffers that the next `observe` overwrites. The
+    vector is laid out as in `envs.table`; teammates' cards read `EMPTY_CARD` when
+    `show_teammate_cards` is off.
+    """
+
+    metadata: dict[str, Any] = {"name": "truco_aec_v0", "is_parallelizable": False}  # noqa: RUF012
+
+    def __init__(
+        self,
+        team_size: int = 2,
+        *,
+        show_teammate_cards: bool = False,
+        rules: RulesName = "uruguayo",
+    ) -> None:
+        """Create the table.
+
+        Args:
+            team_size: Players per team: 1, 2 or 3.
+            show_teammate_cards: Whether observations include the teammates' hands.
+            rules: Name of the rules variant to play with.
+
+        Raises:
+            ValueError: If `team_size` is not supported.
+        """
+        if team_size not in TEAM_SIZES:
+            msg = f"team_size must be one of {TEAM_SIZES}, got {team_size}"
+            raise ValueError(msg)
+        size = 2 * team_size
+        self.possible_agents: list[str] = [f"player_{seat}" for seat in range(size)]
+        self._deck_rng = random.Random()
+        self.round = make_table_round(
+            self.possible_agents,
+            get_rules(rules),
+            self._deck_rng,
+            show_teammate_cards=show_teammate_cards,
+        )
+        self._seat_of = {agent: seat for seat, agent in enumerate(self.possible_agents)}
+
+        nvec = observation_nvec(size)
+        self._observation_space = spaces.Dict(
+            {
+                "observation": spaces.MultiDiscrete(nvec),
+                "action_mask": spaces.Box(0, 1, (ACTION_COUNT,), dtype=np.int8),
+            }
+        )
+        self._action_space = spaces.Discrete(ACTION_COUNT)
+        self._obs: npt.NDArray[np.int64] = np.zeros(len(nvec), dtype=np.int64)
+        self._mask: npt.NDArray[np.int8] = np.zeros(ACTION_COUNT, dtype=np.int8)
+        self._observation = {"observation": self._obs, "action_mask": self._mask}
+
+        self.np_random, _ = seeding.np_random()
+        self.agents: list[str] = []
+        self.agent_selection = self.possible_agents[0]
+        self.rewards: dict[str, float] = {}
+        self._cumulative_rewards: dict[str, float] = {}
+        self.terminations: dict[str, bool] = {}
+        self.truncations: dict[str, bool] = {}
+        self.infos: dict[str, dict[str, Any]] = {}
+
+    def observation_space(self, agent: str) -> spaces.Dict:
+        """Return the observation space of `agent` (the same for every agent)."""
+        _ = agent
+        return self._observation_space
+
+    def action_space(self, agent: str) -> spaces.Discrete:
+        """Return the action space of `agent` (the same for every agent)."""
+        _ = agent
+        return self._action_space
+
+    def reset(self, seed: int | None = None, options: dict[str, Any] | None = None) -> None:
+        """Deal a new round.
+
+        Args:
+            seed: Seeds the deals and the choice of mano.
+            options: `{"mano": agent}` fixes who leads the first trick; otherwise it is
+                drawn at random.
+        """
+        if seed is not None:
+            self.np_random, _ = seeding.np_random(seed)
+            self._deck_rng.seed(seed)
+        mano = (options or {}).get("mano")
+        seat = (
+            self._seat_of[mano]
+            if mano is not None
+            else int(self.np_random.integers(len(self.possible_agents)))
+        )
+        round_obj = self.round
+        round_obj.reset(round_obj.seats.players[seat])
+
+        self.agents = self.possible_agents.copy()
+        self.rewards = dict.fromkeys(self.agents, 0.0)
+        self._cumulative_rewards = dict.fromkeys(self.agents, 0.0)
+        self.terminations = dict.fromkeys(self.agents, False)
+        self.truncations = dict.fromkeys(self.agents, False)
+        self.infos = {agent: {} for agent in self.agents}
+        self._select_current()
+
+    def step(self, action: int | None) -> None:
+        """Apply the selected agent's action and select the next agent.
+
+        Args:
+            action: An action code legal for `agent_selection`, or None to remove an
+                agent that has already terminated.
+
+        Raises:
+            ValueError: If the action is not legal, or not None for a terminated agent.
+        """
+        agent = self.agent_selection
+        if self.terminations.get(agent, False):
+            if action is not None:
+                msg = f"{agent} has terminated; step it with None"
+                raise ValueError(msg)
+            self.agents.remove(agent)
+            del self.rewards[agent]
+            del self._cumulative_rewards[agent]
+            del self.terminations[agent]
+            del self.truncations[agent]
+            del self.infos[agent]
+            if self.agents:
+                self.agent_selection = self.agents[0]
+            return
+
+        self._cumulative_rewards[agent] = 0.0
+        round_obj = self.round
+        round_obj.step(int(action) if action is not None else -1)
+        if not round_obj.is_done:
+            self._select_current()
+            return
+
+        team_points = round_obj.result()
+        team_of = round_obj.seats.team_of
+        for other in self.agents:
+            points = team_points[team_of[self._seat_of[other]] - 1]
+            reward = float(2 * points - sum(team_points))
+            self.rewards[other] = reward
+            self._cumulative_rewards[other] += reward
+            self.terminations[other] = True
+        self.agent_selection = self.agents[0]
+
+    def observe(self, agent: str) -> dict[str, npt.NDArray[Any]]:
+        """Build `agent`'s observation and action mask into the shared buffers.
+
+        Args:
+            agent: Name of the observing agent.
+
+        Returns:
+            The observation dict; its arrays are overwritten by the next call.
+        """
+        write_observation(self.round, self._seat_of[agent], self._obs, self._mask)
+        return self._observation
+
+    def last(
+        self, *, observe: bool = True
+    ) -> tuple[dict[str, npt.NDArray[Any]] | None, float, bool, bool, dict[str, Any]]:
+        """Return the selected agent's observation, reward, termination, truncation and info.
+
+        Args:
+            observe: Whether to build the observation; pass False to skip it.
+
+        Returns:
+            `(observation, cumulative_reward, terminated, truncated, info)`.
+        """
+        agent = self.agent_selection
+        return (
+            self.observe(agent) if observe else None,
+            self._cumulative_rewards[agent],
+            self.terminations[agent],
+            self.truncations[agent],
+            self.infos[agent],
+        )
+
+    def agent_iter(self, max_iter: int = 2**63) -> Iterator[str]:
+        """Yield the selected agent until every agent has left or `max_iter` is reached."""
+        for _ in range(max_iter):
+            if not self.agents:
+                return
+            yield self.agent_selection
+
+    def _select_current(self) -> None:
+        """Select the agent whose decision the round is waiting for."""
+        current = self.round.current_player
+        if current is not None:
+            self.agent_selection = current.name
@@ -0,0 +1,14 @@
+"""Lazy registration of the Truco environments with Gymnasium."""
+
+import gymnasium as gym
+
+TRUCO_ENV_ID = "Truco-v0"
+
+
+def register_envs() -> None:
+    """Register the Truco environments, deferring their import to `gym.make`.
+
+    Safe to call more than once.
+    """
+    if TRUCO_ENV_ID not in gym.registry:
+        gym.register(id=TRUCO_ENV_ID, entry_point="envs.truco_env:TrucoEnv")
@@ -0,0 +1,177 @@
+"""Round factory and observation layout shared by the Truco environments.
+
+Every environment seats its players interleaved, so even seats form team 1, and
+observes a seat through the same vector: the fixed `OBS_*` fields, then the cards of
+each teammate in play order, then the card each seat played in each trick, with
+seats counted from the observer. A 1v1 table has no teammate fields.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from models.deck import Deck
+from models.player import Player
+from models.round import HANDS_TO_WIN_ROUND, NO_CARD, PHASE_DONE, Round
+from schemas.actions import write_mask_vector
+from schemas.constants import CARD_COUNT, CARDS_DEALT_PER_PLAYER
+from schemas.round_state import ENVIDO_STATES, TRUCO_STATES
+
+if TYPE_CHECKING:
+    import random
+    from collections.abc import Sequence
+
+    import numpy.typing as npt
+
+    from models.rules import RulesVariant
+
+# Card id slot value meaning "no card" in observations.
+EMPTY_CARD = CARD_COUNT
+MAX_ENVIDO = 37
+
+# Fixed-position fields of the observation vector, all relative to the observer.
+OBS_HAND = slice(0, CARDS_DEALT_PER_PLAYER)
+OBS_MUESTRA = 3
+OBS_TRUCO = 4
+OBS_ENVIDO = 5
+OBS_PHASE = 6
+OBS_TRICK = 7
+OBS_TRICKS_WON = 8
+OBS_OPPONENT_TRICKS_WON = 9
+OBS_HAND_ENVIDO = 10
+OBS_HAND_FLOR = 11
+OBS_HAND_PIEZAS = 12
+OBS_TEAM_CALLED_FLOR = 13
+OBS_OPPONENTS_CALLED_FLOR = 14
+# Seat of the mano, counted from the observer's seat in play order.
+OBS_MANO_OFFSET = 15
+# Variable-size fields start here: the teammates' cards, then the trick plays.
+OBS_TEAMMATE_CARDS = 16
+
+
+def plays_offset(num_seats: int) -> int:
+    """Return the index where the trick plays start in a `num_seats` table's observation."""
+    return OBS_TEAMMATE_CARDS + (num_seats // 2 - 1) * CARDS_DEALT_PER_PLAYER
+
+
+def observation_nvec(num_seats: int) -> npt.NDArray[np.int64]:
+    """Return the `MultiDiscrete` sizes of each value of a `num_seats` table's observation."""
+    size = plays_offset(num_seats) + num_seats * CARDS_DEALT_PER_PLAYER
+    nvec = np.full(size, CARD_COUNT + 1, dtype=np.int64)
+    nvec[OBS_TRUCO] = len(TRUCO_STATES)
+    nvec[OBS_ENVIDO] = len(ENVIDO_STATES)
+    nvec[OBS_PHASE] = PHASE_DONE + 1
+    nvec[OBS_TRICK] = CARDS_DEALT_PER_PLAYER + 1
+    nvec[OBS_TRICKS_WON] = nvec[OBS_OPPONENT_TRICKS_WON] = HANDS_TO_WIN_ROUND + 1
+    nvec[OBS_HAND_ENVIDO] = MAX_ENVIDO + 1
+    nvec[OBS_HAND_FLOR] = nvec[OBS_TEAM_CALLED_FLOR] = nvec[OBS_OPPONENTS_CALLED_FLOR] = 2
+    nvec[OBS_HAND_PIEZAS] = CARDS_DEALT_PER_PLAYER + 1
+    nvec[OBS_MANO_OFFSET] = num_seats
+    return nvec
+
+
+def make_table_round(
+    names: Sequence[str],
+    rules: RulesVariant,
+    deck_rng: random.Random,
+    *,
+    show_teammate_cards: bool = False,
+) -> Round:
+    """Create an env's round, seating one player per name with interleaved teams.
+
+    Args:
+        names: Player names by seat; even seats form team 1 and odd seats team 2.
+        rules: Rules variant to play with.
+        deck_rng: Generator the round's deck draws from.
+        show_teammate_cards: Whether players may see their teammates' hands.
+
+    Returns:
+        A dealt round driven through `Round.step`, to be `reset` before every episode.
+    """
+    players = [Player(name) for name in names]
+    return Round(
+        players[0::2],
+        players[1::2],
+        players,
+        _no_provider,
+        starting_player=players[0],
+        show_teammate_cards=show_teammate_cards,
+        rules=rules,
+        dealer=Deck(deck_rng),
+    )
+
+
+def write_observation(
+    round_obj: Round, seat: int, obs: npt.NDArray[np.int64], mask: npt.NDArray[np.int8]
+) -> npt.NDArray[np.int64]:
+    """Write a seat's observation and action mask into preallocated arrays.
+
+    Args:
+        round_obj: Round created by `make_table_round`.
+        seat: Seat of the observer.
+        obs: Array laid out as described in this module, sized by `observation_nvec`.
+        mask: Array of `ACTION_COUNT` values, set to 1 for the observer's legal
+            actions. All zeros while the observer is not on turn.
+
+    Returns:
+        The `obs` array.
+    """
+    seats = round_obj.seats
+    size = len(seats)
+    player = seats.players[seat]
+
+    hand = player.cards
+    for slot in range(CARDS_DEALT_PER_PLAYER):
+        obs[slot] = hand[slot].id if slot < len(hand) else EMPTY_CARD
+    muestra = round_obj.muestra
+    obs[OBS_MUESTRA] = EMPTY_CARD if muestra is None else muestra.id
+    round_state = round_obj.round_state
+    obs[OBS_TRUCO] = round_state.truco
+    obs[OBS_ENVIDO] = round_state.envido
+    obs[OBS_PHASE] = round_obj.phase
+    obs[OBS_TRICK] = round_obj.trick_index
+    team = seats.team_of[seat]
+    tricks_won = round_obj.tricks_won
+    obs[OBS_TRICKS_WON] = tricks_won[team - 1]
+    obs[OBS_OPPONENT_TRICKS_WON] = tricks_won[2 - team]
+    obs[OBS_HAND_ENVIDO] = round_obj.hand_envido[seat]
+    obs[OBS_HAND_FLOR] = round_obj.hand_flor[seat]
+    obs[OBS_HAND_PIEZAS] = round_obj.hand_piezas[seat]
+    team_flor = opponents_flor = False
+    for caller in round_state.flor_calls:
+        if seats.team_of[seats.seat_of[caller]] == team:
+            team_flor = True
+        else:
+            opponents_flor = True
+    obs[OBS_TEAM_CALLED_FLOR] = team_flor
+    obs[OBS_OPPONENTS_CALLED_FLOR] = opponents_flor
+    obs[OBS_MANO_OFFSET] = (seats.seat_of[round_obj.starting_player] - seat) % size
+
+    offset = OBS_TEAMMATE_CARDS
+    show = round_obj.show_teammate_cards
+    for mate in seats.teammates[seat]:
+        mate_cards = seats.players[mate].cards if show else ()
+        for slot in range(CARDS_DEALT_PER_PLAYER):
+            obs[offset + slot] = mate_cards[slot].id if slot < len(mate_cards) else EMPTY_CARD
+        offset += CARDS_DEALT_PER_PLAYER
+
+    plays = round_obj.trick_plays
+    order = seats.trick_orders[seat]
+    for trick in range(CARDS_DEALT_PER_PLAYER):
+        base = trick * size
+        for position in range(size):
+            card_id = plays[base + order[position]]
+            obs[offset + position] = EMPTY_CARD if card_id == NO_CARD else card_id
+        offset += size
+
+    on_turn = round_obj.current_player is player
+    write_mask_vector(round_obj.current_action_mask() if on_turn else 0, mask)
+    return obs
+
+
+def _no_provider(*_: object) -> int:
+    """Action provider of an env's round, which is only ever stepped directly."""
+    msg = "Environment rounds are driven through step()"
+    raise RuntimeError(msg)
@@ -0,0 +1,136 @@
+"""Gymnasium environment for 2-player Truco against a pluggable opponent policy."""
+
+from __future__ import annotations
+
+import random
+from typing import TYPE_CHECKING, Any, Protocol
+
+import gymnasium as gym
+import numpy as np
+from gymnasium import spaces
+
+from envs.table import make_table_round, observation_nvec, write_observation
+from models.rules import get_rules
+from schemas.actions import ACTION_COUNT
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+    from models.player_view import PlayerView
+    from models.round import Round
+    from schemas.constants import RulesName
+
+# Observation of the agent's seat 0 at a 1v1 table, laid out as in `envs.table`.
+OBS_NVEC = observation_nvec(2)
+OBS_SIZE = len(OBS_NVEC)
+# Names of the agent's and the opponent's players, by seat.
+TABLE_NAMES = ("Agent", "Opponent")
+
+
+class OpponentPolicy(Protocol):
+    """Chooses the opponent's actions inside `TrucoEnv`."""
+
+    def __call__(self, view: PlayerView, mask: int, rng: np.random.Generator) -> int:
+        """Return an action code set in `mask` for the player of `view`."""
+        ...
+
+
+def uniform_policy(view: PlayerView, mask: int, rng: np.random.Generator) -> int:
+    """Opponent policy that picks uniformly among the legal actions."""
+    _ = view
+    actions = [code for code in range(ACTION_COUNT) if mask >> code & 1]
+    return actions[int(rng.integers(len(actions)))]
+
+
+class TrucoEnv(gym.Env[np.ndarray, int]):
+    """Single-agent Truco round: the agent (team 1) plays one round against a policy.
+
+    Each episode is one round. Observations are a `MultiDiscrete` vector laid out as
+    in `envs.table` for seat 0, written into a preallocated array that is returned on every
+    call and overwritten by the next one (copy it to keep it). `info["action_mask"]`
+    is a preallocated int8 vector of the agent's legal actions. The reward, given
+    when the round ends, is the agent's points minus the opponent's points.
+    """
+
+    metadata: dict[str, Any] = {"render_modes": []}  # noqa: RUF012
+
+    def __init__(
+        self,
+        opponent: OpponentPolicy | None = None,
+        *,
+        rules: RulesName = "uruguayo",
+    ) -> None:
+        """Create the environment.
+
+        Args:
+            opponent: Policy of the opponent. Plays uniformly at random when omitted.
+            rules: Name of the rules variant to play with.
+        """
+        self._opponent: OpponentPolicy = opponent or uniform_policy
+        self._deck_rng = random.Random()
+        self.round = make_table_round(TABLE_NAMES, get_rules(rules), self._deck_rng)
+        self._agent, self._rival = self.round.seats.players
+
+        self.observation_space = spaces.MultiDiscrete(OBS_NVEC)
+        self.action_space = spaces.Discrete(ACTION_COUNT)
+        self._obs: npt.NDArray[np.int64] = np.zeros(OBS_SIZE, dtype=np.int64)
+        self._mask: npt.NDArray[np.int8] = np.zeros(ACTION_COUNT, dtype=np.int8)
+        self._info: dict[str, Any] = {"action_mask": self._mask}
+
+    def reset(
+        self, *, seed: int | None = None, options: dict[str, Any] | None = None
+    ) -> tuple[np.ndarray, dict[str, Any]]:
+        """Deal a new round and play the opponent until the agent must act.
+
+        Args:
+            seed: Seeds the deals, the starting player and the opponent's choices.
+            options: `{"agent_starts": bool}` fixes who leads the first trick;
+                otherwise it is drawn at random.
+
+        Returns:
+            The observation and info dict with the `action_mask`.
+        """
+        super().reset(seed=seed)
+        if seed is not None:
+            self._deck_rng.seed(seed)
+        agent_starts = (options or {}).get("agent_starts")
+        if agent_starts is None:
+            agent_starts = bool(self.np_random.integers(2))
+        self.round.reset(self._agent if agent_starts else self._rival)
+        play_opponent(self.round, self._opponent, self.np_random)
+        write_observation(self.round, 0, self._obs, self._mask)
+        return self._obs, self._info
+
+    def step(self, action: int) -> tuple[np.ndarray, float, bool, bool, dict[str, Any]]:
+        """Apply the agent's action and play the opponent until the agent acts again.
+
+        Args:
+            action: An action code set in `info["action_mask"]`.
+
+        Returns:
+            observation, reward, terminated, truncated (always False), info.
+
+        Raises:
+            ValueError: If the action is not legal.
+        """
+        self.round.step(int(action))
+        play_opponent(self.round, self._opponent, self.np_random)
+        obs = write_observation(self.round, 0, self._obs, self._mask)
+        if not self.round.is_done:
+            return obs, 0.0, False, False, self._info
+        agent_points, rival_points = self.round.result()
+        return obs, float(agent_points - rival_points), True, False, self._info
+
+
+def play_opponent(round_obj: Round, opponent: OpponentPolicy, rng: np.random.Generator) -> None:
+    """Step the seat-1 player's decisions until seat 0 must act or the round ends.
+
+    Args:
+        round_obj: Round created by `make_table_round`.
+        opponent: Policy choosing the opponent's actions.
+        rng: Generator handed to the policy.
+    """
+    rival = round_obj.seats.players[1]
+    view = round_obj.get_player_view(rival)
+    while round_obj.current_player is rival:
+        round_obj.step(opponent(view, round_obj.current_action_mask(), rng))
@@ -0,0 +1,163 @@
+"""Batched Truco environment stepping many independent 1v1 tables per call."""
+
+from __future__ import annotations
+
+import random
+from typing import TYPE_CHECKING
+
+import numpy as np
+from gymnasium import spaces
+
+from envs.table import make_table_round, write_observation
+from envs.truco_env import (
+    OBS_NVEC,
+    OBS_SIZE,
+    TABLE_NAMES,
+    OpponentPolicy,
+    play_opponent,
+    uniform_policy,
+)
+from models.rules import get_rules
+from schemas.actions import ACTION_COUNT
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+    from models.round import Round
+    from schemas.constants import RulesName
+
+
+class TrucoVectorEnv:
+    """N independent Truco tables stepped together, auto-resetting finished rounds.
+
+    Every table is the single-agent setup of `TrucoEnv`: the agent plays seat 0
+    against an opponent policy and each round is an episode. The batch state the
+    policy consumes lives in `(N, ...)` arrays that are written in place and returned
+    by every call, so copy them to keep them.
+
+    When a table's round ends, `step` reports its reward and `done` flag and then
+    deals the next round straight away; the observation and mask returned for that
+    table already belong to the new round.
+
+    Only the state exchanged with the policy is array-backed. Each table's game state
+    is a `Round`, reset in place and stepped in a Python loop, so per-table cost is
+    close to a `SyncVectorEnv` over `TrucoEnv`; the rules themselves are not batched.
+
+    Attributes:
+        num_envs: Number of tables.
+        single_observation_space: Observation space of one table.
+        single_action_space: Action space of one table.
+        observations: `(N, OBS_SIZE)` int64 observations.
+        masks: `(N, ACTION_COUNT)` int8 legal-action masks.
+        rewards: `(N,)` float64 rewards of the last step.
+        dones: `(N,)` bool flags of the rounds that ended on the last step.
+    """
+
+    def __init__(
+        self,
+        num_envs: int,
+        opponent: OpponentPolicy | None = None,
+        *,
+        rules: RulesName = "uruguayo",
+        seed: int | None = None,
+    ) -> None:
+        """Create the tables and deal their first rounds.
+
+        Args:
+            num_envs: Number of tables to run.
+            opponent: Policy of every opponent. Plays uniformly at random when omitted.
+            rules: Name of the rules variant to play with.
+            seed: Seeds the deals, starting players and opponent choices.
+
+        Raises:
+            ValueError: If `num_envs` is not positive.
+        """
+        if num_envs < 1:
+            msg = f"num_envs must be positive, got {num_envs}"
+            raise ValueError(msg)
+        self.num_envs = num_envs
+        self._opponent: OpponentPolicy = opponent or uniform_policy
+        variant = get_rules(rules)
+        self._deck_rngs = [random.Random() for _ in range(num_envs)]
+        self._rounds: list[Round] = [
+            make_table_round(TABLE_NAMES, variant, rng) for rng in self._deck_rngs
+        ]
+
+        self.single_observation_space = spaces.MultiDiscrete(OBS_NVEC)
+        self.single_action_space = spaces.Discrete(ACTION_COUNT)
+        self.observation_space = spaces.MultiDiscrete(np.tile(OBS_NVEC, (num_envs, 1)))
+        self.action_space = spaces.MultiDiscrete(np.full(num_envs, ACTION_COUNT))
+
+        self.observations: npt.NDArray[np.int64] = np.zeros((num_envs, OBS_SIZE), dtype=np.int64)
+        self.masks: npt.NDArray[np.int8] = np.zeros((num_envs, ACTION_COUNT), dtype=np.int8)
+        self.rewards: npt.NDArray[np.float64] = np.zeros(num_envs, dtype=np.float64)
+        self.dones: npt.NDArray[np.bool_] = np.zeros(num_envs, dtype=np.bool_)
+        self._rng = np.random.default_rng()
+        self.reset(seed=seed)
+
+    def reset(
+        self, *, seed: int | None = None
+    ) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int8]]:
+        """Deal a new round on every table.
+
+        Args:
+            seed: Seeds the deals, starting players and opponent choices. Table `i`
+                deals from `seed + i`.
+
+        Returns:
+            The observations and masks arrays.
+        """
+        if seed is not None:
+            self._rng = np.random.default_rng(seed)
+            for index, rng in enumerate(self._deck_rngs):
+                rng.seed(seed + index)
+        for index in range(self.num_envs):
+            self._reset_table(index)
+        self.rewards.fill(0.0)
+        self.dones.fill(False)
+        return self.observations, self.masks
+
+    def step(
+        self, actions: npt.ArrayLike
+    ) -> tuple[
+        npt.NDArray[np.int64], npt.NDArray[np.float64], npt.NDArray[np.bool_], npt.NDArray[np.int8]
+    ]:
+        """Apply one agent action on every table.
+
+        Args:
+            actions: `(N,)` action codes, each set in the table's row of `masks`.
+
+        Returns:
+            observations, rewards, dones and masks, all indexed by table.
+
+        Raises:
+            ValueError: If `actions` has the wrong shape or an action is not legal.
+        """
+        actions = np.asarray(actions)
+        if actions.shape != (self.num_envs,):
+            msg = f"Expected actions of shape ({self.num_envs},), got {actions.shape}"
+            raise ValueError(msg)
+
+        rewards = self.rewards
+        dones = self.dones
+        for index, action in enumerate(actions.tolist()):
+            round_obj = self._rounds[index]
+            round_obj.step(action)
+            play_opponent(round_obj, self._opponent, self._rng)
+            if round_obj.is_done:
+                agent_points, rival_points = round_obj.result()
+                rewards[index] = agent_points - rival_points
+                dones[index] = True
+                self._reset_table(index)
+            else:
+                rewards[index] = 0.0
+                dones[index] = False
+                write_observation(round_obj, 0, self.observations[index], self.masks[index])
+        return self.observations, rewards, dones, self.masks
+
+    def _reset_table(self, index: int) -> None:
+        """Deal table `index` a new round and write its first agent observation."""
+        round_obj = self._rounds[index]
+        round_obj.reset(round_obj.seats.players[int(self._rng.integers(2))])
+        play_opponent(round_obj, self._opponent, self._rng)
+        write_observation(round_obj, 0, self.observations[index], self.masks[index])
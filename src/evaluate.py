@@ -9,7 +9,8 @@ from agents.monte_carlo_agent import MonteCarloAgent
 from agents.provider import RoundActionProvider
 from agents.q_learning_agent import QLearningAgent
 from agents.random_agent import RandomAgent
-from logging_config import get_logger
+from logging_config import get_logger, set_headless
+from models.deal_rng import DealRng
 from models.game import Game
 from models.player import Player
 from utils.config_loader import get_evaluation_params, load_agent_config
@@ -22,6 +23,8 @@ logger = get_logger(__name__)
 
 def evaluate(config: TrainingConfig) -> None:
     evaluation_config = get_evaluation_params(config)
+    if config.headless:
+        set_headless()
 
     if evaluation_config.output_dir:
         session_dir = Path(evaluation_config.output_dir)
@@ -44,11 +47,19 @@ def evaluate(config: TrainingConfig) -> None:
     match_wins = 0
     total_points: list[tuple[int, int]] = []
 
-    for _ in range(evaluation_config.matches):
+    for match_index in range(evaluation_config.matches):
         agent_player = Player("Agent")
         opponent_player = Player("Opponent")
         provider = RoundActionProvider(agent, opponent, learner_name=agent_player.name)
-        game = Game(agent_player, opponent_player, provider)
+        # Each match replays its own stream of deals, independent of the others.
+        deal_rng = DealRng(evaluation_config.seed, stream=match_index)
+        game = Game(
+            [agent_player],
+            [opponent_player],
+            provider,
+            deal_rng=deal_rng,
+            auto_forced_actions=True,
+        )
         winner_team = game.play_game(evaluation_config.target_points)
         if winner_team == 1:
             match_wins += 1
@@ -72,8 +83,13 @@ def evaluate(config: TrainingConfig) -> None:
 def main() -> None:
     parser = argparse.ArgumentParser()
     parser.add_argument("--config", type=str, required=True, help="Path to YAML config file")
+    parser.add_argument(
+        "--headless", action="store_true", help="Silence engine logging during simulation"
+    )
     args = parser.parse_args()
     config = load_agent_config(args.config)
+    if args.headless:
+        config.headless = True
     evaluate(config)
 
 
@@ -50,6 +50,32 @@ def get_logger(name: str, level: int = logging.INFO) -> logging.Logger:
         context_filter = ContextFilter()
         logger.addFilter(context_filter)
 
-        logger.setLevel(logging.INFO)
-
     return logger
+
+
+# Loggers of the simulation engine, silenced in headless mode.
+ENGINE_LOGGERS = ("models.round", "models.game")
+
+# Levels the engine loggers had before headless mode was switched on.
+_levels_before_headless: dict[str, int] = {}
+
+
+def set_headless(*, enabled: bool = True) -> None:
+    """Switch headless simulation mode on or off.
+
+    In headless mode the `ENGINE_LOGGERS` only let warnings and errors through, while
+    every other logger, e.g. training progress and evaluation results, is untouched.
+    Engine hot paths check the level once per round and skip their logging calls
+    entirely; rounds pick up a change when they are next reset.
+
+    Args:
+        enabled (bool, optional): Whether to silence INFO and DEBUG engine logging.
+            Defaults to `True`.
+    """
+    for name in ENGINE_LOGGERS:
+        engine_logger = logging.getLogger(name)
+        if enabled:
+            _levels_before_headless.setdefault(name, engine_logger.level)
+            engine_logger.setLevel(logging.WARNING)
+        elif name in _levels_before_headless:
+            engine_logger.setLevel(_levels_before_headless.pop(name))
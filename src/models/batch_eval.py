@@ -0,0 +1,139 @@
+"""Vectorized NumPy evaluation of Envido, Flor and card ranks for many hands at once.
+
+Every function takes card ids and muestra ids as integer arrays and reproduces the
+scalar rules in `models.envido` and `models.card` exactly, without needing a live
+`Round`. Hands are arrays whose last axis holds the three card ids of a hand.
+A muestra id of `NO_MUESTRA` evaluates hands as if there were no piezas.
+"""
+
+import hashlib
+from pathlib import Path
+
+import numpy as np
+import numpy.typing as npt
+
+from models.card import ALL_CARDS, RANK_TABLE
+from models.envido import PIEZA_ENVIDO_VALUES
+from schemas.constants import CARDS_DEALT_PER_PLAYER, REY, SUIT_TO_INDEX
+
+IntArray = npt.NDArray[np.int_]
+BoolArray = npt.NDArray[np.bool_]
+
+# Per-card and per-(muestra, card) lookup arrays shared by all batch functions.
+_RANKS = np.array(RANK_TABLE, dtype=np.int8)
+_FACE = np.array([card.get_envido_value() for card in ALL_CARDS], dtype=np.int16)
+_SUIT = np.array([SUIT_TO_INDEX[card.suit] for card in ALL_CARDS], dtype=np.int8)
+_MUESTRAS = (*ALL_CARDS, None)
+_PIEZA = np.array([[card.is_pieza(m) for card in ALL_CARDS] for m in _MUESTRAS], dtype=np.bool_)
+_PIEZA_ENVIDO = np.array(
+    [
+        [
+            PIEZA_ENVIDO_VALUES[card.number if card.number != REY else m.number]
+            if m is not None and card.is_pieza(m)
+            else 0
+            for card in ALL_CARDS
+        ]
+        for m in _MUESTRAS
+    ],
+    dtype=np.int16,
+)
+
+# Index pairs of the three hand slots, used for same-suit checks.
+_PAIRS = ((0, 1), (0, 2), (1, 2))
+_NO_PAIR = -1
+
+
+def rules_digest() -> str:
+    """Return a short digest of the lookup arrays and source code these functions use.
+
+    It changes whenever card ranks, piezas, Envido values or the evaluation code do,
+    so results cached from these functions can be keyed by it.
+    """
+    digest = hashlib.sha256(Path(__file__).read_bytes())
+    for array in (_RANKS, _FACE, _SUIT, _PIEZA, _PIEZA_ENVIDO):
+        digest.update(array.tobytes())
+    return digest.hexdigest()[:16]
+
+
+def _as_hands(hands: npt.ArrayLike, muestras: npt.ArrayLike) -> tuple[IntArray, IntArray]:
+    """Validate hand and muestra arrays and broadcast muestras against the hand axis."""
+    hand_ids = np.asarray(hands, dtype=np.intp)
+    if hand_ids.ndim == 0 or hand_ids.shape[-1] != CARDS_DEALT_PER_PLAYER:
+        msg = f"Hands must have a last axis of size {CARDS_DEALT_PER_PLAYER}, got {hand_ids.shape}"
+        raise ValueError(msg)
+    muestra_ids = np.asarray(muestras, dtype=np.intp)[..., np.newaxis]
+    return hand_ids, muestra_ids
+
+
+def batch_ranks(card_ids: npt.ArrayLike, muestras: npt.ArrayLike) -> IntArray:
+    """Return the trick-taking rank of each card under its muestra.
+
+    Args:
+        card_ids: Card ids of any shape `(..., k)`.
+        muestras: Muestra ids of shape `(...)`, one per row of `card_ids`.
+
+    Returns:
+        IntArray: Ranks with the shape of `card_ids`, equal to `models.card.rank`.
+    """
+    cards = np.asarray(card_ids, dtype=np.intp)
+    muestra_ids = np.asarray(muestras, dtype=np.intp)[..., np.newaxis]
+    return _RANKS[muestra_ids, cards]
+
+
+def batch_envido(hands: npt.ArrayLike, muestras: npt.ArrayLike) -> IntArray:
+    """Return the Envido value of each 3-card hand.
+
+    Args:
+        hands: Card ids of shape `(..., 3)`.
+        muestras: Muestra ids of shape `(...)`.
+
+    Returns:
+        IntArray: Envido values of shape `(...)`, equal to `models.envido.calculate_envido`.
+    """
+    hand_ids, muestra_ids = _as_hands(hands, muestras)
+    face = _FACE[hand_ids]
+    pieza_values = _PIEZA_ENVIDO[muestra_ids, hand_ids]
+
+    # With a pieza: best pieza value plus the best face value among the other two cards.
+    best_slot = pieza_values.argmax(axis=-1)[..., np.newaxis]
+    best_pieza = np.take_along_axis(pieza_values, best_slot, axis=-1)[..., 0]
+    slots = np.arange(CARDS_DEALT_PER_PLAYER)
+    best_other = np.where(slots == best_slot, _NO_PAIR, face).max(axis=-1)
+    with_pieza = best_pieza + best_other
+
+    # Without piezas: best same-suit pair plus 20, or the best single card.
+    suits = _SUIT[hand_ids]
+    best = face.max(axis=-1)
+    for i, j in _PAIRS:
+        pair = np.where(suits[..., i] == suits[..., j], face[..., i] + face[..., j] + 20, _NO_PAIR)
+        best = np.maximum(best, pair)
+
+    return np.where(best_pieza > 0, with_pieza, best)
+
+
+def batch_flor(hands: npt.ArrayLike, muestras: npt.ArrayLike) -> BoolArray:
+    """Return whether each 3-card hand is a Flor.
+
+    Args:
+        hands: Card ids of shape `(..., 3)`.
+        muestras: Muestra ids of shape `(...)`.
+
+    Returns:
+        BoolArray: Flor flags of shape `(...)`, equal to `models.envido.has_flor`.
+    """
+    hand_ids, muestra_ids = _as_hands(hands, muestras)
+    piezas = _PIEZA[muestra_ids, hand_ids]
+    pieza_count = piezas.sum(axis=-1)
+    suits = _SUIT[hand_ids]
+
+    # With exactly one pieza, exactly one slot pair holds the two non-piezas.
+    plain_pair_same_suit = np.zeros(pieza_count.shape, dtype=np.bool_)
+    for i, j in _PAIRS:
+        plain_pair_same_suit |= ~piezas[..., i] & ~piezas[..., j] & (suits[..., i] == suits[..., j])
+    all_same_suit = (suits[..., 0] == suits[..., 1]) & (suits[..., 1] == suits[..., 2])
+
+    return (
+        (pieza_count >= 2)
+        | ((pieza_count == 1) & plain_pair_same_suit)
+        | ((pieza_count == 0) & all_same_suit)
+    )
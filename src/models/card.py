@@ -1,12 +1,31 @@
-from schemas.constants import REY, CardNumber, CardSuit
+from typing import Any, NoReturn
+
+from schemas.constants import (
+    NUMBER_TO_INDEX,
+    REY,
+    SUIT_COUNT,
+    SUIT_TO_INDEX,
+    CardNumber,
+    CardSuit,
+)
+
+
+def card_id(number: int, suit: str) -> int:
+    """Return the stable integer id (0-39) of the card with the given number and suit."""
+    return NUMBER_TO_INDEX[number] * SUIT_COUNT + SUIT_TO_INDEX[suit]
 
 
 class Card:
     """Represents a playing card in the card game.
 
+    Cards are immutable flyweights: the 40 instances are created once at import and
+    `Card(number, suit)` returns the interned instance, so cards compare and hash by id
+    and never allocate after startup.
+
     Attributes:
         number (int): The number or face value of the card (1-7, 10).
         suit (str): The suit of the card ("basto", "espadas", "oro", "copa").
+        id (int): Stable integer id of the card (0-39), used to index precomputed tables.
     """
 
     _CARD_ORDER = {4: 0, 5: 1, 6: 2, 7: 3, 10: 4, 11: 5, 12: 6, 1: 7, 2: 8, 3: 9}
@@ -21,29 +40,47 @@ class Card:
 
     _PIEZAS = {10: 14, 11: 15, 5: 16, 4: 17, 2: 18}
 
-    def __init__(self, number: CardNumber, suit: CardSuit) -> None:
-        """Initialize a card with a number and suit.
+    __slots__ = ("id", "number", "suit")
+
+    number: CardNumber
+    suit: CardSuit
+    id: int
+
+    def __new__(cls, number: CardNumber, suit: CardSuit) -> "Card":  # noqa: PYI034
+        """Return the interned card with a number and suit.
 
         Args:
             number (CardNumber): The number or face value of the card (1-7, 10).
             suit (CardSuit): The suit of the card ("basto", "espadas", "oro", "copa").
-        """
-        self.number = number
-        self.suit = suit
 
-    def is_pieza(self, muestra: "Card") -> bool:
+        Raises:
+            ValueError: If the number and suit do not name a card of the deck.
+        """
+        card = _INTERNED.get((number, suit))
+        if card is None:
+            msg = f"Invalid card: {number} of {suit}"
+            raise ValueError(msg)
+        return card
+
+    @classmethod
+    def from_id(cls, card_id: int) -> "Card":
+        """Return the interned card with the given id (0-39)."""
+        return ALL_CARDS[card_id]
+
+    def is_pieza(self, muestra: "Card | None") -> bool:
         """Check if this card is a Pieza (trump suit special card).
 
         Piezas are the 2, 4, 5, Caballo (11), and Sota (10) of the muestra suit.
         If any of these is the muestra itself, the Rey (12) of that suit becomes the Pieza.
 
         Args:
-            muestra (Card): The muestra card that determines the trump suit.
+            muestra (Card | None): The muestra card that determines the trump suit, or
+                None when playing without muestra.
 
         Returns:
             bool: True if this card is a Pieza, False otherwise.
         """
-        if self.suit != muestra.suit:
+        if muestra is None or self.suit != muestra.suit:
             return False
 
         if self.number in self._PIEZAS:
@@ -56,6 +93,23 @@ class Card:
         """Check if this card is a Mata (trump suit special card)."""
         return (self.number, self.suit) in self._MATAS
 
+    def compute_card_value(self, muestra: "Card | None") -> int:
+        """Compute the value of this card considering Piezas and Matas.
+
+        This is the reference implementation used to build `RANK_TABLE`; use
+        `get_card_value` or `rank` everywhere else. Without a muestra there are no piezas.
+        """
+        if muestra is not None and self.is_pieza(muestra):
+            # If the card is 12 and a pieza, then it takes the value of the muestra
+            number = self.number if self.number != REY else muestra.number
+            return self._PIEZAS[number]
+
+        if self._is_mata():
+            return self._MATAS[(self.number, self.suit)]
+
+        # Use normal card order for all other cards
+        return self._CARD_ORDER[self.number]
+
     def get_card_value(self, muestra: "Card") -> int:
         """Get the value of this card considering Matas (special cards).
 
@@ -69,16 +123,7 @@ class Card:
         Returns:
             int: The value of this card for comparison purposes.
         """
-        if self.is_pieza(muestra):
-            # If the card is 12 and a pieza, then it takes the value of the muestra
-            number = self.number if self.number != REY else muestra.number
-            return self._PIEZAS[number]
-
-        if self._is_mata():
-            return self._MATAS[(self.number, self.suit)]
-
-        # Use normal card order for all other cards
-        return self._CARD_ORDER[self.number]
+        return RANK_TABLE[muestra.id][self.id]
 
     def get_envido_value(self) -> int:
         """Get the value of this card for Envido calculation.
@@ -103,7 +148,8 @@ class Card:
         Returns:
             bool: True if this card is greater than the other card, False otherwise.
         """
-        return self.get_card_value(muestra) > other.get_card_value(muestra)
+        ranks = RANK_TABLE[muestra.id]
+        return ranks[self.id] > ranks[other.id]
 
     def __str__(self) -> str:
         """Return a string representation of the card.
@@ -123,6 +169,81 @@ class Card:
         """
         return self.__str__()
 
+    def __eq__(self, other: object) -> bool:
+        """Compare cards by value."""
+        if not isinstance(other, Card):
+            return NotImplemented
+        return self.id == other.id
+
     def __hash__(self) -> int:
         """Return hash of the card for use in sets and as dict keys."""
-        return hash((self.number, self.suit))
+        return self.id
+
+    def __setattr__(self, name: str, value: Any) -> NoReturn:  # noqa: ANN401
+        """Reject attribute writes; cards are immutable."""
+        msg = "Card is immutable"
+        raise AttributeError(msg)
+
+    def __delattr__(self, name: str) -> NoReturn:
+        """Reject attribute deletion; cards are immutable."""
+        msg = "Card is immutable"
+        raise AttributeError(msg)
+
+    def __reduce__(self) -> tuple[Any, tuple[int]]:
+        """Pickle (and copy) cards by id so unpickling returns the interned instance."""
+        return Card.from_id, (self.id,)
+
+
+_INTERNED: dict[tuple[int, str], Card] = {}
+
+
+def _intern_card(number: CardNumber, suit: CardSuit) -> Card:
+    """Create the single instance of a card and register it for interning."""
+    card = object.__new__(Card)
+    object.__setattr__(card, "number", number)
+    object.__setattr__(card, "suit", suit)
+    object.__setattr__(card, "id", card_id(number, suit))
+    _INTERNED[(number, suit)] = card
+    return card
+
+
+# All 40 cards ordered by id.
+ALL_CARDS: tuple[Card, ...] = tuple(
+    _intern_card(number, suit) for number in CardNumber.__args__ for suit in CardSuit.__args__
+)
+
+# RANK_TABLE[muestra_id][card_id] is the trick-taking value of a card under a given muestra.
+# The extra row NO_MUESTRA ranks cards for rules without a muestra.
+RANK_TABLE: tuple[tuple[int, ...], ...] = tuple(
+    tuple(card.compute_card_value(muestra) for card in ALL_CARDS) for muestra in (*ALL_CARDS, None)
+)
+
+
+def rank(card_id: int, muestra_id: int) -> int:
+    """Return the trick-taking value of a card under a muestra in O(1).
+
+    Args:
+        card_id: Id of the card being ranked.
+        muestra_id: Id of the muestra card of the round, or NO_MUESTRA.
+
+    Returns:
+        int: Same value as `Card.get_card_value`; higher beats lower.
+    """
+    return RANK_TABLE[muestra_id][card_id]
+
+
+def compare(card_id: int, other_id: int, muestra_id: int) -> int:
+    """Compare two cards under a muestra.
+
+    Args:
+        card_id: Id of the first card.
+        other_id: Id of the second card.
+        muestra_id: Id of the muestra card of the round.
+
+    Returns:
+        int: 1 if the first card wins, -1 if the second card wins, 0 on a tie.
+    """
+    ranks = RANK_TABLE[muestra_id]
+    a = ranks[card_id]
+    b = ranks[other_id]
+    return (a > b) - (a < b)
@@ -0,0 +1,41 @@
+"""40-bit card sets packed into a Python int.
+
+Bit `card.id` is set when the card belongs to the set, so unions, intersections,
+differences and membership tests are single integer operations.
+"""
+
+from collections.abc import Iterable
+
+from models.card import ALL_CARDS, Card
+from schemas.constants import CARD_COUNT
+
+CardSet = int
+
+EMPTY_SET: CardSet = 0
+FULL_DECK: CardSet = (1 << CARD_COUNT) - 1
+
+# CARD_BITS[card_id] is the single-card set for that id.
+CARD_BITS: tuple[CardSet, ...] = tuple(1 << card_id for card_id in range(CARD_COUNT))
+
+
+def card_set(cards: Iterable[Card]) -> CardSet:
+    """Build the set containing the given cards."""
+    mask = EMPTY_SET
+    for card in cards:
+        mask |= CARD_BITS[card.id]
+    return mask
+
+
+def card_ids_of(mask: CardSet) -> list[int]:
+    """Return the ids in a set, in ascending order."""
+    ids: list[int] = []
+    while mask:
+        low = mask & -mask
+        ids.append(low.bit_length() - 1)
+        mask ^= low
+    return ids
+
+
+def cards_of(mask: CardSet) -> list[Card]:
+    """Return the cards in a set, ordered by id."""
+    return [ALL_CARDS[card_id] for card_id in card_ids_of(mask)]
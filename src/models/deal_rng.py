@@ -0,0 +1,120 @@
+"""Counter-based random streams that make every deal reproducible from its index.
+
+A `DealRng` is keyed by `(seed, stream)` and positions NumPy's Philox generator by
+counter, so the draws of round `i` are a pure function of `(seed, stream, i)`. Any
+round can be regenerated on its own, in any process, without replaying the rounds
+before it; workers sharding a simulation only need the seed and their round indices
+(or a `stream` each) to stay deterministic.
+"""
+
+import numpy as np
+
+from schemas.constants import CARD_COUNT
+
+# Draws reserved for each round: enough to deal the whole deck.
+DRAWS_PER_ROUND = CARD_COUNT
+# Philox outputs four 64-bit words per counter increment.
+_WORDS_PER_COUNTER = 4
+# Rounds of draws generated per refill, amortising the generator repositioning.
+_PREFETCH_ROUNDS = 64
+_WORD_MASK = (1 << 64) - 1
+# Scale turning the top 53 bits of a word into a float in [0, 1).
+_UNIT = 2.0**-53
+
+
+class DealRng:
+    """Random source for `Deck` whose draws are addressed by round index.
+
+    Round `i` draws from the words `[i * DRAWS_PER_ROUND, (i + 1) * DRAWS_PER_ROUND)`
+    of the Philox stream. Call `start_round(i)` before dealing round `i`; without it
+    draws simply continue through the stream.
+
+    Attributes:
+        seed: First word of the Philox key.
+        stream: Second word of the Philox key, selecting an independent stream.
+    """
+
+    __slots__ = ("_bit_generator", "_block_start", "_draws", "_position", "seed", "stream")
+
+    def __init__(self, seed: int, stream: int = 0) -> None:
+        """Create the stream for `(seed, stream)`.
+
+        Args:
+            seed: Non-negative seed of the simulation.
+            stream: Non-negative id of an independent stream, e.g. a worker or match.
+
+        Raises:
+            ValueError: If `seed` or `stream` is negative or does not fit in 64 bits.
+        """
+        if not (0 <= seed <= _WORD_MASK and 0 <= stream <= _WORD_MASK):
+            msg = f"seed and stream must be 64-bit non-negative integers, got {seed}, {stream}"
+            raise ValueError(msg)
+        self.seed = seed
+        self.stream = stream
+        self._bit_generator = np.random.Philox(key=[seed, stream])
+        self._draws: list[float] = []
+        self._block_start = 0
+        self._position = 0
+
+    def start_round(self, round_index: int) -> None:
+        """Position the stream at the draws reserved for round `round_index`."""
+        self._position = round_index * DRAWS_PER_ROUND
+
+    def generator(self, round_index: int) -> np.random.Generator:
+        """Return a fresh generator over round `round_index`'s slice of the stream.
+
+        Useful for per-round randomness beyond the deal, e.g. in a worker that only
+        knows the round index. Its first `DRAWS_PER_ROUND` words are the deal's.
+        """
+        bit_generator = np.random.Philox(key=[self.seed, self.stream])
+        bit_generator.state = self._state_at(round_index * DRAWS_PER_ROUND)
+        return np.random.Generator(bit_generator)
+
+    def copy(self) -> "DealRng":
+        """Return an independent stream at the same position, continuing with the same draws."""
+        rng = object.__new__(DealRng)
+        rng.seed = self.seed
+        rng.stream = self.stream
+        # `_fill` sets the full generator state before reading and replaces `_draws`
+        # rather than mutating it, so both can be shared instead of copied.
+        rng._bit_generator = self._bit_generator
+        rng._draws = self._draws
+        rng._block_start = self._block_start
+        rng._position = self._position
+        return rng
+
+    def randrange(self, stop: int) -> int:
+        """Return the next draw as an integer in `[0, stop)`."""
+        index = self._position - self._block_start
+        if not 0 <= index < len(self._draws):
+            self._fill()
+            index = self._position - self._block_start
+        self._position += 1
+        return int(self._draws[index] * stop)
+
+    def _fill(self) -> None:
+        """Generate the block of rounds holding the current position."""
+        block_size = _PREFETCH_ROUNDS * DRAWS_PER_ROUND
+        start = self._position - self._position % block_size
+        bit_generator = self._bit_generator
+        bit_generator.state = self._state_at(start)
+        words = bit_generator.random_raw(block_size)
+        self._draws = ((words >> 11) * _UNIT).tolist()
+        self._block_start = start
+
+    def _state_at(self, position: int) -> dict[str, object]:
+        """Return the Philox state whose next output is word `position` of the stream."""
+        counter = position // _WORDS_PER_COUNTER
+        return {
+            "bit_generator": "Philox",
+            "state": {
+                "counter": np.array(
+                    [counter & _WORD_MASK, counter >> 64 & _WORD_MASK, 0, 0], dtype=np.uint64
+                ),
+                "key": np.array([self.seed, self.stream], dtype=np.uint64),
+            },
+            "buffer": np.zeros(_WORDS_PER_COUNTER, dtype=np.uint64),
+            "buffer_pos": _WORDS_PER_COUNTER,
+            "has_uint32": 0,
+            "uinteger": 0,
+        }
@@ -0,0 +1,159 @@
+"""Dealers supplying each round's hands, and bulk pre-generated deal corpora.
+
+`Round` asks its dealer for the hands and muestra of every new round. `Deck` deals
+random hands; `CorpusDealer` replays a corpus of deals generated up front by
+`generate_deals`. A corpus is a uint8 array of shape `(rounds, players * 3 + 1)`:
+row `i` holds the card ids of seat 0's hand, seat 1's hand, ..., then the muestra.
+Written with `save_deals`, it can be memory-mapped by every worker with
+`load_deals`, so the same deals can be replayed across agents, sharded across
+processes by row ranges, and used for deterministic benchmarks.
+"""
+
+from pathlib import Path
+from typing import Protocol
+
+import numpy as np
+import numpy.typing as npt
+
+from logging_config import get_logger
+from models.card import ALL_CARDS, Card
+from schemas.constants import CARD_COUNT, CARDS_DEALT_PER_PLAYER
+
+logger = get_logger(__name__)
+
+Deals = npt.NDArray[np.uint8]
+
+# Rounds permuted per vectorized batch when generating a corpus.
+_GENERATE_BATCH = 1 << 16
+
+
+class Dealer(Protocol):
+    """Supplies the hands and muestra of each new round."""
+
+    def deal(self, num_players: int, *, with_muestra: bool) -> tuple[list[list[Card]], Card | None]:
+        """Deal a new round.
+
+        Args:
+            num_players: Number of hands to deal, one per seat in seat order.
+            with_muestra: Whether to also turn up a muestra.
+
+        Returns:
+            The hands by seat and the muestra, or None without one.
+        """
+        ...
+
+    def copy(self) -> "Dealer":
+        """Return an independent dealer that continues with the same deals."""
+        ...
+
+
+def generate_deals(num_rounds: int, num_players: int, seed: int) -> Deals:
+    """Generate a corpus of random deals with vectorized permutations.
+
+    Args:
+        num_rounds: Number of rounds (rows) to generate.
+        num_players: Number of hands dealt per round.
+        seed: Seed of the Philox generator drawing the permutations.
+
+    Returns:
+        Deals: A new array of shape `(num_rounds, num_players * 3 + 1)`.
+
+    Raises:
+        ValueError: If the deck cannot deal that many cards.
+    """
+    width = _deal_width(num_players)
+    rng = np.random.Generator(np.random.Philox(seed))
+    deals = np.empty((num_rounds, width), dtype=np.uint8)
+    for start in range(0, num_rounds, _GENERATE_BATCH):
+        stop = min(start + _GENERATE_BATCH, num_rounds)
+        decks = np.broadcast_to(np.arange(CARD_COUNT, dtype=np.uint8), (stop - start, CARD_COUNT))
+        deals[start:stop] = rng.permuted(decks, axis=1)[:, :width]
+    return deals
+
+
+def save_deals(path: Path, deals: Deals) -> Path:
+    """Write a corpus as an `.npy` file that workers can memory-map.
+
+    Args:
+        path: Destination file. Parent directories are created.
+        deals: Corpus made by `generate_deals`.
+
+    Returns:
+        Path: The written path.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    np.save(path, deals)
+    logger.info("Saved %d deals to %s", len(deals), path)
+    return path
+
+
+def load_deals(path: Path) -> Deals:
+    """Memory-map a corpus written by `save_deals`.
+
+    Args:
+        path: Source `.npy` file.
+
+    Returns:
+        Deals: A read-only memory-mapped array.
+
+    Raises:
+        ValueError: If the file does not hold a corpus of the expected layout.
+    """
+    deals = np.load(path, mmap_mode="r")
+    if (
+        deals.ndim != 2  # noqa: PLR2004
+        or deals.dtype != np.uint8
+        or (deals.shape[1] - 1) % CARDS_DEALT_PER_PLAYER
+    ):
+        msg = f"Unexpected deals in {path}: {deals.shape} {deals.dtype}"
+        raise ValueError(msg)
+    return deals
+
+
+class CorpusDealer:
+    """Dealer replaying the rows of a deal corpus in order.
+
+    Attributes:
+        deals: The corpus, possibly memory-mapped or a row slice of a larger one.
+        position: Index of the next row to deal.
+    """
+
+    __slots__ = ("deals", "position")
+
+    def __init__(self, deals: Deals, position: int = 0) -> None:
+        """Create a dealer over `deals`, starting at row `position`."""
+        self.deals = deals
+        self.position = position
+
+    def deal(self, num_players: int, *, with_muestra: bool) -> tuple[list[list[Card]], Card | None]:
+        """Deal the next row of the corpus.
+
+        Raises:
+            ValueError: If the corpus is exhausted or has rows for another table size.
+        """
+        if self.deals.shape[1] != _deal_width(num_players):
+            msg = f"Corpus rows of width {self.deals.shape[1]} cannot deal {num_players} hands"
+            raise ValueError(msg)
+        if self.position >= len(self.deals):
+            msg = f"Deal corpus exhausted after {len(self.deals)} rounds"
+            raise ValueError(msg)
+        row = self.deals[self.position].tolist()
+        self.position += 1
+        hands = [
+            [ALL_CARDS[card_id] for card_id in row[start : start + CARDS_DEALT_PER_PLAYER]]
+            for start in range(0, num_players * CARDS_DEALT_PER_PLAYER, CARDS_DEALT_PER_PLAYER)
+        ]
+        return hands, ALL_CARDS[row[-1]] if with_muestra else None
+
+    def copy(self) -> "CorpusDealer":
+        """Return a dealer over the same corpus at the same position."""
+        return CorpusDealer(self.deals, self.position)
+
+
+def _deal_width(num_players: int) -> int:
+    """Return the number of cards dealt to `num_players` plus the muestra."""
+    width = num_players * CARDS_DEALT_PER_PLAYER + 1
+    if num_players < 1 or width > CARD_COUNT:
+        msg = f"Cannot deal {num_players} hands from a deck of {CARD_COUNT}"
+        raise ValueError(msg)
+    return width
@@ -1,29 +1,102 @@
 import random
+from typing import Protocol
 
-from models.card import Card
-from schemas.constants import CardNumber, CardSuit
+from models.card import ALL_CARDS, Card
+from schemas.constants import CARD_COUNT, CARDS_DEALT_PER_PLAYER
+
+_CARD_IDS = tuple(range(CARD_COUNT))
+
+
+class RandomSource(Protocol):
+    """Source of the deck's draws, such as `random.Random` or `DealRng`.
+
+    Sources that also have a `copy()` method returning an independent source at the
+    same position, like `DealRng`, let copies of the deck keep dealing.
+    """
+
+    def randrange(self, stop: int, /) -> int:
+        """Return a random integer in `[0, stop)`."""
+        ...
 
 
 class Deck:
     """Represents a deck of cards for the card game.
 
+    The deck is a preallocated array of card ids. Drawing performs a partial
+    Fisher-Yates shuffle: each drawn card is swapped to the end of the live
+    region, so drawing costs O(1) per card and nothing is reallocated.
+
     Attributes:
-        cards (List[Card]): The cards in the deck.
+        cards (List[Card]): The cards still in the deck.
     """
 
-    def __init__(self) -> None:
-        """Initialize a deck with all possible cards."""
-        self.cards: list[Card] = [
-            Card(number, suit) for number in CardNumber.__args__ for suit in CardSuit.__args__
-        ]
+    def __init__(self, rng: RandomSource | None = None) -> None:
+        """Initialize a deck with all possible cards.
+
+        Args:
+            rng: Random source used to draw cards. Defaults to the global `random`
+                module; pass a seeded generator or a `DealRng` for reproducible deals.
+        """
+        self._card_ids: list[int] = list(_CARD_IDS)
+        self._remaining = CARD_COUNT
+        self._rng = rng
+        self._randrange = random.randrange if rng is None else rng.randrange
+
+    @property
+    def cards(self) -> list[Card]:
+        """Return the cards still in the deck."""
+        return [ALL_CARDS[card_id] for card_id in self._card_ids[: self._remaining]]
+
+    def __len__(self) -> int:
+        """Return the number of cards still in the deck."""
+        return self._remaining
 
     def __str__(self) -> str:
         """Return a string representation of the deck."""
-        return f"Deck of {len(self.cards)} cards"
+        return f"Deck of {self._remaining} cards"
 
     def __repr__(self) -> str:
         """Return a string representation of the deck for debugging."""
-        return f"Deck of {len(self.cards)} cards"
+        return f"Deck of {self._remaining} cards"
+
+    def reset(self) -> None:
+        """Return all drawn cards to the deck so it can be reused for another round.
+
+        The cards are put back in id order, so a generator seeded before the deal
+        reproduces the same deal regardless of earlier rounds.
+        """
+        self._card_ids[:] = _CARD_IDS
+        self._remaining = CARD_COUNT
+
+    def copy(self) -> "Deck":
+        """Return an independent deck holding the same remaining cards.
+
+        The copy draws from its own copy of the random source, so its deals never
+        advance this deck's stream. Sources without a `copy()` method (including the
+        global `random` module) cannot be copied cheaply, so such a copy raises
+        ValueError when it draws.
+        """
+        deck = object.__new__(Deck)
+        deck._card_ids = self._card_ids.copy()
+        deck._remaining = self._remaining
+        copy_rng = getattr(self._rng, "copy", None)
+        deck._rng = copy_rng() if copy_rng is not None else None
+        deck._randrange = _uncopied_randrange if deck._rng is None else deck._rng.randrange
+        return deck
+
+    def deal(self, num_players: int, *, with_muestra: bool) -> tuple[list[list[Card]], Card | None]:
+        """Return all cards to the deck and deal a new round from it.
+
+        Args:
+            num_players: Number of hands to deal, one per seat in seat order.
+            with_muestra: Whether to also turn up a muestra.
+
+        Returns:
+            The hands by seat and the muestra, or None without one.
+        """
+        self.reset()
+        hands = [self.draw(CARDS_DEALT_PER_PLAYER) for _ in range(num_players)]
+        return hands, self.draw(1)[0] if with_muestra else None
 
     def draw(self, n: int) -> list[Card]:
         """Draw n random cards from the deck.
@@ -37,7 +110,22 @@ class Deck:
         Raises:
             ValueError: If trying to draw more cards than available in the deck.
         """
-        drawn_cards = random.sample(self.cards, n)
-        for card in drawn_cards:
-            self.cards.remove(card)
+        if n < 0 or n > self._remaining:
+            msg = f"Cannot draw {n} cards from a deck of {self._remaining}"
+            raise ValueError(msg)
+
+        card_ids = self._card_ids
+        drawn_cards: list[Card] = []
+        for _ in range(n):
+            swap = self._randrange(self._remaining)
+            self._remaining -= 1
+            last = self._remaining
+            card_ids[swap], card_ids[last] = card_ids[last], card_ids[swap]
+            drawn_cards.append(ALL_CARDS[card_ids[last]])
         return drawn_cards
+
+
+def _uncopied_randrange(_: int) -> int:
+    """Refuse to draw for a copied deck whose random source could not be copied."""
+    msg = "A copied deck cannot draw without its own random source; deal with a DealRng"
+    raise ValueError(msg)
@@ -0,0 +1,124 @@
+"""Reference Envido and Flor rules for a hand under a muestra.
+
+These are the plain-Python definitions of the rules. Hot paths read the
+precomputed tables in `models.hand_tables` or use the vectorized versions in
+`models.batch_eval`, both of which are tested against these functions.
+"""
+
+from models.card import Card
+from schemas.constants import REY
+
+# Pieza values for Envido
+PIEZA_ENVIDO_VALUES = {2: 30, 4: 29, 5: 28, 11: 27, 10: 27}
+
+
+def has_flor(cards: list[Card], muestra: Card | None) -> bool:
+    """Check if a list of cards constitutes a Flor.
+
+    A Flor is:
+    - Three cards from the same suit.
+    - One pieza and the other two from the same suit.
+    - Two or more piezas.
+
+    Args:
+        cards: The list of cards to check (usually 3).
+        muestra: The muestra card that determines the piezas, or None for no piezas.
+
+    Returns:
+        bool: True if it's a Flor, False otherwise.
+    """
+    if len(cards) != 3:
+        return False
+
+    piezas = [c for c in cards if c.is_pieza(muestra)]
+    non_piezas = [c for c in cards if not c.is_pieza(muestra)]
+
+    # Two or more piezas
+    if len(piezas) >= 2:
+        return True
+
+    # One pieza and the other two from the same suit
+    if len(piezas) == 1:
+        return non_piezas[0].suit == non_piezas[1].suit
+
+    # Zero piezas and all three from the same suit
+    return cards[0].suit == cards[1].suit == cards[2].suit
+
+
+def calculate_envido(cards: list[Card], muestra: Card | None) -> int:
+    """Calculate the Envido value for a hand of cards.
+
+    Args:
+        cards: The list of cards to calculate Envido for.
+        muestra: The muestra card that determines the piezas, or None for no piezas.
+
+    Returns:
+        int: The Envido value.
+    """
+    if not cards:
+        return 0
+
+    piezas = [c for c in cards if c.is_pieza(muestra)]
+
+    if piezas:
+        # Case A: Hand Contains a Pieza
+        # Take the highest pieza value
+        highest_pieza_val = 0
+        for p in piezas:
+            # If it's a 12 (Rey), it takes the value of the pieza it's replacing
+            p_num = p.number if p.number != REY else muestra.number
+            highest_pieza_val = max(highest_pieza_val, PIEZA_ENVIDO_VALUES[p_num])
+
+        # Add the highest Envido-value card among the remaining two cards
+        # We need to be careful: if we have multiple piezas, the "remaining" cards
+        # are the ones not used for the 'highest_pieza_val'.
+        # Wait, the rule says "Take the highest pieza value.
+        # Add the highest Envido-value card among the remaining two cards."
+        # This implies if you have 2 piezas, you take the best one,
+        # and then look at the other 2 cards (one of which is ALSO a pieza)
+        # and take the best Envido value from them.
+
+        # Find the card that gave the highest_pieza_val
+        best_pieza = None
+        for p in piezas:
+            p_num = p.number if p.number != REY else muestra.number
+            if PIEZA_ENVIDO_VALUES[p_num] == highest_pieza_val:
+                best_pieza = p
+                break
+
+        remaining_cards = list(cards)
+        remaining_cards.remove(best_pieza)
+
+        # For the remaining cards, we need their Envido value.
+        # Normal cards use get_envido_value().
+        # Piezas use their pieza_envido_values.
+        # If the remaining is another pieza, does it count as 30/29/etc
+        # or as facial? Usually it's the facial value for the second card.
+        # Let's check Example 2 again. 4 (pieza) is 29. 6 is 6. 29+6=35.
+        # If I had two piezas, say 2 and 4. 2 is 30. 4 is 29.
+        # Usually the second card is its facial value if not used as base.
+
+        max_remaining_val = max(c.get_envido_value() for c in remaining_cards)
+        return highest_pieza_val + max_remaining_val
+
+    # Cases B & C: No Piezas
+    # Group by suit
+    suit_groups: dict[str, list[Card]] = {}
+    for c in cards:
+        suit_groups.setdefault(c.suit, []).append(c)
+
+    max_envido = 0
+    for suit_cards in suit_groups.values():
+        if len(suit_cards) >= 2:
+            # Case C: No Pieza, Two (or three) Cards of the Same Suit
+            # Take the two highest Envido-value cards of the same suit. Add 20 bonus points.
+            vals = sorted([c.get_envido_value() for c in suit_cards], reverse=True)
+            envido_val = vals[0] + vals[1] + 20
+            max_envido = max(max_envido, envido_val)
+        else:
+            # Case B: No Pieza, All Cards Different Suits (or just this one)
+            # Envido = highest single card value.
+            envido_val = suit_cards[0].get_envido_value()
+            max_envido = max(max_envido, envido_val)
+
+    return max_envido
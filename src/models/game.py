@@ -1,8 +1,14 @@
+import logging
 from typing import Protocol, runtime_checkable
 
 from logging_config import get_logger
+from models.deal_rng import DealRng
+from models.dealer import Dealer
+from models.deck import Deck
 from models.player import Player
 from models.round import Round
+from models.rules import RulesVariant, get_rules
+from models.seats import SeatTopology
 from schemas.actions import ActionProvider
 
 logger = get_logger(__name__)
@@ -25,9 +31,16 @@ class Game:
         team1: The players on the first team.
         team2: The players on the second team.
         ordered_players: Interleaved turn order (T1P1, T2P1, ...).
+        seats: Seat topology of the table, shared by every round of the game.
         team1_score: Current game score for Team 1.
         team2_score: Current game score for Team 2.
         show_teammate_cards: Whether players can see teammate's hands.
+        rules: The compiled rules variant every round is played with.
+        validate_states: Whether providers receive validated `PlayerState` snapshots.
+        deal_rng: Counter-based stream the deals are drawn from, or None for `random`.
+        dealer: Dealer of every round, or None to deal from a `Deck`.
+        auto_forced_actions: Whether rounds apply single-option decisions themselves.
+        rounds_played: Number of rounds played so far, the index of the next deal.
     """
 
     def __init__(
@@ -37,6 +50,11 @@ class Game:
         action_provider: ActionProvider,
         *,
         show_teammate_cards: bool = False,
+        rules: RulesVariant | None = None,
+        validate_states: bool = False,
+        deal_rng: DealRng | None = None,
+        dealer: Dealer | None = None,
+        auto_forced_actions: bool = False,
     ) -> None:
         """Initialize the game with two teams and an action provider.
 
@@ -45,6 +63,15 @@ class Game:
             team2: List of players on the second team.
             action_provider: Callback used by rounds to obtain player actions.
             show_teammate_cards: Whether players can see their teammate's cards.
+            rules: Rules variant to play with. Defaults to classic Uruguayan rules.
+            validate_states: Pass providers validated `PlayerState` snapshots instead of
+                live `PlayerView`s.
+            deal_rng: Deal round `i` of the game from round `i` of this stream, making
+                every deal reproducible from its index.
+            dealer: Dealer of every round, e.g. a `CorpusDealer` replaying stored
+                deals. Defaults to a `Deck`, drawing from `deal_rng` when given.
+            auto_forced_actions: Apply decisions with a single legal action without
+                asking the provider. See `Round`.
 
         Raises:
             ValueError: If the team structure is invalid.
@@ -60,6 +87,12 @@ class Game:
         self.team2 = team2
         self._action_provider = action_provider
         self.show_teammate_cards = show_teammate_cards
+        self.rules = rules or get_rules()
+        self.validate_states = validate_states
+        self.auto_forced_actions = auto_forced_actions
+        self.deal_rng = deal_rng
+        self.dealer = dealer if dealer is not None or deal_rng is None else Deck(deal_rng)
+        self.rounds_played = 0
 
         # Flatten players into interleaved order: T1P1, T2P1, T1P2, T2P2...
         self.ordered_players: list[Player] = []
@@ -67,34 +100,57 @@ class Game:
             self.ordered_players.append(team1[i])
             self.ordered_players.append(team2[i])
 
+        self.seats = SeatTopology(team1, team2, self.ordered_players)
+
         self.team1_score = 0
         self.team2_score = 0
         self._next_round_starter_index = 0
 
+        # Created on the first round and reset in place for every later one.
+        self._round: Round | None = None
+        # Detect once whether the provider wants the live Round for richer observations.
+        self._set_round = (
+            action_provider.set_round if isinstance(action_provider, SupportsSetRound) else None
+        )
+
     def play_round(self) -> None:
         """Play a round and update team scores accordingly.
 
-        Rotates the starting player each round based on the interleaved order.
+        Rotates the starting player each round based on the interleaved order. The same
+        `Round` object is reset and replayed for every round of the game.
         """
         # Determine the starting player from the ordered list
         starting_player = self.ordered_players[self._next_round_starter_index]
-
-        game_round = Round(
-            team1=self.team1,
-            team2=self.team2,
-            ordered_players=self.ordered_players,
-            action_provider=self._action_provider,
-            starting_player=starting_player,
-            show_teammate_cards=self.show_teammate_cards,
-        )
-        # If the action provider supports richer observations via `set_round`,
-        # attach the live round so agents see muestra and truco state like in training.
-        if isinstance(self._action_provider, SupportsSetRound):
-            self._action_provider.set_round(game_round)
+        if self.deal_rng is not None:
+            self.deal_rng.start_round(self.rounds_played)
+
+        game_round = self._round
+        if game_round is None:
+            game_round = Round(
+                team1=self.team1,
+                team2=self.team2,
+                ordered_players=self.ordered_players,
+                action_provider=self._action_provider,
+                starting_player=starting_player,
+                show_teammate_cards=self.show_teammate_cards,
+                rules=self.rules,
+                seats=self.seats,
+                validate_states=self.validate_states,
+                dealer=self.dealer,
+                auto_forced_actions=self.auto_forced_actions,
+            )
+            self._round = game_round
+            # If the action provider supports richer observations via `set_round`,
+            # attach the live round so agents see muestra and truco state like in training.
+            if self._set_round is not None:
+                self._set_round(game_round)
+        else:
+            game_round.reset(starting_player)
 
         team_1_points, team_2_points = game_round.play_round()
         self.team1_score += team_1_points
         self.team2_score += team_2_points
+        self.rounds_played += 1
 
         # Rotate starter for the next round
         self._next_round_starter_index = (self._next_round_starter_index + 1) % len(
@@ -115,9 +171,10 @@ class Game:
             round_count += 1
             self.play_round()
 
-            logger.info("Round %s completed", round_count)
-            logger.info("Team 1 score: %s", self.team1_score)
-            logger.info("Team 2 score: %s", self.team2_score)
-            logger.info("--------------------------------")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Round %s completed", round_count)
+                logger.info("Team 1 score: %s", self.team1_score)
+                logger.info("Team 2 score: %s", self.team2_score)
+                logger.info("--------------------------------")
 
         return 1 if self.team1_score >= target_points else 2
@@ -0,0 +1,150 @@
+"""Precomputed Envido and Flor tables for every (muestra, 3-card hand) pair.
+
+A hand is indexed with the combinatorial number system over its sorted card ids
+`a < b < c`: `C(a, 1) + C(b, 2) + C(c, 3)`, a dense index in `[0, C(40, 3))`.
+Both tables live in one uint8 array of shape `(2, CARD_COUNT, HAND_COUNT)`:
+`tables[ENVIDO, muestra_id, hand]` is the Envido value and
+`tables[FLOR, muestra_id, hand]` is 1 when the hand is a Flor.
+"""
+
+import math
+import os
+from collections.abc import Sequence
+from functools import cache
+from pathlib import Path
+
+import numpy as np
+import numpy.typing as npt
+
+from logging_config import get_logger
+from models.batch_eval import batch_envido, batch_flor, rules_digest
+from schemas.constants import (
+    CARD_COUNT,
+    CARDS_DEALT_PER_PLAYER,
+    DEFAULT_HAND_TABLES_DIR,
+    HAND_TABLES_DIR_ENV,
+)
+
+logger = get_logger(__name__)
+
+HandTables = npt.NDArray[np.uint8]
+
+HAND_COUNT = math.comb(CARD_COUNT, CARDS_DEALT_PER_PLAYER)
+ENVIDO = 0
+FLOR = 1
+
+_COMB2: tuple[int, ...] = tuple(math.comb(i, 2) for i in range(CARD_COUNT))
+_COMB3: tuple[int, ...] = tuple(math.comb(i, 3) for i in range(CARD_COUNT))
+
+
+def hand_index(a: int, b: int, c: int) -> int:
+    """Return the dense table index of the hand made of three card ids, in any order."""
+    if a > b:
+        a, b = b, a
+    if b > c:
+        b, c = c, b
+    if a > b:
+        a, b = b, a
+    return a + _COMB2[b] + _COMB3[c]
+
+
+def all_hands() -> npt.NDArray[np.intp]:
+    """Return every 3-card hand as sorted card ids, row `i` being the hand with index `i`."""
+    return np.array(
+        [(a, b, c) for c in range(2, CARD_COUNT) for b in range(1, c) for a in range(b)],
+        dtype=np.intp,
+    )
+
+
+def build_hand_tables(muestra_ids: Sequence[int] = range(CARD_COUNT)) -> HandTables:
+    """Compute the Envido and Flor tables for every hand under the given muestras.
+
+    Args:
+        muestra_ids: Muestra ids (or NO_MUESTRA) giving the rows of the tables, in order.
+
+    Returns:
+        HandTables: A new array of shape `(2, len(muestra_ids), HAND_COUNT)`.
+    """
+    rows = len(muestra_ids)
+    hands = np.broadcast_to(all_hands(), (rows, HAND_COUNT, CARDS_DEALT_PER_PLAYER))
+    muestras = np.broadcast_to(np.asarray(muestra_ids)[:, np.newaxis], (rows, HAND_COUNT))
+    return np.stack([batch_envido(hands, muestras), batch_flor(hands, muestras)]).astype(np.uint8)
+
+
+def hand_tables_path() -> Path:
+    """Return where the process-wide tables are saved.
+
+    The directory is `$TRUCO_HAND_TABLES_DIR` when set, else the user cache. The file
+    name carries `rules_digest()`, so tables built under other rules are never loaded.
+    """
+    directory = os.environ.get(HAND_TABLES_DIR_ENV) or DEFAULT_HAND_TABLES_DIR
+    return Path(directory) / f"hand_tables_{rules_digest()}.npy"
+
+
+def save_hand_tables(path: Path, tables: HandTables | None = None) -> Path:
+    """Write the tables as an `.npy` file that workers can memory-map.
+
+    Args:
+        path: Destination file. Parent directories are created.
+        tables: Tables to write; built from the reference rules when omitted.
+
+    Returns:
+        Path: The written path.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write beside the target and rename, so concurrent readers never map a partial file.
+    partial = path.with_name(f"{path.name}.{os.getpid()}.partial")
+    with partial.open("wb") as file:
+        np.save(file, build_hand_tables() if tables is None else tables)
+    partial.replace(path)
+    logger.info("Saved hand tables to %s", path)
+    return path
+
+
+def load_hand_tables(path: Path) -> HandTables:
+    """Memory-map tables written by `save_hand_tables`.
+
+    Args:
+        path: Source `.npy` file.
+
+    Returns:
+        HandTables: A read-only memory-mapped array.
+
+    Raises:
+        ValueError: If the file does not hold tables of the expected shape and dtype.
+    """
+    tables = np.load(path, mmap_mode="r")
+    if tables.shape != (2, CARD_COUNT, HAND_COUNT) or tables.dtype != np.uint8:
+        msg = f"Unexpected hand tables in {path}: {tables.shape} {tables.dtype}"
+        raise ValueError(msg)
+    return tables
+
+
+@cache
+def get_hand_tables() -> HandTables:
+    """Return the process-wide tables, memory-mapped from `hand_tables_path()`.
+
+    The first call without a saved copy builds the tables and saves them there, so
+    later processes map the file instead of rebuilding. If the file cannot be written,
+    the freshly built tables are used in memory.
+    """
+    path = hand_tables_path()
+    if path.exists():
+        return load_hand_tables(path)
+    tables = build_hand_tables()
+    try:
+        save_hand_tables(path, tables)
+    except OSError as error:
+        logger.warning("Could not save hand tables to %s: %s", path, error)
+        return tables
+    return load_hand_tables(path)
+
+
+def hand_envido(a: int, b: int, c: int, muestra_id: int) -> int:
+    """Return the Envido value of a 3-card hand (card ids in any order) in O(1)."""
+    return int(get_hand_tables()[ENVIDO, muestra_id, hand_index(a, b, c)])
+
+
+def hand_has_flor(a: int, b: int, c: int, muestra_id: int) -> bool:
+    """Return whether a 3-card hand (card ids in any order) is a Flor in O(1)."""
+    return bool(get_hand_tables()[FLOR, muestra_id, hand_index(a, b, c)])
@@ -1,4 +1,5 @@
 from models.card import Card
+from models.card_set import CARD_BITS, EMPTY_SET, CardSet, card_set
 
 
 class Player:
@@ -7,6 +8,9 @@ class Player:
     Attributes:
         name (str): The name of the player.
         cards (List[Card]): The cards in the player's hand.
+        played_cards (List[Card]): The cards played since the hand was received.
+        hand_mask (CardSet): Bitmask of `cards`, kept in sync with the list.
+        played_mask (CardSet): Bitmask of `played_cards`, kept in sync with the list.
     """
 
     def __init__(self, name: str) -> None:
@@ -16,8 +20,30 @@ class Player:
             name (str): The name of the player.
         """
         self.name = name
-        self.cards: list[Card] = []
+        self._cards: list[Card] = []
+        self.hand_mask: CardSet = EMPTY_SET
         self.played_cards: list[Card] = []
+        self.played_mask: CardSet = EMPTY_SET
+
+    @property
+    def cards(self) -> list[Card]:
+        """The cards in the player's hand."""
+        return self._cards
+
+    @cards.setter
+    def cards(self, cards: list[Card]) -> None:
+        self._cards = cards
+        self.hand_mask = card_set(cards)
+
+    def receive_hand(self, cards: list[Card]) -> None:
+        """Take a freshly dealt hand and forget the cards played in the previous round.
+
+        Args:
+            cards (list[Card]): The dealt cards.
+        """
+        self.cards = cards
+        self.played_cards = []
+        self.played_mask = EMPTY_SET
 
     def play_card(self, card_index: int) -> Card:
         """Play a card from the player's hand.
@@ -28,16 +54,51 @@ class Player:
         Raises:
             ValueError: If the card index is invalid or there are no cards.
         """
-        if not self.cards:
+        if not self._cards:
             msg = "No cards in hand"
             raise ValueError(msg)
-        if card_index < 0 or card_index >= len(self.cards):
+        if card_index < 0 or card_index >= len(self._cards):
             msg = "Invalid card index"
             raise ValueError(msg)
-        card = self.cards.pop(card_index)
+        card = self._cards.pop(card_index)
+        bit = CARD_BITS[card.id]
+        self.hand_mask &= ~bit
         self.played_cards.append(card)
+        self.played_mask |= bit
         return card
 
+    def unplay_card(self, card_index: int) -> Card:
+        """Take back the last played card, undoing `play_card(card_index)`.
+
+        Args:
+            card_index (int): The hand index the card was played from.
+
+        Raises:
+            ValueError: If no card has been played.
+        """
+        if not self.played_cards:
+            msg = "No played cards to take back"
+            raise ValueError(msg)
+        card = self.played_cards.pop()
+        bit = CARD_BITS[card.id]
+        self.played_mask &= ~bit
+        self._cards.insert(card_index, card)
+        self.hand_mask |= bit
+        return card
+
+    def clone(self) -> "Player":
+        """Return a copy of the player with its own hand and play history.
+
+        Cards are shared; only the two lists are copied.
+        """
+        clone = object.__new__(Player)
+        clone.name = self.name
+        clone._cards = self._cards.copy()
+        clone.hand_mask = self.hand_mask
+        clone.played_cards = self.played_cards.copy()
+        clone.played_mask = self.played_mask
+        return clone
+
     def __str__(self) -> str:
         """Return a string representation of the player.
 
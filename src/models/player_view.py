@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from schemas.player_state import PlayerState
+
+if TYPE_CHECKING:
+    from models.card import Card
+    from models.player import Player
+    from models.round import Round
+    from schemas.round_state import LiveRoundState
+
+
+class PlayerView:
+    """Read-only view of a round from one player's perspective.
+
+    The view references the round's live data instead of copying it, and computes
+    each field only when it is read, so handing one to an action provider costs
+    nothing. Views are created once per seat and stay valid for the whole round;
+    use `to_state` to take a validated `PlayerState` snapshot.
+
+    Attributes:
+        player: The player whose perspective the view takes.
+    """
+
+    __slots__ = ("_round", "player")
+
+    def __init__(self, round_obj: Round, player: Player) -> None:
+        """Create a view of `round_obj` for `player`.
+
+        Args:
+            round_obj: The round being observed.
+            player: The observing player.
+        """
+        self._round = round_obj
+        self.player = player
+
+    @property
+    def round_state(self) -> LiveRoundState:
+        """The live state of the round."""
+        return self._round.round_state
+
+    @property
+    def player_cards(self) -> list[Card]:
+        """The cards currently in the player's hand."""
+        return self.player.cards
+
+    @property
+    def teammate_cards(self) -> list[Card] | None:
+        """The cards of the player's teammates, or None if they are hidden."""
+        round_obj = self._round
+        if not round_obj.show_teammate_cards:
+            return None
+        seats = round_obj.seats
+        players = seats.players
+        return [
+            card
+            for seat in seats.teammates[seats.seat_of[self.player]]
+            for card in players[seat].cards
+        ]
+
+    def to_state(self) -> PlayerState:
+        """Return a validated `PlayerState` snapshot of the view."""
+        return PlayerState(
+            round_state=self.round_state.snapshot(),
+            player_cards=self.player_cards,
+            teammate_cards=self.teammate_cards,
+        )
@@ -1,21 +1,96 @@
+import logging
+import struct
+from collections.abc import Generator, Sequence
+from typing import cast
+
+import numpy as np
+import numpy.typing as npt
+
 from exceptions.truco_rejected import TrucoRejectedError
 from logging_config import get_logger
-from models.card import Card
+from models.card import ALL_CARDS, Card
+from models.card_set import CARD_BITS, EMPTY_SET, FULL_DECK, CardSet
+from models.dealer import CorpusDealer, Dealer
 from models.deck import Deck
+from models.envido import calculate_envido, has_flor
 from models.player import Player
+from models.player_view import PlayerView
+from models.rules import RulesVariant, get_rules
+from models.seats import NO_SEAT, NO_TEAM, SeatTopology
 from schemas.actions import (
+    ACTION_BITS,
+    PLAY_CARD_MASKS,
     ActionCode,
     ActionProvider,
+    ForcedActionObserver,
+    MaskedActionProvider,
+    actions_from_mask,
     card_index_from_code,
+    mask_to_vector,
+)
+from schemas.constants import CARD_COUNT, CARDS_DEALT_PER_PLAYER, RulesName
+from schemas.player_state import PlayerState, SupportsPlayerState
+from schemas.round_state import (
+    ENVIDO_ENVIDO,
+    ENVIDO_NADA,
+    ENVIDO_NO_QUIERO,
+    ENVIDO_QUERIDO,
+    ENVIDO_STATES,
+    TRUCO_RETRUCO,
+    TRUCO_STATE,
+    TRUCO_STATES,
+    TRUCO_VALE4,
+    LiveRoundState,
 )
-from schemas.constants import CARDS_DEALT_PER_PLAYER, REY
-from schemas.player_state import PlayerState
-from schemas.round_state import TRUCO_STATE, RoundProgress, RoundState
 
 logger = get_logger(__name__)
 
 HANDS_TO_WIN_ROUND = CARDS_DEALT_PER_PLAYER // 2 + 1
 
+# Marks an empty slot of `Round.trick_plays`.
+NO_CARD = -1
+
+_OFFER_TRUCO_BIT = ACTION_BITS[ActionCode.OFFER_TRUCO]
+_FLOR_BIT = ACTION_BITS[ActionCode.FLOR]
+_OFFER_ENVIDO_BIT = ACTION_BITS[ActionCode.OFFER_ENVIDO]
+_TRUCO_RESPONSE_MASK = ACTION_BITS[ActionCode.ACCEPT_TRUCO] | ACTION_BITS[ActionCode.REJECT_TRUCO]
+_ENVIDO_RESPONSE_MASK = (
+    ACTION_BITS[ActionCode.ACCEPT_ENVIDO] | ACTION_BITS[ActionCode.REJECT_ENVIDO] | _FLOR_BIT
+)
+
+# What `Round.undo` restores: the step state, the bid state, the hand index of a
+# played card (-1 if none) and the player's previously played card.
+_UndoRecord = tuple[
+    tuple[int, int, int, int, int, int, int, int, bool, int, int, tuple[int, int], int],
+    tuple[int, int, Player | None, Player | None, int, int, int],
+    int,
+    Card | None,
+]
+
+# Binary snapshot format of `Round.to_bytes`, bumped on any layout change. The fixed
+# header is followed by each seat's dealt hand, the card of each trick play and the
+# seats that called Flor, one byte each; `_SNAPSHOT_NONE` stands for no card or seat.
+SNAPSHOT_VERSION = 1
+_SNAPSHOT_HEADER = struct.Struct(
+    "<B"  # version
+    "BBBB"  # seats, rules variant, muestra id, starting seat
+    "BBBB"  # truco code, envido code, envido bidder seat, last truco bidder seat
+    "BB"  # envido points of team 1 and team 2
+    "BBBBBB"  # phase, actor, turn seat, trick, trick starter, trick position
+    "bB?"  # best rank, best seat, trick tied
+    "BBB"  # trick winner seats
+    "BBBB"  # tricks won by team, round wins by team
+    "B"  # number of Flor calls
+)
+_SNAPSHOT_NONE = 0xFF
+_RULES_NAMES: tuple[RulesName, ...] = RulesName.__args__
+
+# Kind of decision the round is waiting for; see `Round.phase`.
+PHASE_PLAY = 0
+PHASE_TRUCO_RESPONSE = 1
+PHASE_ENVIDO_RESPONSE = 2
+PHASE_DONE = 3
+
 
 class Round:
     """Represents a round in the card game, which is the play between dealing cards.
@@ -24,9 +99,27 @@ class Round:
         team1 (list[Player]): The players on team 1.
         team2 (list[Player]): The players on team 2.
         ordered_players (list[Player]): The interleaved order of players (A1, B1, A2, B2...).
-        deck (Deck): The deck of cards for the round.
-        muestra (Card | None): The card shown after dealing that determines the trump suit.
+        dealer (Dealer): Supplies the hands and muestra of every deal, a `Deck` by default.
+        muestra (Card | None): The card shown after dealing that determines the trump suit,
+            or None when the rules variant plays without muestra.
+        seats (SeatTopology): Seat indices, teams, trick orders and pies of the table.
+        rules (RulesVariant): The compiled ruleset used to rank cards and score Envido/Flor.
+        round_state (LiveRoundState): Mutable bidding and play state; export it with
+            `round_state.snapshot()`.
+        played_mask (CardSet): Bitmask of every card played so far this round.
+        trick_plays (list[int]): Id of the card played by each seat in each trick, at
+            `trick * len(seats) + seat`, or NO_CARD. Allocated once per round.
+        hand_envido (tuple[int, ...]): Envido value of each seat's dealt hand.
+        hand_flor (tuple[bool, ...]): Whether each seat's dealt hand is a Flor.
+        hand_piezas (tuple[int, ...]): Number of piezas in each seat's dealt hand.
         show_teammate_cards (bool): Whether players can see their teammate's cards.
+        validate_states (bool): Whether providers receive validated `PlayerState`
+            snapshots instead of live `PlayerView`s.
+        auto_forced_actions (bool): Whether decisions with a single legal action are
+            applied without asking the provider.
+        phase (int): The decision the round is waiting for: PHASE_PLAY for a regular
+            turn, PHASE_TRUCO_RESPONSE or PHASE_ENVIDO_RESPONSE for a pending bid, or
+            PHASE_DONE once the round is decided.
     """
 
     def __init__(
@@ -38,8 +131,13 @@ class Round:
         *,
         starting_player: Player,
         show_teammate_cards: bool = False,
+        rules: RulesVariant | None = None,
+        seats: SeatTopology | None = None,
+        validate_states: bool = False,
+        dealer: Dealer | None = None,
+        auto_forced_actions: bool = False,
     ) -> None:
-        """Initialize a round with teams and a fresh deck.
+        """Initialize a round with teams and deal it.
 
         Args:
             team1: List of players on team 1.
@@ -48,74 +146,239 @@ class Round:
             action_provider: Callback used to request an action.
             starting_player: The player who starts the first hand in this round.
             show_teammate_cards: Whether teammate cards are visible in PlayerState.
+            rules: Rules variant to play with. Defaults to classic Uruguayan rules.
+            seats: Precomputed seating of these players, shared across the rounds of a game.
+                Built from the teams when omitted.
+            validate_states: Pass providers a validated `PlayerState` snapshot on every
+                decision instead of a live, read-only `PlayerView`.
+            dealer: Dealer of the round's hands, e.g. a `Deck` with a seeded generator
+                or a `CorpusDealer`. A new `Deck` is created when omitted.
+            auto_forced_actions: Apply decisions that have a single legal action
+                without asking the provider; providers defining `observe_forced` are
+                told about them instead.
         """
+        self.rules = rules or get_rules()
         self.team1 = team1
         self.team2 = team2
         self.ordered_players = ordered_players
-        self.deck = Deck()
+        self.seats = seats if seats is not None else SeatTopology(team1, team2, ordered_players)
+        self.dealer: Dealer = dealer if dealer is not None else Deck()
         self.show_teammate_cards = show_teammate_cards
+        self.validate_states = validate_states
+        self.auto_forced_actions = auto_forced_actions
+        self._views = tuple(PlayerView(self, player) for player in self.seats.players)
+
+        self.round_state = LiveRoundState()
+        self._muestra: Card | None = None
+        self._rules_row = 0
+        self._ranks: tuple[int, ...] = self.rules.rank_table[0]
+        self.played_mask: CardSet = EMPTY_SET
+        self.trick_plays: list[int] = [NO_CARD] * (CARDS_DEALT_PER_PLAYER * len(self.seats))
+        self.last_truco_bidder: Player | None = None
 
-        self.round_state: RoundState = RoundState(
-            truco_state="nada",
-            cards_played_this_round={},
-            envido_state="nada",
-            envido_bidder=None,
-            envido_points={1: 0, 2: 0},
-            flor_calls=[],
-            player_initial_hands={p: list(p.cards) for p in ordered_players},
+        # Step state: whose decision is pending, which regular turn it interrupts, the
+        # trick being played and the outcome of finished tricks, all as seat indices.
+        self.phase = PHASE_PLAY
+        self._actor = 0
+        self._turn_seat = 0
+        self._trick = 0
+        self._trick_starter = 0
+        self._trick_pos = 0
+        self._best_rank = -1
+        self._best_seat = NO_SEAT
+        self._trick_tied = False
+        self._trick_winners: list[int] = [NO_SEAT] * CARDS_DEALT_PER_PLAYER
+        self._team_wins = [0, 0]
+        self._round_wins = (0, 0)
+        self._undo_stack: list[_UndoRecord] = []
+
+        self._action_provider: ActionProvider = action_provider
+        # Resolved on the class so that mocks, which fake any attribute, use the list path.
+        self._select_masked = (
+            cast("MaskedActionProvider", action_provider).select_masked
+            if hasattr(type(action_provider), "select_masked")
+            else None
         )
+        self._observe_forced = (
+            cast("ForcedActionObserver", action_provider).observe_forced
+            if hasattr(type(action_provider), "observe_forced")
+            else None
+        )
+        self._starting_player: Player = starting_player
+        # Engine logging is guarded by this flag, so headless runs skip even the calls.
+        self._verbose = logger.isEnabledFor(logging.INFO)
         self._deal_cards()
-        self.muestra: Card
 
-        self.last_truco_bidder: Player | None = None
+    def reset(self, starting_player: Player) -> None:
+        """Reinitialize the round in place and deal new hands, so it can be played again.
 
-        self._action_provider: ActionProvider = action_provider
-        self._starting_player: Player = starting_player
+        The dealer, state containers, views and provider of the round are reused; only
+        the per-round state is cleared.
+
+        Args:
+            starting_player: The player who starts the first hand of the new round.
+        """
+        self.round_state.reset()
+        self.last_truco_bidder = None
+        self._starting_player = starting_player
+        self._verbose = logger.isEnabledFor(logging.INFO)
+        self._deal_cards()
+
+    def fork(self) -> "Round":
+        """Return an independent copy of the round that can be played on separately.
+
+        Only the compact mutable state is copied: the players' hands and play history,
+        the live round state, the trick plays, the dealer and the step state. The rules,
+        seat and pie tables, cards, muestra, per-seat hand evaluations and action
+        provider are shared. The fork seats clones of this round's players, so playing
+        it does not affect this round.
+
+        Returns:
+            Round: The forked round.
+        """
+        fork = object.__new__(Round)
+        fork.__dict__ = self.__dict__.copy()
+
+        seats = self.seats
+        players = tuple(player.clone() for player in seats.players)
+        player_map = dict(zip(seats.players, players, strict=True))
+        fork.seats = seats.with_players(players)
+        fork.team1 = [player_map[p] for p in self.team1]
+        fork.team2 = [player_map[p] for p in self.team2]
+        fork.ordered_players = list(players)
+        fork._views = tuple(PlayerView(fork, player) for player in players)
+        fork.dealer = self.dealer.copy()
+        fork.round_state = self.round_state.copy(player_map)
+        fork.trick_plays = self.trick_plays.copy()
+        fork._trick_winners = self._trick_winners.copy()
+        fork._team_wins = self._team_wins.copy()
+        fork._undo_stack = []
+        bidder = self.last_truco_bidder
+        fork.last_truco_bidder = None if bidder is None else player_map[bidder]
+        fork._starting_player = player_map.get(self._starting_player, self._starting_player)
+        return fork
+
+    def _team_of(self, player: Player) -> int:
+        """Return the team number (1 or 2) of a player."""
+        seats = self.seats
+        return seats.team_of[seats.seat_of[player]]
 
     def _get_team_pie(self, team_idx: int) -> Player:
         """Find the 'Pie' of a team (the last player of that team in the first round's rotation)."""
-        team = self.team1 if team_idx == 1 else self.team2
-        start_idx = self.ordered_players.index(self._starting_player)
-        trick_order = self.ordered_players[start_idx:] + self.ordered_players[:start_idx]
-
-        for player in reversed(trick_order):
-            if player in team:
-                return player
-        msg = f"Pie not found for team {team_idx}"
-        raise ValueError(msg)
+        seats = self.seats
+        pie = seats.pies[seats.seat_of[self._starting_player]][team_idx - 1]
+        if pie == NO_SEAT:
+            msg = f"Pie not found for team {team_idx}"
+            raise ValueError(msg)
+        return seats.players[pie]
 
     def _get_opponent_pie(self, player: Player) -> Player:
         """Find the Pie of the opposing team for a given player."""
-        opposing_team_idx = 2 if player in self.team1 else 1
+        opposing_team_idx = 2 if self._team_of(player) == 1 else 1
         return self._get_team_pie(opposing_team_idx)
 
     def _get_teammate_pie(self, player: Player) -> Player:
         """Find the Pie of the same team as the given player."""
-        team_idx = 1 if player in self.team1 else 2
+        team_idx = 1 if self._team_of(player) == 1 else 2
         return self._get_team_pie(team_idx)
 
     def _deal_cards(self) -> None:
         """Deal CARDS_DEALT_PER_PLAYER cards to each player and set the muestra card."""
-        for player in self.ordered_players:
-            player.cards = self.deck.draw(CARDS_DEALT_PER_PLAYER)
+        hands, self.muestra = self.dealer.deal(
+            len(self.ordered_players), with_muestra=self.rules.uses_muestra
+        )
+        for player, hand in zip(self.ordered_players, hands, strict=True):
+            player.receive_hand(hand)
+
+        self.played_mask = EMPTY_SET
+        self.trick_plays[:] = [NO_CARD] * len(self.trick_plays)
+        self._record_initial_hands()
+        self._start_play()
+
+    def _start_play(self) -> None:
+        """Put the step state at the first turn of the first trick."""
+        starter = self.seats.seat_of.get(self._starting_player, 0)
+        self.phase = PHASE_PLAY
+        self._trick = 0
+        self._trick_winners[:] = [NO_SEAT] * CARDS_DEALT_PER_PLAYER
+        self._team_wins[0] = self._team_wins[1] = 0
+        self._round_wins = (0, 0)
+        self._undo_stack.clear()
+        self._start_trick(starter)
+
+    def _start_trick(self, starter: int) -> None:
+        """Put the step state at the first turn of a trick led by seat `starter`."""
+        self._trick_starter = starter
+        self._trick_pos = 0
+        self._best_rank = -1
+        self._best_seat = NO_SEAT
+        self._trick_tied = False
+        self._actor = self._turn_seat = starter
+
+    def _record_initial_hands(self) -> None:
+        """Store each player's dealt hand and evaluate it once for the whole round.
+
+        Envido values, Flor flags and pieza counts cannot change after the deal, so
+        scoring and observations read `hand_envido`, `hand_flor` and `hand_piezas`
+        (indexed by seat) instead of re-evaluating hands.
+        """
+        pieza_set = self.rules.pieza_sets[self._rules_row]
+        initial_hands = self.round_state.player_initial_hands
+        envido: list[int] = []
+        flor: list[bool] = []
+        piezas: list[int] = []
+        for player in self.seats.players:
+            cards = player.cards
             # Store initial hand for Flor verification
-            self.round_state.player_initial_hands[player] = list(player.cards)
+            initial_hands[player] = list(cards)
+            envido.append(self.calculate_envido(cards))
+            flor.append(self._has_flor(cards))
+            piezas.append((player.hand_mask & pieza_set).bit_count())
+        self.hand_envido: tuple[int, ...] = tuple(envido)
+        self.hand_flor: tuple[bool, ...] = tuple(flor)
+        self.hand_piezas: tuple[int, ...] = tuple(piezas)
+
+    @property
+    def muestra(self) -> Card | None:
+        """The card that determines the trump suit, or None without muestra."""
+        return self._muestra
+
+    @muestra.setter
+    def muestra(self, muestra: Card | None) -> None:
+        self._muestra = muestra
+        self._rules_row = self.rules.row(muestra)
+        self._ranks = self.rules.rank_table[self._rules_row]
+
+    def unseen_cards(self, player: Player) -> CardSet:
+        """Return the cards `player` has not seen so far this round.
+
+        A card is seen if it is in the player's hand, has been played by anyone, is the
+        muestra, or is in a teammate's hand when teammate cards are visible.
+
+        Args:
+            player: The player whose perspective to use.
 
-        self.muestra = self.deck.draw(1)[0]
+        Returns:
+            CardSet: Bitmask of the unseen cards.
+        """
+        seen = player.hand_mask | self.played_mask
+        if self.muestra is not None:
+            seen |= CARD_BITS[self.muestra.id]
+        if self.show_teammate_cards:
+            for teammate in self._get_teammates(player):
+                seen |= teammate.hand_mask
+        return FULL_DECK & ~seen
 
     def _get_teammates(self, player: Player) -> list[Player]:
         """Get the teammates of a player."""
-        if player in self.team1:
-            return [p for p in self.team1 if p != player]
-        if player in self.team2:
-            return [p for p in self.team2 if p != player]
-        return []
+        seats = self.seats
+        return [seats.players[seat] for seat in seats.teammates[seats.seat_of[player]]]
 
     def _is_same_team(self, player_a: Player, player_b: Player) -> bool:
         """Check if two players are on the same team."""
-        return (player_a in self.team1 and player_b in self.team1) or (
-            player_a in self.team2 and player_b in self.team2
-        )
+        seats = self.seats
+        team_a = seats.team_of[seats.seat_of[player_a]]
+        return team_a != NO_TEAM and team_a == seats.team_of[seats.seat_of[player_b]]
 
     def _can_beat_truco(self, player: Player) -> bool:
         """Check if a player can beat (advance) the truco state.
@@ -123,7 +386,7 @@ class Round:
         Any player from the opposing team of the last bidder can respond.
         If no one bid yet, anyone can start.
         """
-        if self.round_state.truco_state == "vale4":
+        if self.round_state.truco == TRUCO_VALE4:
             return False
 
         if self.last_truco_bidder is None:
@@ -132,53 +395,71 @@ class Round:
         # Must be on the opposite team of the last bidder
         return not self._is_same_team(player, self.last_truco_bidder)
 
-    def _get_available_actions(self, player: Player) -> list[ActionCode]:
-        """Compute the available actions for a player at this moment."""
-        actions: list[ActionCode] = []
+    def legal_action_mask(self, player: Player) -> int:
+        """Return the actions available to a player on a regular turn as a bitmask.
+
+        Bit `code` is set when `ActionCode(code)` is legal; see `schemas.actions`.
 
+        Args:
+            player: The player whose turn it is.
+
+        Returns:
+            int: Bitmask of the legal actions.
+        """
+        hand_size = len(player.cards)
         # Card play actions: one per card in hand
-        # Assuming max 3 cards dealt
-        for i, _ in enumerate(player.cards):
-            mapping = {
-                0: ActionCode.PLAY_CARD_0,
-                1: ActionCode.PLAY_CARD_1,
-                2: ActionCode.PLAY_CARD_2,
-            }
-            action = mapping.get(i)
-            if action is not None:
-                actions.append(action)
+        mask = PLAY_CARD_MASKS[hand_size]
 
         if self._can_beat_truco(player):
-            actions.append(ActionCode.OFFER_TRUCO)
+            mask |= _OFFER_TRUCO_BIT
 
-        # Flor: only available on the first turn of the round
-        if (
-            len(player.cards) == CARDS_DEALT_PER_PLAYER
-            and player not in self.round_state.flor_calls
-        ):
-            actions.append(ActionCode.FLOR)
+        if hand_size == CARDS_DEALT_PER_PLAYER:
+            flor_calls = self.round_state.flor_calls
+            # Flor: only available on the first turn of the round
+            if player not in flor_calls:
+                mask |= _FLOR_BIT
+            # Envido: only available in the first trick, if no Flor has been called
+            # and no Envido has been bid yet.
+            if not flor_calls and self.round_state.envido == ENVIDO_NADA:
+                mask |= _OFFER_ENVIDO_BIT
 
-        # Envido: only available in the first trick, if no Flor has been called
-        # and no Envido has been bid yet.
-        if (
-            len(player.cards) == CARDS_DEALT_PER_PLAYER
-            and not self.round_state.flor_calls
-            and self.round_state.envido_state == "nada"
-        ):
-            actions.append(ActionCode.OFFER_ENVIDO)
+        return mask
+
+    def legal_action_vector(self, player: Player) -> npt.NDArray[np.bool_]:
+        """Return `legal_action_mask` as a boolean vector indexed by action code."""
+        return mask_to_vector(self.legal_action_mask(player))
+
+    def _get_available_actions(self, player: Player) -> list[ActionCode]:
+        """Compute the available actions for a player at this moment."""
+        return actions_from_mask(self.legal_action_mask(player))
 
-        return actions
+    def _request_action(self, player: Player, mask: int) -> ActionCode:
+        """Request an action from the external provider and validate it.
 
-    def _request_action(self, player: Player, available_actions: list[ActionCode]) -> ActionCode:
-        """Request an action from the external provider and validate it."""
-        player_state = self.get_player_state(player)
-        chosen_action = self._action_provider(player, player_state, available_actions)
+        Args:
+            player: The player who must act.
+            mask: Bitmask of the legal actions.
 
-        for candidate in available_actions:
-            if candidate == chosen_action:
-                return candidate
+        Returns:
+            ActionCode: The chosen action.
 
-        msg = f"Invalid action selected by provider: {chosen_action}. Valid: {available_actions}"
+        Raises:
+            ValueError: If the provider chose an action outside `mask`.
+        """
+        view = self.get_player_view(player)
+        player_state: SupportsPlayerState = view.to_state() if self.validate_states else view
+        if self._select_masked is not None:
+            chosen_action = self._select_masked(player, player_state, mask)
+        else:
+            chosen_action = self._action_provider(player, player_state, actions_from_mask(mask))
+
+        if 0 <= chosen_action < len(ACTION_BITS) and mask >> chosen_action & 1:
+            return ActionCode(chosen_action)
+
+        msg = (
+            f"Invalid action selected by provider: {chosen_action}. "
+            f"Valid: {actions_from_mask(mask)}"
+        )
         logger.error(msg)
         raise ValueError(msg)
 
@@ -188,15 +469,8 @@ class Round:
         Returns:
             int: The points for the truco state.
         """
-        match self.round_state.truco_state:
-            case "nada":
-                return 1
-            case "truco":
-                return 2
-            case "retruco":
-                return 3
-            case "vale4":
-                return 4
+        # nada, truco, retruco and vale4 are worth 1 to 4 points
+        return self.round_state.truco + 1
 
     def _advance_truco_state(self) -> TRUCO_STATE:
         """Advance the truco state to the next level.
@@ -204,19 +478,14 @@ class Round:
         Returns:
             TRUCO_STATE: The new enhanced truco state.
         """
-        match self.round_state.truco_state:
-            case "nada":
-                self.round_state.truco_state = "truco"
-            case "truco":
-                self.round_state.truco_state = "retruco"
-            case "retruco":
-                self.round_state.truco_state = "vale4"
-            case "vale4":
-                msg = "Cannot advance truco state from vale4"
-                logger.error(msg)
-                raise ValueError(msg)
+        round_state = self.round_state
+        if round_state.truco == TRUCO_VALE4:
+            msg = "Cannot advance truco state from vale4"
+            logger.error(msg)
+            raise ValueError(msg)
 
-        return self.round_state.truco_state
+        round_state.truco += 1
+        return TRUCO_STATES[round_state.truco]
 
     def _get_next_player(self, current_player: Player) -> Player:
         """Get the next player in the circular order.
@@ -227,205 +496,787 @@ class Round:
         Returns:
             Player: The next player in the interleaved order.
         """
-        idx = self.ordered_players.index(current_player)
-        return self.ordered_players[(idx + 1) % len(self.ordered_players)]
+        seats = self.seats
+        return seats.players[(seats.seat_of[current_player] + 1) % len(seats)]
+
+    @property
+    def is_done(self) -> bool:
+        """Whether the round has been decided."""
+        return self.phase == PHASE_DONE
+
+    @property
+    def current_player(self) -> Player | None:
+        """The player whose decision is pending, or None once the round is decided."""
+        if self.phase == PHASE_DONE:
+            return None
+        return self.seats.players[self._actor]
+
+    @property
+    def starting_player(self) -> Player:
+        """The player who is mano this round and leads the first trick."""
+        return self._starting_player
+
+    @property
+    def trick_index(self) -> int:
+        """Index (0-2) of the trick being played, or the number of tricks played once done."""
+        return self._trick
+
+    @property
+    def tricks_won(self) -> tuple[int, int]:
+        """Tricks won so far by (team 1, team 2)."""
+        return self._team_wins[0], self._team_wins[1]
+
+    def current_action_mask(self) -> int:
+        """Return the legal actions of the pending decision as a bitmask (0 when done)."""
+        phase = self.phase
+        if phase == PHASE_PLAY:
+            return self.legal_action_mask(self.seats.players[self._actor])
+        if phase == PHASE_TRUCO_RESPONSE:
+            # A counter-bid accepts the pending bid and raises it once more, so it is
+            # only possible while that leaves a level to raise to.
+            if self.round_state.truco < TRUCO_RETRUCO:
+                return _TRUCO_RESPONSE_MASK | _OFFER_TRUCO_BIT
+            return _TRUCO_RESPONSE_MASK
+        if phase == PHASE_ENVIDO_RESPONSE:
+            return _ENVIDO_RESPONSE_MASK
+        return 0
+
+    def step(self, action: int) -> None:
+        """Apply the pending player's action and advance to the next decision.
 
-    def _play_hand(self, starting_player: Player) -> Player | None:
-        """Play a single hand (trick) where each player plays one card.
+        Args:
+            action: An action code set in `current_action_mask()`.
+
+        Raises:
+            ValueError: If the action is not legal now.
+        """
+        self._check_action(action, self.current_action_mask())
+        self._dispatch(action)
 
-        Iterates through all players starting from `starting_player` in circular order.
+    def decisions(self) -> Generator[tuple[Player, PlayerView, int], int, tuple[int, int]]:
+        """Drive the round as a generator of decision points.
 
-        Args:
-            starting_player: The player who leads the first card of this hand.
+        Each pending decision is yielded as `(player, view, legal_mask)`; the caller
+        answers with `send(action)`. When the round is decided the generator returns
+        `result()`, which ends up in `StopIteration.value`. The caller owns the loop, so
+        it can pause a round, interleave many rounds, or batch their decisions.
+
+        With `auto_forced_actions`, decisions with a single legal action are applied
+        here instead of being yielded.
+
+        Yields:
+            tuple[Player, PlayerView, int]: The acting player, their view and the
+                bitmask of legal actions.
 
         Returns:
-            Player | None: The player who won the hand, or None if it's a tie.
+            tuple[int, int]: (team_1_points, team_2_points).
+
+        Raises:
+            ValueError: If a sent action is not legal.
         """
-        current_best_card: Card | None = None
-        current_winner: Player | None = None
-        is_tie = False
+        players = self.seats.players
+        views = self._views
+        auto_forced = self.auto_forced_actions
+        while self.phase != PHASE_DONE:
+            seat = self._actor
+            mask = self.current_action_mask()
+            if auto_forced and mask & (mask - 1) == 0:
+                self._apply_forced(players[seat], views[seat], mask)
+                continue
+            action = yield players[seat], views[seat], mask
+            self._check_action(action, mask)
+            self._dispatch(action)
+        return self.result()
+
+    def _apply_forced(self, player: Player, view: PlayerView, mask: int) -> None:
+        """Apply the only action set in `mask`, reporting it to an observing provider."""
+        action = mask.bit_length() - 1
+        if self._observe_forced is not None:
+            player_state: SupportsPlayerState = view.to_state() if self.validate_states else view
+            self._observe_forced(player, player_state, ActionCode(action))
+        self._dispatch(action)
+
+    def _check_action(self, action: int, mask: int) -> None:
+        """Raise ValueError unless `action` is set in `mask`."""
+        if not (0 <= action < len(ACTION_BITS) and mask >> action & 1):
+            msg = f"Invalid action: {action}. Valid: {actions_from_mask(mask)}"
+            logger.error(msg)
+            raise ValueError(msg)
 
-        # Order for this trick: start with starter, go around
-        start_idx = self.ordered_players.index(starting_player)
-        trick_order = self.ordered_players[start_idx:] + self.ordered_players[:start_idx]
+    def _dispatch(self, action: int) -> None:
+        """Apply a legal action to the pending decision."""
+        phase = self.phase
+        if phase == PHASE_PLAY:
+            self._step_turn(action)
+        elif phase == PHASE_TRUCO_RESPONSE:
+            self._step_truco_response(action)
+        else:
+            self._step_envido_response(action)
 
-        for player in trick_order:
-            card = self._handle_player_turn(player)
-            if card is None:
-                # Should not happen in normal flow as rejection raises error
-                logger.error("Unexpected None card from %s", player.name)
-                continue
+    def apply(self, action: int) -> None:
+        """Apply an action like `step`, recording what is needed to `undo` it.
 
-            logger.debug("%s plays %s", player.name, card)
+        Together with `undo` this lets a search walk a single round in place, like
+        make/unmake in a chess engine: each applied action costs one small record.
 
-            if current_best_card is None:
-                current_best_card = card
-                current_winner = player
-            elif card.is_greater_than(current_best_card, self.muestra):
-                current_best_card = card
-                current_winner = player
-                is_tie = False
-            elif current_best_card.is_greater_than(card, self.muestra):
-                pass  # Current best stays best
+        Args:
+            action: An action code set in `current_action_mask()`.
+
+        Raises:
+            ValueError: If the action is not legal now.
+        """
+        round_state = self.round_state
+        seat = self._actor
+        player = self.seats.players[seat]
+        card_index = card_index_from_code(ActionCode(action)) if self.phase == PHASE_PLAY else None
+        record: _UndoRecord = (
+            (
+                self.phase,
+                seat,
+                self._turn_seat,
+                self._trick,
+                self._trick_starter,
+                self._trick_pos,
+                self._best_rank,
+                self._best_seat,
+                self._trick_tied,
+                self._team_wins[0],
+                self._team_wins[1],
+                self._round_wins,
+                self.played_mask,
+            ),
+            (
+                round_state.truco,
+                round_state.envido,
+                round_state.envido_bidder,
+                self.last_truco_bidder,
+                round_state.envido_points[1],
+                round_state.envido_points[2],
+                len(round_state.flor_calls),
+            ),
+            -1 if card_index is None else card_index,
+            round_state.cards_played_this_round.get(player),
+        )
+        self.step(action)
+        self._undo_stack.append(record)
+
+    def undo(self) -> None:
+        """Revert the last action recorded by `apply`.
+
+        Raises:
+            ValueError: If there is no applied action to undo.
+        """
+        if not self._undo_stack:
+            msg = "No action to undo"
+            raise ValueError(msg)
+        step_state, bid_state, card_index, previous_card = self._undo_stack.pop()
+        (
+            self.phase,
+            seat,
+            self._turn_seat,
+            trick,
+            self._trick_starter,
+            self._trick_pos,
+            self._best_rank,
+            self._best_seat,
+            self._trick_tied,
+            self._team_wins[0],
+            self._team_wins[1],
+            self._round_wins,
+            self.played_mask,
+        ) = step_state
+        self._actor = seat
+        self._trick = trick
+        round_state = self.round_state
+        (
+            round_state.truco,
+            round_state.envido,
+            round_state.envido_bidder,
+            self.last_truco_bidder,
+            round_state.envido_points[1],
+            round_state.envido_points[2],
+            flor_count,
+        ) = bid_state
+        del round_state.flor_calls[flor_count:]
+
+        if card_index >= 0:
+            player = self.seats.players[seat]
+            player.unplay_card(card_index)
+            self.trick_plays[trick * len(self.seats) + seat] = NO_CARD
+            # The trick was still open before the card, so it had no winner yet.
+            self._trick_winners[trick] = NO_SEAT
+            if previous_card is None:
+                del round_state.cards_played_this_round[player]
             else:
-                # Tie with current best
-                is_tie = True
-                # In a tie, we track that it's a tie, but we don't change 'current_winner'
-                # arbitrarily yet. Tie logic is handled by caller or resolved winner is None.
+                round_state.cards_played_this_round[player] = previous_card
 
-        if is_tie:
-            logger.debug("Hand tied with best card %s", current_best_card)
-            return None
+    def to_bytes(self) -> bytes:
+        """Encode the full round state in a compact, versioned binary snapshot.
 
-        logger.debug(
-            "Hand winner: %s with %s",
-            current_winner.name if current_winner else "None",
-            current_best_card,
+        The snapshot holds seat indices and card ids only: the rules variant, muestra,
+        dealt hands, trick plays, bid state, bidders and the step state. Players,
+        provider and undo history are not part of it. Restore it with `load_bytes` or
+        `from_bytes`.
+
+        Returns:
+            bytes: The snapshot, 40 bytes for a 1v1 round.
+        """
+        seats = self.seats
+        seat_of = seats.seat_of
+        round_state = self.round_state
+        muestra = self._muestra
+        envido_bidder = round_state.envido_bidder
+        truco_bidder = self.last_truco_bidder
+        flor_calls = round_state.flor_calls
+        none = _SNAPSHOT_NONE
+        header = _SNAPSHOT_HEADER.pack(
+            SNAPSHOT_VERSION,
+            len(seats),
+            _RULES_NAMES.index(self.rules.name),
+            none if muestra is None else muestra.id,
+            seat_of.get(self._starting_player, 0),
+            round_state.truco,
+            round_state.envido,
+            none if envido_bidder is None else seat_of[envido_bidder],
+            none if truco_bidder is None else seat_of[truco_bidder],
+            round_state.envido_points[1],
+            round_state.envido_points[2],
+            self.phase,
+            self._actor,
+            self._turn_seat,
+            self._trick,
+            self._trick_starter,
+            self._trick_pos,
+            self._best_rank,
+            self._best_seat & none,
+            self._trick_tied,
+            *(seat & none for seat in self._trick_winners),
+            *self._team_wins,
+            *self._round_wins,
+            len(flor_calls),
         )
-        return current_winner
+        initial_hands = round_state.player_initial_hands
+        hands = [card.id for player in seats.players for card in initial_hands[player]]
+        plays = [card_id & none for card_id in self.trick_plays]
+        return header + bytes(hands + plays + [seat_of[player] for player in flor_calls])
 
-    def _handle_player_turn(self, player: Player) -> Card | None:
-        """Handle a player's turn, which may include truco bidding.
+    def load_bytes(self, data: bytes) -> None:
+        """Restore a snapshot made by `to_bytes` into this round, in place.
+
+        The round must seat the same number of players under the same rules variant
+        as the round that was encoded. The undo history is cleared.
 
         Args:
-            player: The player whose turn it is.
+            data: The snapshot.
 
-        Returns:
-            Card | None: The card played, or None if a truco challenge was rejected.
+        Raises:
+            ValueError: If the snapshot is malformed, has another version or does not
+                fit this table.
         """
-        available = self._get_available_actions(player)
-        action = self._request_action(player, available)
+        num_seats, rules_name = self._snapshot_table(data)
+        seats = self.seats
+        players = seats.players
+        if num_seats != len(seats) or rules_name != self.rules.name:
+            msg = (
+                f"Snapshot of a {num_seats}-seat {rules_name} round cannot "
+                f"be loaded into a {len(seats)}-seat {self.rules.name} round"
+            )
+            raise ValueError(msg)
+        fields = _SNAPSHOT_HEADER.unpack_from(data)
+        (
+            muestra_id,
+            starting_seat,
+            truco,
+            envido,
+            envido_bidder,
+            truco_bidder,
+            team_1_envido,
+            team_2_envido,
+            phase,
+            actor,
+            turn_seat,
+            trick,
+            trick_starter,
+            trick_pos,
+            best_rank,
+            best_seat,
+            trick_tied,
+        ) = fields[3:20]
+        trick_winners = fields[20:23]
+        team_wins = fields[23:25]
+        round_wins = fields[25:27]
+        flor_count = fields[27]
+        none = _SNAPSHOT_NONE
+        flor_start = self._restore_cards(data, muestra_id)
+        self._starting_player = players[starting_seat]
 
-        if action == ActionCode.OFFER_TRUCO:
-            return self._handle_truco_bid(player)
-        if action == ActionCode.OFFER_ENVIDO:
-            return self._handle_envido_bid(player)
-        if action == ActionCode.FLOR:
-            logger.info("%s says FLOR!", player.name)
-            self.round_state.flor_calls.append(player)
-            # After saying Flor, the player must still play a card (or bid truco)
-            return self._handle_player_turn(player)
-        if action in {ActionCode.ACCEPT_TRUCO, ActionCode.REJECT_TRUCO}:
-            msg = "Accept/Reject truco is not valid on a regular turn"
-            logger.error(msg)
+        round_state = self.round_state
+        round_state.truco = truco
+        round_state.envido = envido
+        round_state.envido_bidder = None if envido_bidder == none else players[envido_bidder]
+        round_state.envido_points[1] = team_1_envido
+        round_state.envido_points[2] = team_2_envido
+        round_state.flor_calls.extend(
+            players[seat] for seat in data[flor_start : flor_start + flor_count]
+        )
+        self.last_truco_bidder = None if truco_bidder == none else players[truco_bidder]
+
+        self.phase = phase
+        self._actor = actor
+        self._turn_seat = turn_seat
+        self._trick = trick
+        self._trick_starter = trick_starter
+        self._trick_pos = trick_pos
+        self._best_rank = best_rank
+        self._best_seat = NO_SEAT if best_seat == none else best_seat
+        self._trick_tied = trick_tied
+        self._trick_winners[:] = [NO_SEAT if seat == none else seat for seat in trick_winners]
+        self._team_wins[:] = team_wins
+        self._round_wins = (round_wins[0], round_wins[1])
+        self._undo_stack.clear()
+        self._verbose = logger.isEnabledFor(logging.INFO)
+
+    def _restore_cards(self, data: bytes, muestra_id: int) -> int:
+        """Deal a snapshot's hands and muestra, then replay its trick plays.
+
+        Resets the bid state. Returns the offset of the Flor calls in `data`.
+        """
+        none = _SNAPSHOT_NONE
+        players = self.seats.players
+        num_seats = len(players)
+        hands_start = _SNAPSHOT_HEADER.size
+        plays_start = hands_start + num_seats * CARDS_DEALT_PER_PLAYER
+        flor_start = plays_start + len(self.trick_plays)
+
+        for seat, player in enumerate(players):
+            start = hands_start + seat * CARDS_DEALT_PER_PLAYER
+            hand = data[start : start + CARDS_DEALT_PER_PLAYER]
+            player.receive_hand([ALL_CARDS[card_id] for card_id in hand])
+        self.muestra = None if muestra_id == none else ALL_CARDS[muestra_id]
+        round_state = self.round_state
+        round_state.reset()
+        self._record_initial_hands()
+
+        # Each seat's plays, taken in trick order, rebuild its hand order and history.
+        played_mask = EMPTY_SET
+        trick_plays = self.trick_plays
+        cards_played = round_state.cards_played_this_round
+        for index, card_id in enumerate(data[plays_start:flor_start]):
+            if card_id == none:
+                trick_plays[index] = NO_CARD
+                continue
+            trick_plays[index] = card_id
+            player = players[index % num_seats]
+            card = ALL_CARDS[card_id]
+            player.play_card(player.cards.index(card))
+            cards_played[player] = card
+            played_mask |= CARD_BITS[card_id]
+        self.played_mask = played_mask
+        return flor_start
+
+    @staticmethod
+    def _snapshot_table(data: bytes) -> tuple[int, RulesName]:
+        """Validate a snapshot's version and size and return its seat count and rules.
+
+        Raises:
+            ValueError: If the snapshot has another version, an unknown rules variant or
+                a length that does not match its header.
+        """
+        header_size = _SNAPSHOT_HEADER.size
+        if not data or data[0] != SNAPSHOT_VERSION:
+            version = data[0] if data else None
+            msg = f"Unsupported round snapshot version {version}"
+            raise ValueError(msg)
+        if len(data) < header_size:
+            msg = f"Truncated round snapshot: {len(data)} bytes, header needs {header_size}"
             raise ValueError(msg)
+        fields = _SNAPSHOT_HEADER.unpack_from(data)
+        num_seats, rules_index, muestra_id = fields[1:4]
+        if rules_index >= len(_RULES_NAMES):
+            msg = f"Unknown rules variant {rules_index} in round snapshot"
+            raise ValueError(msg)
+        # Two teams of equal size, and enough cards left over for the muestra.
+        if not num_seats or num_seats % 2 or num_seats * CARDS_DEALT_PER_PLAYER >= CARD_COUNT:
+            msg = f"Invalid seat count {num_seats} in round snapshot"
+            raise ValueError(msg)
+        # Each seat's dealt hand and trick plays, then one byte per Flor call.
+        expected = header_size + 2 * num_seats * CARDS_DEALT_PER_PLAYER + fields[27]
+        if len(data) != expected:
+            msg = f"Round snapshot of {num_seats} seats must be {expected} bytes, got {len(data)}"
+            raise ValueError(msg)
+        rules_name = _RULES_NAMES[rules_index]
+        Round._check_snapshot_state(data, fields, num_seats)
+        Round._check_snapshot_cards(data, num_seats, muestra_id, get_rules(rules_name))
+        return num_seats, rules_name
 
-        # Play selected card
-        card_index = card_index_from_code(action)
-        if card_index is None:
-            msg = "Play card action code must map to a card index"
-            logger.error(msg)
+    @staticmethod
+    def _check_snapshot_state(data: bytes, fields: tuple[int, ...], num_seats: int) -> None:
+        """Check a snapshot's bid codes, step state and seat fields against its table.
+
+        Raises:
+            ValueError: If any of them is out of range.
+        """
+        none = _SNAPSHOT_NONE
+        truco, envido, phase, trick, trick_pos = (fields[i] for i in (5, 6, 11, 14, 16))
+        if truco >= len(TRUCO_STATES) or envido >= len(ENVIDO_STATES) or phase > PHASE_DONE:
+            msg = f"Invalid bid state or phase in round snapshot: {truco}, {envido}, {phase}"
+            raise ValueError(msg)
+        if trick > CARDS_DEALT_PER_PLAYER or trick_pos > num_seats:
+            msg = f"Invalid trick {trick} or trick position {trick_pos} in round snapshot"
+            raise ValueError(msg)
+        # Starting seat, actor, turn seat and trick starter always name a seat; the
+        # bidders, best seat, trick winners and Flor callers may be absent.
+        seats = [fields[i] for i in (4, 12, 13, 15)]
+        flor_callers = data[len(data) - fields[27] :]
+        optional_seats = [*(fields[i] for i in (7, 8, 18, 20, 21, 22)), *flor_callers]
+        if any(seat >= num_seats for seat in seats) or any(
+            seat >= num_seats and seat != none for seat in optional_seats
+        ):
+            msg = f"Round snapshot names a seat outside its {num_seats}-seat table"
             raise ValueError(msg)
-        card = player.play_card(card_index)
-        self.round_state.cards_played_this_round[player] = card
-        return card
 
-    def _handle_truco_bid(self, original_player: Player) -> Card | None:
-        """Handle a Truco bid chain starting from original_player.
+    @staticmethod
+    def _check_snapshot_cards(
+        data: bytes, num_seats: int, muestra_id: int, rules: RulesVariant
+    ) -> None:
+        """Check a snapshot's hands, muestra and trick plays are consistent card ids.
 
-        All responses and counter-bids (Retruco, Vale 4) are said by the 'Pie'
-        of each team.
+        Raises:
+            ValueError: If a card id is unknown or dealt twice, the muestra does not
+                match the rules, or a seat plays a card it was not dealt or plays twice.
+        """
+        none = _SNAPSHOT_NONE
+        hands_start = _SNAPSHOT_HEADER.size
+        plays_start = hands_start + num_seats * CARDS_DEALT_PER_PLAYER
+        dealt = list(data[hands_start:plays_start])
+        if rules.uses_muestra or muestra_id != none:
+            dealt.append(muestra_id)
+        if (
+            max(dealt) >= CARD_COUNT
+            or len(set(dealt)) != len(dealt)
+            or (rules.uses_muestra == (muestra_id == none))
+        ):
+            msg = f"Round snapshot deals unknown or repeated cards under {rules.name} rules"
+            raise ValueError(msg)
+        plays = data[plays_start : plays_start + num_seats * CARDS_DEALT_PER_PLAYER]
+        for index, card_id in enumerate(plays):
+            start = hands_start + index % num_seats * CARDS_DEALT_PER_PLAYER
+            if card_id != none and (
+                card_id not in data[start : start + CARDS_DEALT_PER_PLAYER]
+                or card_id in plays[:index]
+            ):
+                msg = f"Round snapshot play {index} is not an unplayed card of its seat"
+                raise ValueError(msg)
+
+    @classmethod
+    def from_bytes(
+        cls,
+        data: bytes,
+        action_provider: ActionProvider,
+        *,
+        players: Sequence[Player] | None = None,
+    ) -> "Round":
+        """Build a new round from a snapshot made by `to_bytes`.
 
         Args:
-            original_player: The player whose turn was interrupted by the initial bid.
+            data: The snapshot.
+            action_provider: Callback the restored round requests actions from.
+            players: Players by seat. Seats are interleaved, so even seats form team 1.
+                New players named `Seat <n>` are created when omitted.
 
         Returns:
-            Card | None: The card played after truco resolution.
+            Round: The restored round.
 
         Raises:
-            TrucoRejectedError: To signal immediate round end on rejection.
+            ValueError: If the snapshot is malformed or has another version, or `players`
+                has the wrong length.
         """
-        current_bidder = original_player
+        num_seats, rules_name = cls._snapshot_table(data)
+        if players is None:
+            players = [Player(f"Seat {seat}") for seat in range(num_seats)]
+        ordered = list(players)
+        if len(ordered) != num_seats:
+            msg = f"Snapshot seats {num_seats} players, got {len(ordered)}"
+            raise ValueError(msg)
+        rules = get_rules(rules_name)
+        hands_end = _SNAPSHOT_HEADER.size + num_seats * CARDS_DEALT_PER_PLAYER
+        # Deal the snapshot's own hands so construction does not draw a random deal.
+        deal = np.frombuffer(bytes(data[_SNAPSHOT_HEADER.size : hands_end]) + data[3:4], np.uint8)
+        round_obj = cls(
+            ordered[0::2],
+            ordered[1::2],
+            ordered,
+            action_provider,
+            starting_player=ordered[0],
+            rules=rules,
+            dealer=CorpusDealer(deal[np.newaxis]),
+        )
+        round_obj.load_bytes(data)
+        return round_obj
 
-        while True:
-            current_state = self.round_state.truco_state
-            next_state_name = {"nada": "truco", "truco": "retruco", "retruco": "vale4"}.get(
-                current_state, current_state
-            )
+    def result(self) -> tuple[int, int]:
+        """Return the points each team scores in the decided round.
+
+        Returns:
+            tuple[int, int]: (team_1_points, team_2_points).
+
+        Raises:
+            ValueError: If the round is not decided yet.
+        """
+        if self.phase != PHASE_DONE:
+            msg = "Round is not finished"
+            raise ValueError(msg)
+        return self.get_hand_points(*self._round_wins)
 
-            self.last_truco_bidder = current_bidder
-            logger.debug("%s bids %s", current_bidder.name, next_state_name)
+    def _step_turn(self, action: int) -> None:
+        """Apply an action taken on a regular turn."""
+        seats = self.seats
+        player = seats.players[self._actor]
+        round_state = self.round_state
+        if self._verbose:
+            self._log_turn(player, action)
 
+        if action == ActionCode.OFFER_TRUCO:
+            self.last_truco_bidder = player
             # The response is always said by the opposing team's Pie
-            responder = self._get_opponent_pie(current_bidder)
+            self._actor = seats.seat_of[self._get_opponent_pie(player)]
+            self.phase = PHASE_TRUCO_RESPONSE
+            return
+        if action == ActionCode.OFFER_ENVIDO:
+            round_state.envido = ENVIDO_ENVIDO
+            round_state.envido_bidder = player
+            self._actor = seats.seat_of[self._get_opponent_pie(player)]
+            self.phase = PHASE_ENVIDO_RESPONSE
+            return
+        if action == ActionCode.FLOR:
+            round_state.flor_calls.append(player)
+            # After saying Flor, the player must still play a card (or bid truco)
+            return
 
-            # Response options: Quiero, No Quiero, or counter-bid
-            available_responses = [ActionCode.ACCEPT_TRUCO, ActionCode.REJECT_TRUCO]
+        card_index = card_index_from_code(ActionCode(action))
+        if card_index is None:
+            msg = "Play card action code must map to a card index"
+            logger.error(msg)
+            raise ValueError(msg)
+        card = player.play_card(card_index)
+        round_state.cards_played_this_round[player] = card
+        self.played_mask |= CARD_BITS[card.id]
+        seat = self._actor
+        self.trick_plays[self._trick * len(seats) + seat] = card.id
+
+        card_rank = self._ranks[card.id]
+        if card_rank > self._best_rank:
+            self._best_rank = card_rank
+            self._best_seat = seat
+            self._trick_tied = False
+        elif card_rank == self._best_rank:
+            # Tie with current best; the trick is tied unless a later card beats both.
+            self._trick_tied = True
+
+        self._trick_pos += 1
+        if self._trick_pos < len(seats):
+            self._actor = self._turn_seat = seats.trick_orders[self._trick_starter][self._trick_pos]
+        else:
+            self._finish_trick()
 
-            # Pie can counter-bid if not already at the highest level
-            if self.round_state.truco_state != "vale4":
-                available_responses.append(ActionCode.OFFER_TRUCO)
+    def _log_turn(self, player: Player, action: int) -> None:
+        """Log an action taken on a regular turn, before it is applied."""
+        if action == ActionCode.OFFER_TRUCO:
+            logger.debug("%s bids %s", player.name, TRUCO_STATES[self.round_state.truco + 1])
+        elif action == ActionCode.OFFER_ENVIDO:
+            logger.debug("%s bids ENVIDO", player.name)
+        elif action == ActionCode.FLOR:
+            logger.info("%s says FLOR!", player.name)
+        else:
+            card_index = card_index_from_code(ActionCode(action))
+            if card_index is not None:
+                logger.debug("%s plays %s", player.name, player.cards[card_index])
 
-            response = self._request_action(responder, available_responses)
+    def _step_truco_response(self, action: int) -> None:
+        """Apply the Pie's answer to a pending Truco bid.
 
-            if response == ActionCode.OFFER_TRUCO:
-                # Responder counter-bids (e.g., "Retruco")
-                self._advance_truco_state()
-                current_bidder = responder
-                # Continue loop to ask the other team's Pie
-                continue
+        All responses and counter-bids (Retruco, Vale 4) are said by the 'Pie' of each
+        team. Accepting resumes the interrupted turn; rejecting ends the round.
+        """
+        seats = self.seats
+        responder = seats.players[self._actor]
+        bidder = self.last_truco_bidder
+        if bidder is None:
+            msg = "Truco response without a bidder"
+            raise ValueError(msg)
 
-            if response == ActionCode.ACCEPT_TRUCO:
-                logger.debug("%s accepts %s", responder.name, next_state_name)
-                self._advance_truco_state()
-                # Chain over, return to original player's turn
-                break
+        if action == ActionCode.OFFER_TRUCO:
+            # Responder counter-bids (e.g., "Retruco")
+            self._advance_truco_state()
+            self.last_truco_bidder = responder
+            if self._verbose:
+                logger.debug("%s bids %s", responder.name, TRUCO_STATES[self.round_state.truco + 1])
+            # The other team's Pie answers the counter-bid
+            self._actor = seats.seat_of[self._get_opponent_pie(responder)]
+            return
+
+        if action == ActionCode.ACCEPT_TRUCO:
+            if self._verbose:
+                logger.debug(
+                    "%s accepts %s", responder.name, TRUCO_STATES[self.round_state.truco + 1]
+                )
+            self._advance_truco_state()
+            # Chain over, return to the interrupted player's turn
+            self._resume_turn()
+            return
 
-            # Rejection: The team of the last bidder wins the round immediately
-            raise TrucoRejectedError(current_bidder)
+        # Rejection: The team of the last bidder wins the round immediately
+        if self._verbose:
+            logger.debug("Round ended due to truco rejection")
+        self._finish(self._winner_from_player(bidder))
 
-        return self._handle_player_turn(original_player)
+    def _step_envido_response(self, action: int) -> None:
+        """Apply the Pie's answer to a pending Envido bid, then resume the turn."""
+        responder = self.seats.players[self._actor]
+        round_state = self.round_state
 
-    def _handle_envido_bid(self, bidding_player: Player) -> Card | None:
-        """Handle an Envido bid from a player.
+        if action == ActionCode.FLOR:
+            # Flor overrides Envido (Rule 3)
+            if self._verbose:
+                logger.info("%s responds with FLOR to Envido!", responder.name)
+            round_state.flor_calls.append(responder)
+            round_state.envido = ENVIDO_NADA  # Canceled
+        elif action == ActionCode.ACCEPT_ENVIDO:
+            if self._verbose:
+                logger.debug("%s accepts Envido", responder.name)
+            round_state.envido = ENVIDO_QUERIDO
+            self._resolve_envido_comparison()
+        else:
+            # No quiero: 1 point for the bidding team
+            if self._verbose:
+                logger.debug("%s rejects Envido", responder.name)
+            round_state.envido = ENVIDO_NO_QUIERO
+            bidder = round_state.envido_bidder
+            if bidder is not None:
+                round_state.envido_points[self._team_of(bidder)] += 1
+
+        self._resume_turn()
+
+    def _resume_turn(self) -> None:
+        """Return the decision to the player whose regular turn a bid interrupted."""
+        self.phase = PHASE_PLAY
+        self._actor = self._turn_seat
+
+    def _finish_trick(self) -> None:
+        """Score the completed trick and either start the next one or end the round."""
+        seats = self.seats
+        hand_index = self._trick
+        winner_seat = NO_SEAT if self._trick_tied else self._best_seat
+        self._trick_winners[hand_index] = winner_seat
+        self._trick += 1
+
+        if self._verbose:
+            best_card = Card.from_id(self.trick_plays[hand_index * len(seats) + self._best_seat])
+            if winner_seat == NO_SEAT:
+                logger.debug("Hand tied with best card %s", best_card)
+            else:
+                logger.debug("Hand winner: %s with %s", seats.players[winner_seat], best_card)
+        if winner_seat == NO_SEAT:
+            hand_winner = None
+            next_starter = self._trick_starter
+        else:
+            hand_winner = seats.players[winner_seat]
+            self._team_wins[seats.team_of[winner_seat] - 1] += 1
+            next_starter = winner_seat
+
+        # Early exit if a team already won enough tricks
+        team_1_wins, team_2_wins = self._team_wins
+        if team_1_wins >= HANDS_TO_WIN_ROUND:
+            self._finish((HANDS_TO_WIN_ROUND, 0))
+            return
+        if team_2_wins >= HANDS_TO_WIN_ROUND:
+            self._finish((0, HANDS_TO_WIN_ROUND))
+            return
+
+        # Early exit for tie shortcuts (e.g. 1st tie, 2nd winner takes all)
+        first_seat = self._trick_winners[0]
+        shortcut_winner = self._apply_tie_shortcuts(
+            hand_index=hand_index,
+            first_trick_tied=first_seat == NO_SEAT,
+            first_trick_winner=None if first_seat == NO_SEAT else seats.players[first_seat],
+            current_hand_winner=hand_winner,
+        )
+        if shortcut_winner:
+            self._finish(self._winner_from_player(shortcut_winner))
+            return
+
+        if self._trick == CARDS_DEALT_PER_PLAYER:
+            hand_results = [
+                None if seat == NO_SEAT else seats.players[seat] for seat in self._trick_winners
+            ]
+            self._finish(self._determine_round_winner(team_1_wins, team_2_wins, hand_results))
+            return
+
+        if self._verbose:
+            logger.debug("--------------------------------")
+            logger.debug(
+                "Playing hand %d, %s starts", self._trick + 1, seats.players[next_starter].name
+            )
+        self._start_trick(next_starter)
+
+    def _finish(self, round_wins: tuple[int, int]) -> None:
+        """Mark the round as decided with the given (team_1_wins, team_2_wins)."""
+        self.phase = PHASE_DONE
+        self._round_wins = round_wins
+
+    def _play_hand(self, starting_player: Player) -> Player | None:
+        """Play a single hand (trick) where each player plays one card.
+
+        Drives the step state from `starting_player` through one full trick, asking the
+        provider for every decision.
 
         Args:
-            bidding_player: The player initiating the Envido challenge.
+            starting_player: The player who leads the first card of this hand.
 
         Returns:
-            Card | None: The card played after Envido resolution.
+            Player | None: The player who won the hand, or None if it's a tie.
         """
-        logger.debug("%s bids ENVIDO", bidding_player.name)
-        self.round_state.envido_state = "envido"
-        self.round_state.envido_bidder = bidding_player
+        hand_index = self._trick
+        self.phase = PHASE_PLAY
+        self._start_trick(self.seats.seat_of[starting_player])
+        while self._trick == hand_index and self.phase != PHASE_DONE:
+            self._request_step()
+        winner_seat = self._trick_winners[hand_index]
+        return None if winner_seat == NO_SEAT else self.seats.players[winner_seat]
 
-        # The response is always said by the opposing team's Pie
-        responder = self._get_opponent_pie(bidding_player)
+    def _handle_player_turn(self, player: Player) -> Card:
+        """Handle a player's turn, which may include bids before the card is played.
 
-        # Response options: Quiero, No Quiero, Flor
-        available_responses = [
-            ActionCode.ACCEPT_ENVIDO,
-            ActionCode.REJECT_ENVIDO,
-        ]
-        # Opponent can respond with Flor if they have one
-        available_responses.append(ActionCode.FLOR)
+        The player takes the pending regular turn; bids and their responses are asked
+        for until the player plays a card.
 
-        response = self._request_action(responder, available_responses)
+        Args:
+            player: The player whose turn it is.
 
-        if response == ActionCode.FLOR:
-            # Flor overrides Envido (Rule 3)
-            logger.info("%s responds with FLOR to Envido!", responder.name)
-            self.round_state.flor_calls.append(responder)
-            self.round_state.envido_state = "nada"  # Canceled
-            # After saying Flor, the player must still play a card (or bid truco)
-            # But the turn should continue with the bidding_player?
-            # In the original flow, _handle_truco_bid returns _handle_player_turn(bidding_player).
-            # Same here.
-            return self._handle_player_turn(bidding_player)
-
-        if response == ActionCode.ACCEPT_ENVIDO:
-            logger.debug("%s accepts Envido", responder.name)
-            self.round_state.envido_state = "querido"
-            self._resolve_envido_comparison()
-            return self._handle_player_turn(bidding_player)
+        Returns:
+            Card: The card played.
 
-        # No quiero
-        logger.debug("%s rejects Envido", responder.name)
-        self.round_state.envido_state = "no_quiero"
-        # 1 point for the bidding team
-        team_idx = 1 if bidding_player in self.team1 else 2
-        self.round_state.envido_points[team_idx] += 1
-        return self._handle_player_turn(bidding_player)
+        Raises:
+            TrucoRejectedError: If a truco bid made during this turn is rejected, which
+                ends the round before the card is played.
+            ValueError: If the round ends some other way before the card is played.
+        """
+        self.phase = PHASE_PLAY
+        self._actor = self._turn_seat = self.seats.seat_of[player]
+        played = len(player.played_cards)
+        while len(player.played_cards) == played:
+            if self.phase == PHASE_DONE:
+                if self.last_truco_bidder is not None:
+                    raise TrucoRejectedError(self.last_truco_bidder)
+                msg = f"Round ended before {player.name} played a card"
+                raise ValueError(msg)
+            self._request_step()
+        return player.played_cards[-1]
+
+    def _request_step(self) -> None:
+        """Ask the provider for the pending decision and apply it."""
+        player = self.seats.players[self._actor]
+        self._dispatch(self._request_action(player, self.current_action_mask()))
 
     def _resolve_envido_comparison(self) -> None:
         """Compare Envido values and award 2 points to the winner.
@@ -435,32 +1286,33 @@ class Round:
         Teammates remain silent if their team already holds the lead.
         """
         # Get play order for the first trick
-        start_idx = self.ordered_players.index(self._starting_player)
-        trick_order = self.ordered_players[start_idx:] + self.ordered_players[:start_idx]
-
+        seats = self.seats
         highest_announced_val = -1
         current_winner = None
 
-        for player in trick_order:
+        for seat in seats.trick_orders[seats.seat_of[self._starting_player]]:
+            player = seats.players[seat]
             if current_winner and self._is_same_team(player, current_winner):
                 # Teammate silent if their team already has the lead
                 continue
 
-            val = self.calculate_envido(self.round_state.player_initial_hands[player])
+            val = self.hand_envido[seat]
 
             # In truco, if values are equal, the one earlier in play order (player)
             # wins. Since we iterate in trick_order, only '>' changes the winner.
             if val > highest_announced_val:
-                logger.info("%s has %d", player.name, val)
+                if self._verbose:
+                    logger.info("%s has %d", player.name, val)
                 highest_announced_val = val
                 current_winner = player
-            else:
+            elif self._verbose:
                 logger.info("%s says 'son buenas'", player.name)
 
         if current_winner:
-            team_idx = 1 if current_winner in self.team1 else 2
+            team_idx = self._team_of(current_winner)
             self.round_state.envido_points[team_idx] += 2
-            logger.info("Team %d wins Envido", team_idx)
+            if self._verbose:
+                logger.info("Team %d wins Envido", team_idx)
 
     def _determine_round_winner(
         self, team_1_wins: int, team_2_wins: int, hand_results: list[Player | None]
@@ -507,7 +1359,7 @@ class Round:
 
     def _winner_from_player(self, player: Player) -> tuple[int, int]:
         """Convert a winning player to a team point tuple."""
-        if player in self.team1:
+        if self._team_of(player) == 1:
             return HANDS_TO_WIN_ROUND, 0
         return 0, HANDS_TO_WIN_ROUND
 
@@ -551,84 +1403,22 @@ class Round:
         Returns:
             tuple[int, int]: (team_1_points, team_2_points).
         """
-        logger.debug(
-            "Playing round w/ teams: %s vs %s",
-            [p.name for p in self.team1],
-            [p.name for p in self.team2],
-        )
-        logger.info("Muestra is: %s", self.muestra)
-
-        team_1_wins, team_2_wins = self._execute_round()
-        return self.get_hand_points(team_1_wins, team_2_wins)
-
-    def _execute_round(self) -> tuple[int, int]:
-        """Execute the trick-by-trick logic for a round.
-
-        Returns:
-            tuple[int, int]: (team_1_wins, team_2_wins) for the round.
-        """
-        progress = RoundProgress(
-            current_starter=self._starting_player,
-            team_1_wins=0,
-            team_2_wins=0,
-            first_trick_tied=False,
-            first_trick_winner=None,
-        )
-
-        hand_results: list[Player | None] = []
-
-        try:
-            for hand_num in range(CARDS_DEALT_PER_PLAYER):
-                hand_winner = self._play_hand_step(hand_num, progress)
-                hand_results.append(hand_winner)
-
-                # Early exit if a team already won enough tricks
-                if progress.team_1_wins >= HANDS_TO_WIN_ROUND:
-                    return HANDS_TO_WIN_ROUND, 0
-                if progress.team_2_wins >= HANDS_TO_WIN_ROUND:
-                    return 0, HANDS_TO_WIN_ROUND
-
-                # Early exit for tie shortcuts (e.g. 1st tie, 2nd winner takes all)
-                shortcut_winner = self._apply_tie_shortcuts(
-                    hand_index=hand_num,
-                    first_trick_tied=progress.first_trick_tied,
-                    first_trick_winner=progress.first_trick_winner,
-                    current_hand_winner=hand_winner,
-                )
-                if shortcut_winner:
-                    return self._winner_from_player(shortcut_winner)
-
-            return self._determine_round_winner(
-                progress.team_1_wins, progress.team_2_wins, hand_results
+        if self._verbose:
+            logger.debug(
+                "Playing round w/ teams: %s vs %s",
+                [p.name for p in self.team1],
+                [p.name for p in self.team2],
             )
+        if self._verbose and self.muestra is not None:
+            logger.info("Muestra is: %s", self.muestra)
 
-        except TrucoRejectedError as error:
-            logger.debug("Round ended due to truco rejection")
-            return self._winner_from_player(error.winning_player)
-
-    def _play_hand_step(self, hand_num: int, progress: RoundProgress) -> Player | None:
-        """Play a single hand and update progress."""
-        logger.debug("--------------------------------")
-        logger.debug("Playing hand %d, %s starts", hand_num + 1, progress.current_starter.name)
-
-        hand_winner = self._play_hand(progress.current_starter)
-
-        # Track results for first trick
-        if hand_num == 0:
-            if hand_winner is None:
-                progress.first_trick_tied = True
-            else:
-                progress.first_trick_winner = hand_winner
-
-        # Update starter and scores if there's a winner
-        if hand_winner:
-            progress.current_starter = hand_winner
-            if hand_winner in self.team1:
-                progress.team_1_wins += 1
-            else:
-                progress.team_2_wins += 1
-
-        return hand_winner
+        driver = self.decisions()
+        try:
+            player, _, mask = next(driver)
+            while True:
+                player, _, mask = driver.send(self._request_action(player, mask))
+        except StopIteration as stop:
+            return stop.value
 
     def get_hand_points(self, team_1_wins: int, team_2_wins: int) -> tuple[int, int]:
         """Convert round win counts into game points based on truco state.
@@ -646,24 +1436,24 @@ class Round:
         team_2_points = 0
 
         if team_1_wins > team_2_wins:
-            logger.debug("Team 1 wins the round")
             team_1_points = truco_points
         elif team_2_wins > team_1_wins:
-            logger.debug("Team 2 wins the round")
             team_2_points = truco_points
+        # Fallback for rare full tie: the starter's team (Hand) wins
+        elif self._team_of(self._starting_player) == 1:
+            team_1_points = truco_points
         else:
-            # Fallback for rare full tie
-            logger.debug("All tied, determine by starter logic (Hand wins)")
-            if self._starting_player in self.team1:
-                team_1_points = truco_points
-            else:
-                team_2_points = truco_points
+            team_2_points = truco_points
+
+        if self._verbose:
+            logger.debug("Team %d wins the round", 1 if team_1_points else 2)
 
         # Calculate Flor points
+        seats = self.seats
         for player in self.round_state.flor_calls:
-            has_real_flor = self._has_flor(self.round_state.player_initial_hands[player])
+            has_real_flor = self.hand_flor[seats.seat_of[player]]
             points = 3
-            if player in self.team1:
+            if self._team_of(player) == 1:
                 if has_real_flor:
                     team_1_points += points
                 else:
@@ -688,28 +1478,27 @@ class Round:
         Returns:
             PlayerState: A snapshot of the game visible to the player.
         """
-        round_state = self.round_state
-        player_cards = player.cards
+        return self.get_player_view(player).to_state()
 
-        teammate_cards = None
-        if self.show_teammate_cards:
-            teammates = self._get_teammates(player)
-            # Flatten all teammate cards into one list
-            teammate_cards = [card for p in teammates for card in p.cards]
-
-        return PlayerState(
-            round_state=round_state,
-            player_cards=player_cards,
-            teammate_cards=teammate_cards,
-        )
+    def get_player_view(self, player: Player) -> PlayerView:
+        """Get the live, read-only view of the round for a specific player.
+
+        Unlike `get_player_state`, this allocates nothing: each seat's view is created
+        once and reads the round's data on access.
+
+        Args:
+            player: The player whose perspective to use.
+
+        Returns:
+            PlayerView: The player's view of the round.
+        """
+        return self._views[self.seats.seat_of[player]]
 
     def _has_flor(self, cards: list[Card]) -> bool:
         """Check if a list of cards constitutes a Flor.
 
-        A Flor is:
-        - Three cards from the same suit.
-        - One pieza and the other two from the same suit.
-        - Two or more piezas.
+        Three-card hands are looked up in the precomputed tables; see
+        `models.envido.has_flor` for the rule itself.
 
         Args:
             cards: The list of cards to check (usually 3).
@@ -717,98 +1506,22 @@ class Round:
         Returns:
             bool: True if it's a Flor, False otherwise.
         """
-        if len(cards) != 3:
-            return False
-
-        piezas = [c for c in cards if c.is_pieza(self.muestra)]
-        non_piezas = [c for c in cards if not c.is_pieza(self.muestra)]
-
-        # Two or more piezas
-        if len(piezas) >= 2:
-            return True
-
-        # One pieza and the other two from the same suit
-        if len(piezas) == 1:
-            return non_piezas[0].suit == non_piezas[1].suit
-
-        # Zero piezas and all three from the same suit
-        return cards[0].suit == cards[1].suit == cards[2].suit
+        if len(cards) != CARDS_DEALT_PER_PLAYER:
+            return has_flor(cards, self.muestra)
+        return self.rules.has_flor(cards[0].id, cards[1].id, cards[2].id, self._rules_row)
 
     def calculate_envido(self, cards: list[Card]) -> int:
         """Calculate the Envido value for a hand of cards.
 
+        Three-card hands are looked up in the precomputed tables; see
+        `models.envido.calculate_envido` for the rule itself.
+
         Args:
             cards: The list of cards to calculate Envido for.
 
         Returns:
             int: The Envido value.
         """
-        if not cards:
-            return 0
-
-        piezas = [c for c in cards if c.is_pieza(self.muestra)]
-        # Pieza values for Envido
-        pieza_envido_values = {2: 30, 4: 29, 5: 28, 11: 27, 10: 27}
-
-        if piezas:
-            # Case A: Hand Contains a Pieza
-            # Take the highest pieza value
-            highest_pieza_val = 0
-            for p in piezas:
-                # If it's a 12 (Rey), it takes the value of the pieza it's replacing
-                p_num = p.number if p.number != REY else self.muestra.number
-                highest_pieza_val = max(highest_pieza_val, pieza_envido_values[p_num])
-
-            # Add the highest Envido-value card among the remaining two cards
-            # We need to be careful: if we have multiple piezas, the "remaining" cards
-            # are the ones not used for the 'highest_pieza_val'.
-            # Wait, the rule says "Take the highest pieza value.
-            # Add the highest Envido-value card among the remaining two cards."
-            # This implies if you have 2 piezas, you take the best one,
-            # and then look at the other 2 cards (one of which is ALSO a pieza)
-            # and take the best Envido value from them.
-
-            # Find the card that gave the highest_pieza_val
-            best_pieza = None
-            for p in piezas:
-                p_num = p.number if p.number != REY else self.muestra.number
-                if pieza_envido_values[p_num] == highest_pieza_val:
-                    best_pieza = p
-                    break
-
-            remaining_cards = list(cards)
-            remaining_cards.remove(best_pieza)
-
-            # For the remaining cards, we need their Envido value.
-            # Normal cards use get_envido_value().
-            # Piezas use their pieza_envido_values.
-            # If the remaining is another pieza, does it count as 30/29/etc
-            # or as facial? Usually it's the facial value for the second card.
-            # Let's check Example 2 again. 4 (pieza) is 29. 6 is 6. 29+6=35.
-            # If I had two piezas, say 2 and 4. 2 is 30. 4 is 29.
-            # Usually the second card is its facial value if not used as base.
-
-            max_remaining_val = max(c.get_envido_value() for c in remaining_cards)
-            return highest_pieza_val + max_remaining_val
-
-        # Cases B & C: No Piezas
-        # Group by suit
-        suit_groups: dict[str, list[Card]] = {}
-        for c in cards:
-            suit_groups.setdefault(c.suit, []).append(c)
-
-        max_envido = 0
-        for suit_cards in suit_groups.values():
-            if len(suit_cards) >= 2:
-                # Case C: No Pieza, Two (or three) Cards of the Same Suit
-                # Take the two highest Envido-value cards of the same suit. Add 20 bonus points.
-                vals = sorted([c.get_envido_value() for c in suit_cards], reverse=True)
-                envido_val = vals[0] + vals[1] + 20
-                max_envido = max(max_envido, envido_val)
-            else:
-                # Case B: No Pieza, All Cards Different Suits (or just this one)
-                # Envido = highest single card value.
-                envido_val = suit_cards[0].get_envido_value()
-                max_envido = max(max_envido, envido_val)
-
-        return max_envido
+        if len(cards) != CARDS_DEALT_PER_PLAYER:
+            return calculate_envido(cards, self.muestra)
+        return self.rules.envido(cards[0].id, cards[1].id, cards[2].id, self._rules_row)
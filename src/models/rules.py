@@ -0,0 +1,96 @@
+"""Compiled rules variants.
+
+A `RulesVariant` compiles the rank, Envido and Flor tables of one ruleset up front,
+so the engine resolves tricks, Envido and Flor with plain table lookups whatever the
+variant. Tables are indexed by a *row*: the muestra id for variants with a muestra,
+and always 0 for variants without one.
+"""
+
+from functools import cache
+from typing import TYPE_CHECKING
+
+from models.card import ALL_CARDS, RANK_TABLE
+from models.card_set import EMPTY_SET, CardSet, card_set
+from models.hand_tables import ENVIDO, FLOR, build_hand_tables, get_hand_tables, hand_index
+from schemas.constants import CARD_COUNT, NO_MUESTRA
+
+if TYPE_CHECKING:
+    from models.card import Card
+    from models.hand_tables import HandTables
+    from schemas.constants import RulesName
+
+
+class RulesVariant:
+    """Lookup tables for one Truco ruleset.
+
+    Attributes:
+        name: Name of the variant.
+        uses_muestra: Whether a muestra is turned up after dealing (and piezas exist).
+        rank_table: `rank_table[row][card_id]` is the trick-taking value of a card.
+        hand_tables: `hand_tables[ENVIDO | FLOR, row, hand_index]` as in `models.hand_tables`.
+        pieza_sets: `pieza_sets[row]` is the CardSet of piezas.
+    """
+
+    __slots__ = ("hand_tables", "name", "pieza_sets", "rank_table", "uses_muestra")
+
+    def __init__(self, name: "RulesName", *, uses_muestra: bool) -> None:
+        """Compile the tables of a variant.
+
+        Args:
+            name: Name of the variant.
+            uses_muestra: Whether the variant plays with a muestra and piezas.
+        """
+        self.name = name
+        self.uses_muestra = uses_muestra
+        self.rank_table: tuple[tuple[int, ...], ...]
+        self.hand_tables: HandTables
+        self.pieza_sets: tuple[CardSet, ...]
+        if uses_muestra:
+            self.rank_table = RANK_TABLE[:CARD_COUNT]
+            self.hand_tables = get_hand_tables()
+            self.pieza_sets = tuple(
+                card_set(card for card in ALL_CARDS if card.is_pieza(muestra))
+                for muestra in ALL_CARDS
+            )
+        else:
+            self.rank_table = (RANK_TABLE[NO_MUESTRA],)
+            self.hand_tables = build_hand_tables((NO_MUESTRA,))
+            self.pieza_sets = (EMPTY_SET,)
+
+    def row(self, muestra: "Card | None") -> int:
+        """Return the table row to use for a round with the given muestra."""
+        if muestra is None or not self.uses_muestra:
+            return 0
+        return muestra.id
+
+    def envido(self, a: int, b: int, c: int, row: int) -> int:
+        """Return the Envido value of a 3-card hand (card ids in any order)."""
+        return int(self.hand_tables[ENVIDO, row, hand_index(a, b, c)])
+
+    def has_flor(self, a: int, b: int, c: int, row: int) -> bool:
+        """Return whether a 3-card hand (card ids in any order) is a Flor."""
+        return bool(self.hand_tables[FLOR, row, hand_index(a, b, c)])
+
+    def __repr__(self) -> str:
+        """Return the variant name for debugging."""
+        return f"RulesVariant({self.name!r})"
+
+
+@cache
+def get_rules(name: "RulesName" = "uruguayo") -> RulesVariant:
+    """Return the compiled variant with the given name, compiling it on first use.
+
+    - "uruguayo": classic Uruguayan Truco with muestra and piezas.
+    - "argentino": Argentine-style Truco without muestra or piezas.
+
+    Raises:
+        ValueError: If the name is not a known variant.
+    """
+    match name:
+        case "uruguayo":
+            return RulesVariant(name, uses_muestra=True)
+        case "argentino":
+            return RulesVariant(name, uses_muestra=False)
+        case _:
+            msg = f"Unknown rules variant: {name}"
+            raise ValueError(msg)
@@ -0,0 +1,84 @@
+from models.player import Player
+
+# Seat value used in pie tables when a team has no player at the table.
+NO_SEAT = -1
+# Team value of a seat whose player is on neither team.
+NO_TEAM = 0
+
+
+class SeatTopology:
+    """Precomputed seating of a table: seat indices, teams, trick orders and pies.
+
+    Seats follow the interleaved `ordered_players` order. Everything a round needs
+    to know about who sits where is computed once, so per-turn lookups are tuple
+    indexing instead of `list.index` and membership scans.
+
+    Attributes:
+        players: Players by seat.
+        seat_of: Seat index of each player.
+        team_of: Team number (1 or 2) by seat, or `NO_TEAM`.
+        teammates: Seats of the other members of each seat's team.
+        trick_orders: `trick_orders[start]` lists all seats in play order from `start`.
+        pies: `pies[start][team - 1]` is the seat of a team's Pie (its last player in
+            play order) when `start` leads the first trick, or `NO_SEAT`.
+    """
+
+    __slots__ = ("pies", "players", "seat_of", "team_of", "teammates", "trick_orders")
+
+    def __init__(
+        self, team1: list[Player], team2: list[Player], ordered_players: list[Player]
+    ) -> None:
+        """Build the topology of a table.
+
+        Args:
+            team1: List of players on team 1.
+            team2: List of players on team 2.
+            ordered_players: Interleaved list of players, defining the seats.
+        """
+        size = len(ordered_players)
+        self.players: tuple[Player, ...] = tuple(ordered_players)
+        self.seat_of: dict[Player, int] = {player: seat for seat, player in enumerate(self.players)}
+        self.team_of: tuple[int, ...] = tuple(
+            1 if player in team1 else 2 if player in team2 else NO_TEAM for player in self.players
+        )
+        self.teammates: tuple[tuple[int, ...], ...] = tuple(
+            tuple(
+                other
+                for other in range(size)
+                if other != seat and self.team_of[other] == self.team_of[seat] != NO_TEAM
+            )
+            for seat in range(size)
+        )
+        self.trick_orders: tuple[tuple[int, ...], ...] = tuple(
+            tuple((start + offset) % size for offset in range(size)) for start in range(size)
+        )
+        self.pies: tuple[tuple[int, int], ...] = tuple(
+            (self._last_of_team(order, 1), self._last_of_team(order, 2))
+            for order in self.trick_orders
+        )
+
+    def with_players(self, players: tuple[Player, ...]) -> "SeatTopology":
+        """Return the same topology seating `players` (by seat) instead.
+
+        The seat, team, trick-order and pie tables are shared; only the player lookups
+        are rebuilt. Used to fork rounds onto cloned players.
+        """
+        topology = object.__new__(SeatTopology)
+        topology.players = players
+        topology.seat_of = {player: seat for seat, player in enumerate(players)}
+        topology.team_of = self.team_of
+        topology.teammates = self.teammates
+        topology.trick_orders = self.trick_orders
+        topology.pies = self.pies
+        return topology
+
+    def _last_of_team(self, order: tuple[int, ...], team: int) -> int:
+        """Return the last seat of `team` in `order`, or NO_SEAT."""
+        for seat in reversed(order):
+            if self.team_of[seat] == team:
+                return seat
+        return NO_SEAT
+
+    def __len__(self) -> int:
+        """Return the number of seats."""
+        return len(self.players)
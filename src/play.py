@@ -2,14 +2,14 @@ from logging_config import get_logger
 from models.game import Game
 from models.player import Player
 from schemas.actions import ActionCode, ActionProvider
-from schemas.player_state import PlayerState
+from schemas.player_state import SupportsPlayerState
 from utils.cli_actions import print_available_actions, prompt_action_code
 
 logger = get_logger(__name__)
 
 
 def _cli_action_provider(
-    player: Player, player_state: PlayerState, available_actions: list[ActionCode]
+    player: Player, player_state: SupportsPlayerState, available_actions: list[ActionCode]
 ) -> ActionCode:
     """Simple CLI-based action provider for human input.
 
@@ -15,19 +15,19 @@ from utils.config_loader import get_evaluation_params, load_agent_config
 
 if TYPE_CHECKING:
     from schemas.actions import ActionCode, ActionProvider
-    from schemas.player_state import PlayerState
+    from schemas.player_state import SupportsPlayerState
 
 logger = get_logger(__name__)
 
 
 def _print_available_actions(
-    player_name: str, player_state: PlayerState, actions: list[ActionCode]
+    player_name: str, player_state: SupportsPlayerState, actions: list[ActionCode]
 ) -> None:
     print_available_actions(player_name, player_state.player_cards, actions)
 
 
 def _cli_action_provider(
-    player: Player, player_state: PlayerState, available_actions: list[ActionCode]
+    player: Player, player_state: SupportsPlayerState, available_actions: list[ActionCode]
 ) -> ActionCode:
     _print_available_actions(player.name, player_state, available_actions)
     return prompt_action_code(player.name, available_actions)
@@ -9,13 +9,20 @@ The mapping is stable and never changes:
 - 7: Offer Envido
 - 8: Accept Envido
 - 9: Reject Envido
+
+Sets of legal actions are passed around as integer bitmasks where bit `code` is set
+when `ActionCode(code)` is legal, so membership is a single bit test.
 """
 
 from collections.abc import Callable
 from enum import IntEnum
+from typing import Protocol
+
+import numpy as np
+import numpy.typing as npt
 
 from models.player import Player
-from schemas.player_state import PlayerState
+from schemas.player_state import SupportsPlayerState
 
 
 class ActionCode(IntEnum):
@@ -41,4 +48,91 @@ def card_index_from_code(code: ActionCode) -> int | None:
     return play_map.get(code)
 
 
-ActionProvider = Callable[[Player, PlayerState, list[ActionCode]], ActionCode]
+ACTION_COUNT = len(ActionCode)
+
+# ACTION_BITS[code] is the mask bit of a single action.
+ACTION_BITS: tuple[int, ...] = tuple(1 << code for code in ActionCode)
+
+# PLAY_CARD_MASKS[n] allows playing any of the first n cards in hand.
+PLAY_CARD_MASKS: tuple[int, ...] = (
+    0,
+    ACTION_BITS[ActionCode.PLAY_CARD_0],
+    ACTION_BITS[ActionCode.PLAY_CARD_0] | ACTION_BITS[ActionCode.PLAY_CARD_1],
+    ACTION_BITS[ActionCode.PLAY_CARD_0]
+    | ACTION_BITS[ActionCode.PLAY_CARD_1]
+    | ACTION_BITS[ActionCode.PLAY_CARD_2],
+)
+
+_MASK_ACTIONS: tuple[tuple[ActionCode, ...], ...] = tuple(
+    tuple(code for code in ActionCode if mask & ACTION_BITS[code])
+    for mask in range(1 << ACTION_COUNT)
+)
+
+_MASK_VECTORS: npt.NDArray[np.bool_] = (
+    (np.arange(1 << ACTION_COUNT)[:, np.newaxis] >> np.arange(ACTION_COUNT)) & 1
+).astype(np.bool_)
+_MASK_VECTORS.flags.writeable = False
+
+
+def mask_from_actions(actions: list[ActionCode]) -> int:
+    """Return the bitmask with the bit of every given action set."""
+    mask = 0
+    for action in actions:
+        mask |= ACTION_BITS[action]
+    return mask
+
+
+def actions_from_mask(mask: int) -> list[ActionCode]:
+    """Return the actions set in a bitmask, in ascending code order."""
+    return list(_MASK_ACTIONS[mask])
+
+
+def mask_to_vector(mask: int) -> npt.NDArray[np.bool_]:
+    """Return a bitmask as a boolean vector of length ACTION_COUNT indexed by action code."""
+    return _MASK_VECTORS[mask].copy()
+
+
+def write_mask_vector(mask: int, out: npt.NDArray[np.generic]) -> None:
+    """Write a bitmask into a preallocated vector of length ACTION_COUNT.
+
+    Args:
+        mask: Bitmask of actions.
+        out: Vector of any numeric or bool dtype; set to 1 where the action is set.
+    """
+    np.copyto(out, _MASK_VECTORS[mask], casting="unsafe")
+
+
+ActionProvider = Callable[[Player, SupportsPlayerState, list[ActionCode]], ActionCode]
+
+
+class MaskedActionProvider(Protocol):
+    """Action provider that can take the legal actions directly as a bitmask.
+
+    `Round` prefers `select_masked` over calling the provider with a list of actions
+    when the provider's class defines it.
+    """
+
+    def __call__(
+        self, player: Player, player_state: SupportsPlayerState, available: list[ActionCode]
+    ) -> ActionCode: ...
+
+    def select_masked(
+        self, player: Player, player_state: SupportsPlayerState, mask: int
+    ) -> ActionCode:
+        """Choose one of the actions whose bit is set in `mask`."""
+        ...
+
+
+class ForcedActionObserver(Protocol):
+    """Action provider that wants to see the actions `Round` applies on its own.
+
+    With `auto_forced_actions`, a decision with a single legal action is applied
+    without asking the provider. When the provider's class defines `observe_forced`,
+    `Round` reports each such action to it instead, e.g. to keep trajectories complete.
+    """
+
+    def observe_forced(
+        self, player: Player, player_state: SupportsPlayerState, action: ActionCode
+    ) -> None:
+        """Record that `player` was forced to take `action`."""
+        ...
@@ -9,5 +9,19 @@ REY = 12
 CARDS_DEALT_PER_PLAYER = 3
 
 SUIT_TO_INDEX: dict[str, int] = {"basto": 0, "espadas": 1, "oro": 2, "copa": 3}
+NUMBER_TO_INDEX: dict[int, int] = {number: i for i, number in enumerate(CardNumber.__args__)}
+
+# Cards are identified by `number_index * SUIT_COUNT + suit_index`, matching deck order.
+SUIT_COUNT = len(CardSuit.__args__)
+CARD_COUNT = len(CardNumber.__args__) * SUIT_COUNT
+
+# Muestra id used by rules variants without a muestra: its table rows have no piezas.
+NO_MUESTRA = CARD_COUNT
+RulesName = Literal["uruguayo", "argentino"]
 
 BASE_OUTPUT_DIR = Path(__file__).resolve().parent.parent / "output"
+
+# Precomputed lookup tables are built and saved by the first process that needs them,
+# in the directory named by this environment variable or else in the user cache.
+HAND_TABLES_DIR_ENV = "TRUCO_HAND_TABLES_DIR"
+DEFAULT_HAND_TABLES_DIR = Path.home() / ".cache" / "truco" / "tables"
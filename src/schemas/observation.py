@@ -7,13 +7,22 @@ class Observation(TypedDict):
     """Minimal observation schema used by agents.
 
     Keys mirror those produced by the environment and training loop wrappers.
+    `hand_ids` and `muestra_id` carry the same cards as stable card ids (-1 for an
+    empty slot). `hand_envido`, `hand_flor` and `hand_piezas` describe the player's
+    dealt hand as evaluated once at deal time. None of these extra keys are part of
+    the state key, so existing tables stay valid.
     """
 
     hand_numbers: list[int]
     hand_suits: list[int]
+    hand_ids: list[int]
     truco_state: int
     muestra_number: int
     muestra_suit: int
+    muestra_id: int
+    hand_envido: int
+    hand_flor: int
+    hand_piezas: int
 
 
 def encode_state_key(observation: Observation) -> str:
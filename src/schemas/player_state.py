@@ -1,7 +1,9 @@
+from typing import Protocol
+
 from pydantic import BaseModel, ConfigDict
 
 from models.card import Card
-from schemas.round_state import RoundState
+from schemas.round_state import LiveRoundState, RoundState
 
 
 class PlayerState(BaseModel):
@@ -13,6 +15,7 @@ class PlayerState(BaseModel):
     Attributes:
         round_state: The current state of the round.
         player_cards: The cards currently in the player's hand.
+        teammate_cards: The cards of the player's teammates, if they are visible.
     """
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
@@ -20,3 +23,25 @@ class PlayerState(BaseModel):
     round_state: RoundState
     player_cards: list[Card]
     teammate_cards: list[Card] | None = None
+
+
+class SupportsPlayerState(Protocol):
+    """Read-only interface shared by `PlayerState` and the live `PlayerView`.
+
+    Action providers receive an object of this type and must not mutate it.
+    """
+
+    @property
+    def round_state(self) -> RoundState | LiveRoundState:
+        """The current state of the round; read-only even when live."""
+        ...
+
+    @property
+    def player_cards(self) -> list[Card]:
+        """The cards currently in the player's hand."""
+        ...
+
+    @property
+    def teammate_cards(self) -> list[Card] | None:
+        """The cards of the player's teammates, or None if they are hidden."""
+        ...
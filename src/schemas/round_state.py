@@ -1,7 +1,7 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Literal
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 from models.card import Card
 from models.player import Player
@@ -9,11 +9,25 @@ from models.player import Player
 TRUCO_STATE = Literal["nada", "truco", "retruco", "vale4"]
 ENVIDO_STATE = Literal["nada", "envido", "querido", "no_quiero"]
 
-TRUCO_STATE_TO_INDEX: dict[str, int] = {"nada": 0, "truco": 1, "retruco": 2, "vale4": 3}
+# Integer codes of the truco and envido states, in bidding order.
+TRUCO_STATES: tuple[TRUCO_STATE, ...] = ("nada", "truco", "retruco", "vale4")
+TRUCO_NADA, TRUCO_TRUCO, TRUCO_RETRUCO, TRUCO_VALE4 = range(len(TRUCO_STATES))
+ENVIDO_STATES: tuple[ENVIDO_STATE, ...] = ("nada", "envido", "querido", "no_quiero")
+ENVIDO_NADA, ENVIDO_ENVIDO, ENVIDO_QUERIDO, ENVIDO_NO_QUIERO = range(len(ENVIDO_STATES))
+
+TRUCO_STATE_TO_INDEX: dict[str, int] = {state: code for code, state in enumerate(TRUCO_STATES)}
+ENVIDO_STATE_TO_INDEX: dict[str, int] = {state: code for code, state in enumerate(ENVIDO_STATES)}
+
+
+def _no_envido_points() -> dict[int, int]:
+    """Return the Envido points of both teams before any Envido is played."""
+    return {1: 0, 2: 0}
 
 
 class RoundState(BaseModel):
-    """Represents the current state of a round in the game.
+    """Validated snapshot of the state of a round, for export at API boundaries.
+
+    Rounds keep their live state in `LiveRoundState`; see `LiveRoundState.snapshot`.
 
     Attributes:
         truco_state: The current truco bidding state.
@@ -27,26 +41,111 @@ class RoundState(BaseModel):
     truco_state: TRUCO_STATE
     envido_state: ENVIDO_STATE = "nada"
     cards_played_this_round: dict[Player, Card]
-    flor_calls: list[Player] = []
-    player_initial_hands: dict[Player, list[Card]] = {}
+    flor_calls: list[Player] = Field(default_factory=list)
+    player_initial_hands: dict[Player, list[Card]] = Field(default_factory=dict)
     envido_bidder: Player | None = None
-    envido_points: dict[int, int] = {1: 0, 2: 0}  # Team points from Envido
+    # Team points from Envido
+    envido_points: dict[int, int] = Field(default_factory=_no_envido_points)
 
 
-@dataclass
-class RoundProgress:
-    """Mutable state tracking the progress of a round's tricks.
+@dataclass(slots=True)
+class LiveRoundState:
+    """Mutable state of a round in play, updated on every bid and card.
+
+    Truco and Envido states are stored as integer codes (indices into `TRUCO_STATES`
+    and `ENVIDO_STATES`); the `truco_state` and `envido_state` properties expose them
+    with the names used by `RoundState`.
 
     Attributes:
-        current_starter: Player who leads the next trick.
-        team_1_wins: Number of tricks won by team 1 so far.
-        team_2_wins: Number of tricks won by team 2 so far.
-        first_trick_tied: Whether the first trick resulted in a tie.
-        first_trick_winner: Winner of the first trick, if not tied.
+        truco: Code of the current truco bidding state.
+        envido: Code of the current envido state.
+        cards_played_this_round: Last card played by each player.
+        flor_calls: Players who called Flor.
+        player_initial_hands: The original 3-card hand of each player.
+        envido_bidder: Player who bid Envido, if any.
+        envido_points: Team points from Envido.
     """
 
-    current_starter: Player
-    team_1_wins: int
-    team_2_wins: int
-    first_trick_tied: bool
-    first_trick_winner: Player | None
+    truco: int = TRUCO_NADA
+    envido: int = ENVIDO_NADA
+    cards_played_this_round: dict[Player, Card] = field(default_factory=dict)
+    flor_calls: list[Player] = field(default_factory=list)
+    player_initial_hands: dict[Player, list[Card]] = field(default_factory=dict)
+    envido_bidder: Player | None = None
+    envido_points: dict[int, int] = field(default_factory=_no_envido_points)
+
+    @property
+    def truco_state(self) -> TRUCO_STATE:
+        """The current truco bidding state."""
+        return TRUCO_STATES[self.truco]
+
+    @truco_state.setter
+    def truco_state(self, state: TRUCO_STATE) -> None:
+        self.truco = TRUCO_STATE_TO_INDEX[state]
+
+    @property
+    def envido_state(self) -> ENVIDO_STATE:
+        """The current envido state."""
+        return ENVIDO_STATES[self.envido]
+
+    @envido_state.setter
+    def envido_state(self, state: ENVIDO_STATE) -> None:
+        self.envido = ENVIDO_STATE_TO_INDEX[state]
+
+    def reset(self) -> None:
+        """Clear the state in place for a new round, reusing its containers."""
+        self.truco = TRUCO_NADA
+        self.envido = ENVIDO_NADA
+        self.cards_played_this_round.clear()
+        self.flor_calls.clear()
+        self.player_initial_hands.clear()
+        self.envido_bidder = None
+        self.envido_points[1] = 0
+        self.envido_points[2] = 0
+
+    def copy(self, player_map: dict[Player, Player] | None = None) -> "LiveRoundState":
+        """Return an independent copy; cards are shared, containers are not.
+
+        Args:
+            player_map: Replacement for each player, used when copying the state onto
+                cloned players. Players are shared when omitted.
+
+        Returns:
+            LiveRoundState: The copy.
+        """
+        if player_map is None:
+            return LiveRoundState(
+                truco=self.truco,
+                envido=self.envido,
+                cards_played_this_round=self.cards_played_this_round.copy(),
+                flor_calls=self.flor_calls.copy(),
+                player_initial_hands={p: h.copy() for p, h in self.player_initial_hands.items()},
+                envido_bidder=self.envido_bidder,
+                envido_points=self.envido_points.copy(),
+            )
+        bidder = self.envido_bidder
+        return LiveRoundState(
+            truco=self.truco,
+            envido=self.envido,
+            cards_played_this_round={
+                player_map[p]: card for p, card in self.cards_played_this_round.items()
+            },
+            flor_calls=[player_map[p] for p in self.flor_calls],
+            player_initial_hands={
+                player_map[p]: h.copy() for p, h in self.player_initial_hands.items()
+            },
+            envido_bidder=None if bidder is None else player_map[bidder],
+            envido_points=self.envido_points.copy(),
+        )
+
+    def snapshot(self) -> RoundState:
+        """Return a validated `RoundState` copy of the current state."""
+        return RoundState(
+            truco_state=self.truco_state,
+            envido_state=self.envido_state,
+            cards_played_this_round=dict(self.cards_played_this_round),
+            flor_calls=list(self.flor_calls),
+            player_initial_hands={p: list(h) for p, h in self.player_initial_hands.items()},
+            envido_bidder=self.envido_bidder,
+            envido_points=dict(self.envido_points),
+        )
@@ -41,3 +41,4 @@ class TrainingConfig(BaseModel):
     q_params: QParams | None = None
     epsilon_params: EpsilonParams | None = None
     evaluation: EvaluationConfig | None = None
+    headless: bool = False
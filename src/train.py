@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import argparse
-import random
 import statistics
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -12,7 +11,9 @@ from agents.monte_carlo_agent import MonteCarloAgent
 from agents.provider import RoundActionProvider
 from agents.q_learning_agent import QLearningAgent
 from agents.random_agent import RandomAgent
-from logging_config import get_logger
+from logging_config import get_logger, set_headless
+from models.deal_rng import DealRng
+from models.deck import Deck
 from models.player import Player
 from models.round import Round
 from utils.config_loader import load_agent_config
@@ -26,24 +27,48 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
-def _play_one_episode(
-    agent: BaseAgent, opponent: BaseAgent
-) -> tuple[list[tuple[str, int, float]], float]:
-    """Simulate a single round episode and return trajectory and reward.
+def _make_episode_round(
+    agent: BaseAgent, opponent: BaseAgent, deal_rng: DealRng | None = None
+) -> tuple[Round, RoundActionProvider]:
+    """Create the players, provider and round reused by every training episode.
 
     Args:
         agent: Learning agent instance.
         opponent: Opponent agent instance.
+        deal_rng: Stream the round's deck draws from; the global `random` when None.
 
     Returns:
-        A tuple of (trajectory, reward), where trajectory is a list of
-        (state_key, action, reward) and reward is the terminal reward.
+        A tuple of (round, provider); the agent plays team 1 and starts every round.
     """
     player_1 = Player("Agent")
     player_2 = Player("Opponent")
     provider = RoundActionProvider(agent, opponent, learner_name=player_1.name)
-    round_obj = Round(player_1, player_2, provider, starting_player=player_1)
+    round_obj = Round(
+        [player_1],
+        [player_2],
+        [player_1, player_2],
+        provider,
+        starting_player=player_1,
+        dealer=Deck(deal_rng),
+    )
     provider.set_round(round_obj)
+    return round_obj, provider
+
+
+def _play_one_episode(
+    round_obj: Round, provider: RoundActionProvider
+) -> tuple[list[tuple[str, int, float]], float]:
+    """Deal a fresh round and simulate it as a single episode.
+
+    Args:
+        round_obj: Round created by `_make_episode_round`, reset in place.
+        provider: The provider attached to `round_obj`.
+
+    Returns:
+        A tuple of (trajectory, reward), where trajectory is a list of
+        (state_key, action, reward) and reward is the terminal reward.
+    """
+    round_obj.reset(round_obj.seats.players[0])
     provider.reset_trajectory()
     t1_pts, t2_pts = round_obj.play_round()
 
@@ -62,7 +87,11 @@ def train(config: TrainingConfig) -> None:
     Args:
         config: Training configuration loaded from YAML.
     """
-    _ = random.Random(config.seed)  # seeding for reproducibility where used
+    # Episode i is dealt from round i of the seed's stream, so any episode's deal
+    # can be regenerated from its index.
+    deal_rng = DealRng(config.seed)
+    if config.headless:
+        set_headless()
     agent_type = config.agent_type
     q_params: QParams = config.q_params or {}  # type: ignore[assignment]
     epsilon_params: EpsilonParams = config.epsilon_params or {}  # type: ignore[assignment]
@@ -101,8 +130,10 @@ def train(config: TrainingConfig) -> None:
     with Path(session_dir / "config.yaml").open("w") as f:
         yaml.dump(config, f)
 
+    round_obj, provider = _make_episode_round(agent, opponent, deal_rng)
     for episode in range(1, config.episodes + 1):
-        trajectory, reward = _play_one_episode(agent, opponent)
+        deal_rng.start_round(episode)
+        trajectory, reward = _play_one_episode(round_obj, provider)
         rewards.append(reward)
         round_wins.append(1 if reward > 0 else 0)
         agent.update(trajectory)
@@ -133,8 +164,13 @@ def train(config: TrainingConfig) -> None:
 def main() -> None:
     parser = argparse.ArgumentParser()
     parser.add_argument("--config", type=str, required=True, help="Path to YAML config file")
+    parser.add_argument(
+        "--headless", action="store_true", help="Silence engine logging during simulation"
+    )
     args = parser.parse_args()
     config = load_agent_config(args.config)
+    if args.headless:
+        config.headless = True
     train(config)
 
 
@@ -8,7 +8,7 @@ sys.path.append(Path(__file__).parent.parent / "src")
 from models.card import Card
 from models.player import Player
 from schemas.actions import ActionCode
-from schemas.player_state import PlayerState
+from schemas.player_state import SupportsPlayerState
 
 
 class MockDeck:
@@ -21,6 +21,13 @@ class MockDeck:
     def __init__(self) -> None:
         pass
 
+    def reset(self) -> None:
+        pass
+
+    def deal(self, num_players: int, *, with_muestra: bool) -> tuple[list[list[Card]], Card | None]:
+        hands = [self.draw(3) for _ in range(num_players)]
+        return hands, self.draw(1)[0] if with_muestra else None
+
     def draw(self, n: int) -> list[Card]:
         if not MockDeck._draw_queue:
             raise ValueError("MockDeck ran out of pre-configured cards to draw!")
@@ -58,7 +65,7 @@ class DeterministicActionProvider:
         self.action_queue = deque(script)
 
     def __call__(
-        self, player: Player, player_state: PlayerState, available_actions: list[ActionCode]
+        self, player: Player, player_state: SupportsPlayerState, available_actions: list[ActionCode]
     ) -> ActionCode:
         print(f"DEBUG: Request action for {player.name}. Queue len: {len(self.action_queue)}")
         if not self.action_queue:
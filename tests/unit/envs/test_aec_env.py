@@ -0,0 +1,108 @@
+import numpy as np
+import pytest
+
+from envs.aec_env import TrucoAECEnv
+from envs.table import EMPTY_CARD, OBS_HAND, OBS_TEAMMATE_CARDS
+from envs.truco_env import TrucoEnv
+
+
+def _play_random(env: TrucoAECEnv, seed: int) -> dict[str, float]:
+    env.reset(seed=seed)
+    rng = np.random.default_rng(seed)
+    final_rewards: dict[str, float] = {}
+    for agent in env.agent_iter():
+        observation, reward, terminated, truncated, _ = env.last()
+        assert not truncated
+        if terminated:
+            final_rewards[agent] = reward
+            env.step(None)
+            continue
+        assert observation is not None
+        assert env.observation_space(agent).contains(observation)
+        env.step(int(rng.choice(np.flatnonzero(observation["action_mask"]))))
+    return final_rewards
+
+
+@pytest.mark.parametrize("team_size", [1, 2, 3])
+def test_random_rounds_finish_with_zero_sum_team_rewards(team_size):
+    env = TrucoAECEnv(team_size, show_teammate_cards=True)
+    for seed in range(10):
+        rewards = _play_random(env, seed)
+
+        assert set(rewards) == set(env.possible_agents)
+        assert not env.agents
+        team1 = {rewards[f"player_{seat}"] for seat in range(0, 2 * team_size, 2)}
+        team2 = {rewards[f"player_{seat}"] for seat in range(1, 2 * team_size, 2)}
+        assert len(team1) == len(team2) == 1
+        assert team1.pop() == -team2.pop()
+
+
+def test_observation_includes_teammate_cards_only_when_enabled():
+    for show in (True, False):
+        env = TrucoAECEnv(2, show_teammate_cards=show)
+        env.reset(seed=0, options={"mano": "player_0"})
+
+        obs = env.observe("player_0")["observation"]
+        teammate = env.round.seats.players[2]
+        assert obs[OBS_HAND].tolist() == [c.id for c in env.round.seats.players[0].cards]
+        mate_slots = obs[OBS_TEAMMATE_CARDS : OBS_TEAMMATE_CARDS + 3].tolist()
+        expected = [c.id for c in teammate.cards] if show else [EMPTY_CARD] * 3
+        assert mate_slots == expected
+
+
+def test_only_acting_agent_gets_a_mask():
+    env = TrucoAECEnv(2)
+    env.reset(seed=1)
+
+    assert env.observe(env.agent_selection)["action_mask"].any()
+    waiting = next(agent for agent in env.agents if agent != env.agent_selection)
+    assert not env.observe(waiting)["action_mask"].any()
+
+
+def test_step_does_not_build_observations(monkeypatch):
+    env = TrucoAECEnv(3)
+    calls = []
+    original = env.observe
+    monkeypatch.setattr(env, "observe", lambda agent: calls.append(agent) or original(agent))
+    env.reset(seed=2)
+    rng = np.random.default_rng(2)
+    steps = 0
+    while not env.round.is_done:
+        env.step(int(rng.choice(np.flatnonzero(original(env.agent_selection)["action_mask"]))))
+        steps += 1
+
+    assert steps > 0
+    assert calls == []
+
+
+def test_terminated_agent_must_be_stepped_with_none():
+    env = TrucoAECEnv(1)
+    env.reset(seed=0)
+    rng = np.random.default_rng(0)
+    while not env.round.is_done:
+        env.step(int(rng.choice(np.flatnonzero(env.observe(env.agent_selection)["action_mask"]))))
+
+    with pytest.raises(ValueError, match="step it with None"):
+        env.step(0)
+    env.step(None)
+    assert len(env.agents) == 1
+
+
+def test_illegal_action_and_team_size_are_rejected():
+    env = TrucoAECEnv(1)
+    env.reset(seed=0)
+    with pytest.raises(ValueError, match="Invalid action"):
+        env.step(99)
+    with pytest.raises(ValueError, match="team_size"):
+        TrucoAECEnv(4)
+
+
+def test_one_vs_one_observation_matches_truco_env():
+    aec_env = TrucoAECEnv(team_size=1)
+    aec_env.reset(seed=4, options={"mano": "player_0"})
+    single_env = TrucoEnv()
+    obs, _ = single_env.reset(seed=4, options={"agent_starts": True})
+
+    aec_obs = aec_env.observe("player_0")["observation"]
+    assert aec_env.observation_space("player_0")["observation"] == single_env.observation_space
+    assert aec_obs.tolist() == obs.tolist()
@@ -0,0 +1,73 @@
+import gymnasium as gym
+import numpy as np
+import pytest
+
+from envs.registration import TRUCO_ENV_ID, register_envs
+from envs.table import EMPTY_CARD, OBS_HAND, OBS_MUESTRA
+from envs.truco_env import TrucoEnv
+from schemas.actions import actions_from_mask, mask_to_vector
+
+
+def _play_episode(env: TrucoEnv, seed: int) -> list[tuple[list[int], float]]:
+    obs, info = env.reset(seed=seed)
+    rng = np.random.default_rng(seed)
+    trace = [(obs.tolist(), 0.0)]
+    terminated = False
+    while not terminated:
+        legal = np.flatnonzero(info["action_mask"])
+        obs, reward, terminated, truncated, info = env.step(int(rng.choice(legal)))
+        assert not truncated
+        trace.append((obs.tolist(), reward))
+    return trace
+
+
+def test_reset_observes_agent_hand_and_mask():
+    env = TrucoEnv()
+    obs, info = env.reset(seed=3)
+
+    assert env.observation_space.contains(obs)
+    hand = [card.id for card in env.round.seats.players[0].cards]
+    assert obs[OBS_HAND].tolist() == hand
+    assert obs[OBS_MUESTRA] != EMPTY_CARD
+    mask = env.round.current_action_mask()
+    assert env.round.current_player is env.round.seats.players[0]
+    assert np.array_equal(info["action_mask"], mask_to_vector(mask))
+    assert actions_from_mask(mask)
+
+
+def test_episodes_terminate_with_reward():
+    env = TrucoEnv()
+    for seed in range(30):
+        trace = _play_episode(env, seed)
+        assert env.round.is_done
+        agent_points, rival_points = env.round.result()
+        assert trace[-1][1] == agent_points - rival_points
+        assert not env.unwrapped._mask.any()  # noqa: SLF001
+
+
+def test_seeded_episodes_are_reproducible():
+    assert _play_episode(TrucoEnv(), 11) == _play_episode(TrucoEnv(), 11)
+
+
+def test_illegal_action_raises():
+    env = TrucoEnv()
+    _, info = env.reset(seed=0)
+    illegal = int(np.flatnonzero(info["action_mask"] == 0)[0])
+
+    with pytest.raises(ValueError, match="Invalid action"):
+        env.step(illegal)
+
+
+def test_agent_starts_option():
+    env = TrucoEnv()
+    env.reset(seed=0, options={"agent_starts": False})
+    assert env.round.starting_player is env.round.seats.players[1]
+
+
+def test_registered_env_can_be_made():
+    register_envs()
+    register_envs()
+
+    env = gym.make(TRUCO_ENV_ID)
+    obs, _ = env.reset(seed=0)
+    assert env.observation_space.contains(obs)
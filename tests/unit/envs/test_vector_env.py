@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+from envs.truco_env import TrucoEnv
+from envs.vector_env import TrucoVectorEnv
+
+
+def _random_actions(masks: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    return np.array([rng.choice(np.flatnonzero(row)) for row in masks])
+
+
+def test_reset_returns_batched_arrays():
+    env = TrucoVectorEnv(4, seed=0)
+    obs, masks = env.reset(seed=1)
+
+    assert obs.shape == (4, env.single_observation_space.shape[0])
+    assert masks.shape == (4, env.single_action_space.n)
+    assert env.observation_space.contains(obs)
+    assert masks.any(axis=1).all()
+
+
+def test_step_auto_resets_finished_tables():
+    env = TrucoVectorEnv(8, seed=2)
+    rng = np.random.default_rng(2)
+    finished = 0
+    for _ in range(200):
+        obs, rewards, dones, masks = env.step(_random_actions(env.masks, rng))
+        assert env.observation_space.contains(obs)
+        assert (rewards[~dones] == 0).all()
+        # Finished tables are dealt a new round, so every table awaits an action.
+        assert masks.any(axis=1).all()
+        finished += int(dones.sum())
+    assert finished > 0
+
+
+def test_seeded_runs_are_reproducible():
+    def run() -> list[float]:
+        env = TrucoVectorEnv(3, seed=5)
+        rng = np.random.default_rng(5)
+        totals = []
+        for _ in range(50):
+            _, rewards, _, _ = env.step(_random_actions(env.masks, rng))
+            totals.append(float(rewards.sum()))
+        return totals
+
+    assert run() == run()
+
+
+def test_table_deals_match_single_env():
+    vector_env = TrucoVectorEnv(2, seed=7)
+    single_env = TrucoEnv()
+    single_env.reset(seed=8)
+
+    hand = [card.id for card in single_env.round.seats.players[0].cards]
+    vector_hand = vector_env.observations[1, :3].tolist()
+    assert sorted(hand) == sorted(vector_hand)
+
+
+def test_step_rejects_bad_shape_and_illegal_actions():
+    env = TrucoVectorEnv(2, seed=0)
+    with pytest.raises(ValueError, match="shape"):
+        env.step(np.zeros(3, dtype=np.int64))
+
+    illegal = np.array([np.flatnonzero(row == 0)[0] for row in env.masks])
+    with pytest.raises(ValueError, match="Invalid action"):
+        env.step(illegal)
+
+
+def test_num_envs_must_be_positive():
+    with pytest.raises(ValueError, match="num_envs"):
+        TrucoVectorEnv(0)
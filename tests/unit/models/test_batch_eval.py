@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+
+from models.batch_eval import batch_envido, batch_flor, batch_ranks
+from models.card import ALL_CARDS, Card, rank
+from models.envido import calculate_envido, has_flor
+from models.hand_tables import all_hands
+
+
+@pytest.mark.parametrize("muestra", [Card(10, "oro"), Card(2, "oro"), Card(12, "copa")])
+def test_matches_scalar_rules_for_every_hand(muestra):
+    hands = all_hands()
+    muestras = np.full(len(hands), muestra.id)
+    envido = batch_envido(hands, muestras)
+    flor = batch_flor(hands, muestras)
+    for row, (a, b, c) in enumerate(hands):
+        cards = [ALL_CARDS[a], ALL_CARDS[b], ALL_CARDS[c]]
+        assert envido[row] == calculate_envido(cards, muestra)
+        assert flor[row] == has_flor(cards, muestra)
+
+
+def test_batch_ranks():
+    cards = np.array([[0, 1, 2], [37, 38, 39]])
+    muestras = np.array([5, 20])
+    ranks = batch_ranks(cards, muestras)
+    assert ranks.shape == (2, 3)
+    for i in range(2):
+        for j in range(3):
+            assert ranks[i, j] == rank(cards[i, j], muestras[i])
+
+
+def test_rejects_wrong_hand_size():
+    with pytest.raises(ValueError, match="last axis"):
+        batch_envido(np.zeros((4, 2), dtype=int), np.zeros(4, dtype=int))
@@ -1,4 +1,10 @@
-from models.card import Card
+import copy
+import pickle
+
+import pytest
+
+from models.card import Card, compare, rank
+from schemas.constants import CardNumber, CardSuit
 
 
 def test_card_initialization():
@@ -81,3 +87,38 @@ def test_is_greater_than():
     assert c_2_oro.is_greater_than(c_1_esp, muestra) is True
     assert c_1_esp.is_greater_than(c_3_esp, muestra) is True
     assert c_3_esp.is_greater_than(c_2_oro, muestra) is False
+
+
+def test_card_ids_are_unique_and_dense():
+    ids = {Card(number, suit).id for number in CardNumber.__args__ for suit in CardSuit.__args__}
+    assert ids == set(range(40))
+    assert Card(1, "basto").id == 0
+    assert Card(12, "copa").id == 39
+
+
+def test_rank_table_matches_reference_values():
+    cards = [Card(number, suit) for number in CardNumber.__args__ for suit in CardSuit.__args__]
+    for muestra in cards:
+        for card in cards:
+            assert rank(card.id, muestra.id) == card.compute_card_value(muestra)
+
+
+def test_compare():
+    muestra = Card(10, "oro")
+    assert compare(Card(2, "oro").id, Card(1, "espadas").id, muestra.id) == 1
+    assert compare(Card(3, "espadas").id, Card(2, "oro").id, muestra.id) == -1
+    assert compare(Card(3, "espadas").id, Card(3, "basto").id, muestra.id) == 0
+
+
+def test_cards_are_interned_and_immutable():
+    card = Card(7, "oro")
+    assert card is Card(7, "oro")
+    assert Card.from_id(card.id) is card
+    assert card == Card.from_id(card.id)
+    assert card != Card(7, "copa")
+    assert copy.deepcopy(card) is card
+    assert pickle.loads(pickle.dumps(card)) is card
+    with pytest.raises(AttributeError):
+        card.number = 6
+    with pytest.raises(ValueError, match="Invalid card"):
+        Card(8, "oro")
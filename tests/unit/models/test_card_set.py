@@ -0,0 +1,22 @@
+from models.card import Card
+from models.card_set import CARD_BITS, EMPTY_SET, FULL_DECK, card_ids_of, card_set, cards_of
+
+
+def test_full_deck_has_forty_cards():
+    assert FULL_DECK.bit_count() == 40
+    assert card_ids_of(FULL_DECK) == list(range(40))
+
+
+def test_card_set_round_trip():
+    cards = [Card(3, "oro"), Card(1, "basto"), Card(12, "copa")]
+    mask = card_set(cards)
+    assert mask.bit_count() == 3
+    assert cards_of(mask) == sorted(cards, key=lambda c: c.id)
+    assert card_set([]) == EMPTY_SET
+
+
+def test_set_operations():
+    hand = card_set([Card(1, "espadas"), Card(7, "oro")])
+    assert hand & CARD_BITS[Card(7, "oro").id]
+    assert not hand & CARD_BITS[Card(7, "copa").id]
+    assert (FULL_DECK & ~hand).bit_count() == 38
@@ -0,0 +1,85 @@
+import random
+
+import pytest
+
+from models.deal_rng import DRAWS_PER_ROUND, DealRng
+from models.deck import Deck
+from models.game import Game
+from models.player import Player
+from models.round import Round
+
+
+def _deal(rng: DealRng, round_index: int) -> list[int]:
+    rng.start_round(round_index)
+    deck = Deck(rng)
+    return [card.id for card in deck.draw(7)]
+
+
+def test_round_draws_are_addressed_by_index():
+    sequential = DealRng(9)
+    draws = [sequential.randrange(1000) for _ in range(200 * DRAWS_PER_ROUND)]
+
+    for round_index in (0, 1, 63, 64, 150):
+        rng = DealRng(9)
+        rng.start_round(round_index)
+        start = round_index * DRAWS_PER_ROUND
+        assert [rng.randrange(1000) for _ in range(5)] == draws[start : start + 5]
+
+
+def test_deals_regenerate_from_index_in_any_order():
+    forward = DealRng(4)
+    deals = [_deal(forward, index) for index in range(100)]
+
+    backward = DealRng(4)
+    assert [_deal(backward, index) for index in reversed(range(100))] == deals[::-1]
+
+
+def test_seeds_and_streams_are_independent():
+    base = _deal(DealRng(1), 0)
+    assert _deal(DealRng(2), 0) != base
+    assert _deal(DealRng(1, stream=1), 0) != base
+
+
+def test_generator_starts_at_round_draws():
+    rng = DealRng(5)
+    rng.start_round(3)
+    first = rng.randrange(1 << 20)
+
+    word = int(DealRng(5).generator(3).bit_generator.random_raw())
+    assert first == int((word >> 11) * 2.0**-53 * (1 << 20))
+
+
+def test_rejects_negative_seed():
+    with pytest.raises(ValueError, match="non-negative"):
+        DealRng(-1)
+
+
+def test_forked_round_deals_do_not_advance_the_stream():
+    a, b = Player("A"), Player("B")
+    rng = DealRng(4)
+    rng.start_round(0)
+    round_obj = Round([a], [b], [a, b], None, starting_player=a, dealer=Deck(rng))
+    fork = round_obj.fork()
+    fork.reset(fork.seats.players[0])
+    fork_hands = [player.cards.copy() for player in fork.seats.players]
+
+    round_obj.reset(a)
+    assert [player.cards for player in round_obj.seats.players] == fork_hands
+    assert rng.copy().randrange(DRAWS_PER_ROUND) == rng.randrange(DRAWS_PER_ROUND)
+
+
+def test_game_deals_are_reproducible():
+    def play(seed: int) -> tuple[int, int]:
+        team1, team2 = [Player("A")], [Player("B")]
+        choices = random.Random(0)
+        game = Game(
+            team1,
+            team2,
+            lambda _player, _state, actions: choices.choice(actions),
+            deal_rng=DealRng(seed),
+        )
+        game.play_game(target_points=15)
+        assert game.rounds_played > 0
+        return game.team1_score, game.team2_score
+
+    assert play(3) == play(3)
@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+
+from models.dealer import CorpusDealer, generate_deals, load_deals, save_deals
+from models.player import Player
+from models.round import Round
+from models.rules import get_rules
+
+
+def test_generate_deals_rows_are_distinct_cards():
+    deals = generate_deals(1000, 4, seed=1)
+
+    assert deals.shape == (1000, 13)
+    assert deals.dtype == np.uint8
+    assert deals.max() < 40
+    assert all(len(set(row)) == 13 for row in deals.tolist())
+    assert np.array_equal(deals, generate_deals(1000, 4, seed=1))
+    assert not np.array_equal(deals, generate_deals(1000, 4, seed=2))
+
+
+def test_generate_deals_rejects_too_many_players():
+    with pytest.raises(ValueError, match="Cannot deal"):
+        generate_deals(10, 14, seed=0)
+
+
+def test_save_and_memory_map_deals(tmp_path):
+    deals = generate_deals(50, 2, seed=3)
+    path = save_deals(tmp_path / "corpus" / "deals.npy", deals)
+
+    loaded = load_deals(path)
+    assert isinstance(loaded, np.memmap)
+    assert np.array_equal(loaded, deals)
+
+
+def test_load_deals_rejects_other_arrays(tmp_path):
+    path = tmp_path / "bad.npy"
+    np.save(path, np.zeros((3, 6), dtype=np.uint8))
+    with pytest.raises(ValueError, match="Unexpected deals"):
+        load_deals(path)
+
+
+def test_round_replays_corpus_deals():
+    deals = generate_deals(3, 2, seed=4)
+    a, b = Player("A"), Player("B")
+    round_obj = Round([a], [b], [a, b], None, starting_player=a, dealer=CorpusDealer(deals))
+
+    for row in deals.tolist():
+        assert [c.id for c in a.cards] == row[0:3]
+        assert [c.id for c in b.cards] == row[3:6]
+        assert round_obj.muestra is not None
+        assert round_obj.muestra.id == row[6]
+        if round_obj.dealer.position < len(deals):
+            round_obj.reset(a)
+
+    with pytest.raises(ValueError, match="exhausted"):
+        round_obj.reset(a)
+
+
+def test_corpus_dealer_checks_table_size_and_skips_muestra():
+    dealer = CorpusDealer(generate_deals(2, 2, seed=5))
+    with pytest.raises(ValueError, match="cannot deal 4 hands"):
+        dealer.deal(4, with_muestra=True)
+
+    hands, muestra = dealer.deal(2, with_muestra=False)
+    assert muestra is None
+    assert [len(hand) for hand in hands] == [3, 3]
+
+
+def test_fork_copies_dealer_position():
+    a, b = Player("A"), Player("B")
+    dealer = CorpusDealer(generate_deals(4, 2, seed=6))
+    round_obj = Round([a], [b], [a, b], None, starting_player=a, rules=get_rules(), dealer=dealer)
+    fork = round_obj.fork()
+
+    fork.reset(fork.seats.players[0])
+    assert dealer.position == 1
+    assert fork.dealer.position == 2
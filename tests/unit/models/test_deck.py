@@ -1,5 +1,8 @@
+import random
+
 import pytest
 
+from models.deal_rng import DealRng
 from models.deck import Deck
 
 
@@ -36,3 +39,37 @@ def test_draw_too_many():
     deck = Deck()
     with pytest.raises(ValueError):
         deck.draw(41)
+
+
+def test_reset():
+    deck = Deck()
+    deck.draw(13)
+    deck.reset()
+    assert len(deck.cards) == 40
+    assert {c.id for c in deck.cards} == set(range(40))
+    assert len(deck.draw(40)) == 40
+
+
+def test_draws_are_distinct_across_calls():
+    deck = Deck()
+    drawn = [card.id for _ in range(13) for card in deck.draw(3)]
+    assert len(set(drawn)) == 39
+
+
+def test_copy_draws_from_its_own_stream():
+    deck = Deck(DealRng(3))
+    copy = deck.copy()
+    copy_deal = copy.deal(2, with_muestra=True)
+
+    assert deck.deal(2, with_muestra=True) == copy_deal
+    assert copy.deal(2, with_muestra=True) == deck.deal(2, with_muestra=True)
+
+
+def test_copy_without_copyable_source_refuses_to_draw():
+    rng = random.Random(0)
+    copy = Deck(rng).copy()
+    state = rng.getstate()
+
+    with pytest.raises(ValueError, match="own random source"):
+        copy.deal(2, with_muestra=True)
+    assert rng.getstate() == state
@@ -127,7 +127,7 @@ def test_flor_scoring_real():
     # A1 has flor
     a1_cards = [Card(1, "espadas"), Card(2, "espadas"), Card(3, "espadas")]
     players[0].cards = list(a1_cards)
-    round_inst.round_state.player_initial_hands[players[0]] = list(a1_cards)
+    round_inst._record_initial_hands()
 
     round_inst.round_state.flor_calls.append(players[0])
 
@@ -151,7 +151,7 @@ def test_flor_scoring_fake():
     # A1 does NOT have flor
     a1_cards = [Card(1, "espadas"), Card(2, "copa"), Card(3, "basto")]
     players[0].cards = list(a1_cards)
-    round_inst.round_state.player_initial_hands[players[0]] = list(a1_cards)
+    round_inst._record_initial_hands()
 
     round_inst.round_state.flor_calls.append(players[0])
 
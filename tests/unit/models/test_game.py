@@ -75,3 +75,25 @@ def test_play_game(mock_round_class, teams, mock_action_provider):
     assert winner == 1
     assert game.team1_score == 12
     assert game.team2_score == 3
+
+
+class _RoundAwareProvider(Mock):
+    def set_round(self, round_obj):
+        self.rounds.append(round_obj)
+
+
+@patch("models.game.Round")
+def test_play_round_reuses_round(mock_round_class, teams):
+    team1, team2 = teams
+    provider = _RoundAwareProvider()
+    provider.rounds = []
+    game = Game(team1, team2, provider)
+    mock_round_instance = mock_round_class.return_value
+    mock_round_instance.play_round.return_value = (1, 0)
+
+    game.play_round()
+    game.play_round()
+
+    mock_round_class.assert_called_once()
+    assert provider.rounds == [mock_round_instance]
+    mock_round_instance.reset.assert_called_once_with(game.ordered_players[1])
@@ -0,0 +1,88 @@
+import random
+from itertools import combinations
+
+import numpy as np
+import pytest
+
+from models import batch_eval
+from models.batch_eval import rules_digest
+from models.card import ALL_CARDS, Card
+from models.envido import calculate_envido, has_flor
+from models.hand_tables import (
+    HAND_COUNT,
+    build_hand_tables,
+    get_hand_tables,
+    hand_envido,
+    hand_has_flor,
+    hand_index,
+    hand_tables_path,
+    load_hand_tables,
+    save_hand_tables,
+)
+from schemas.constants import HAND_TABLES_DIR_ENV
+
+
+@pytest.fixture(autouse=True)
+def tables_dir(tmp_path, monkeypatch):
+    directory = tmp_path / "tables"
+    monkeypatch.setenv(HAND_TABLES_DIR_ENV, str(directory))
+    get_hand_tables.cache_clear()
+    yield directory
+    get_hand_tables.cache_clear()
+
+
+def test_hand_index_is_a_dense_bijection():
+    indices = {hand_index(a, b, c) for a, b, c in combinations(range(40), 3)}
+    assert indices == set(range(HAND_COUNT))
+    assert hand_index(5, 1, 30) == hand_index(30, 5, 1)
+
+
+def test_lookups_match_reference_rules():
+    rng = random.Random(7)
+    for _ in range(2000):
+        *hand, muestra = rng.sample(ALL_CARDS, 4)
+        ids = [c.id for c in hand]
+        assert hand_envido(*ids, muestra.id) == calculate_envido(hand, muestra)
+        assert hand_has_flor(*ids, muestra.id) == has_flor(hand, muestra)
+
+
+def test_known_hands():
+    muestra = Card(2, "oro")
+    hand = [Card(12, "oro"), Card(7, "espadas"), Card(1, "basto")]
+    assert hand_envido(*(c.id for c in hand), muestra.id) == 37
+    flor = [Card(12, "oro"), Card(1, "espadas"), Card(7, "espadas")]
+    assert hand_has_flor(*(c.id for c in flor), muestra.id)
+
+
+def test_save_and_memory_map(tmp_path):
+    tables = build_hand_tables()
+    path = save_hand_tables(tmp_path / "tables.npy", tables)
+    loaded = load_hand_tables(path)
+    assert isinstance(loaded, np.memmap)
+    assert np.array_equal(loaded, tables)
+
+
+def test_first_build_is_saved_and_memory_mapped(tables_dir):
+    tables = get_hand_tables()
+    path = hand_tables_path()
+
+    assert path.parent == tables_dir
+    assert isinstance(tables, np.memmap)
+    assert np.array_equal(tables, build_hand_tables())
+    assert list(tables_dir.iterdir()) == [path]
+
+
+def test_tables_saved_under_other_rules_are_not_loaded(tables_dir, monkeypatch):
+    save_hand_tables(hand_tables_path(), np.zeros_like(build_hand_tables()))
+    monkeypatch.setattr("models.hand_tables.rules_digest", lambda: "changed-rules")
+
+    assert np.array_equal(get_hand_tables(), build_hand_tables())
+    assert len(list(tables_dir.iterdir())) == 2
+
+
+def test_rules_digest_tracks_lookup_arrays(monkeypatch):
+    digest = rules_digest()
+    ranks = batch_eval._RANKS.copy()
+    ranks[0] += 1
+    monkeypatch.setattr(batch_eval, "_RANKS", ranks)
+    assert rules_digest() != digest
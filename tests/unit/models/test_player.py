@@ -1,6 +1,7 @@
 import pytest
 
 from models.card import Card
+from models.card_set import card_set
 from models.player import Player
 
 
@@ -41,3 +42,19 @@ def test_play_card_no_cards():
     player = Player("A1")
     with pytest.raises(ValueError, match="No cards in hand"):
         player.play_card(0)
+
+
+def test_masks_track_hand_and_plays():
+    player = Player("A1")
+    card1 = Card(1, "espadas")
+    card2 = Card(2, "espadas")
+    player.receive_hand([card1, card2])
+    assert player.hand_mask == card_set([card1, card2])
+
+    player.play_card(1)
+    assert player.hand_mask == card_set([card1])
+    assert player.played_mask == card_set([card2])
+
+    player.receive_hand([card2])
+    assert player.played_cards == []
+    assert player.played_mask == 0
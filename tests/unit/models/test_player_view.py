@@ -0,0 +1,61 @@
+from unittest.mock import Mock
+
+import pytest
+
+from models.card import Card
+from models.player import Player
+from models.player_view import PlayerView
+from models.round import Round
+from schemas.actions import ActionCode
+from schemas.player_state import PlayerState
+
+
+@pytest.fixture
+def players():
+    return [Player("A1"), Player("B1"), Player("A2"), Player("B2")]
+
+
+def _make_round(players, provider, **kwargs):
+    return Round(
+        team1=[players[0], players[2]],
+        team2=[players[1], players[3]],
+        ordered_players=players,
+        action_provider=provider,
+        starting_player=players[0],
+        **kwargs,
+    )
+
+
+def test_view_reads_live_round_data(players):
+    round_inst = _make_round(players, Mock())
+    view = round_inst.get_player_view(players[0])
+    assert view is round_inst.get_player_view(players[0])
+    assert view.round_state is round_inst.round_state
+    assert view.teammate_cards is None
+
+    players[0].cards = [Card(1, "espadas")]
+    assert view.player_cards == [Card(1, "espadas")]
+    round_inst.round_state.truco_state = "truco"
+    assert view.round_state.truco_state == "truco"
+
+
+def test_view_teammate_cards(players):
+    round_inst = _make_round(players, Mock(), show_teammate_cards=True)
+    view = round_inst.get_player_view(players[0])
+    assert view.teammate_cards == players[2].cards
+
+    state = view.to_state()
+    assert isinstance(state, PlayerState)
+    assert state.player_cards == players[0].cards
+    assert state.teammate_cards == players[2].cards
+
+
+@pytest.mark.parametrize(
+    ("validate_states", "expected_type"), [(False, PlayerView), (True, PlayerState)]
+)
+def test_provider_receives_view_or_validated_state(players, validate_states, expected_type):
+    provider = Mock(return_value=ActionCode.PLAY_CARD_0)
+    round_inst = _make_round(players, provider, validate_states=validate_states)
+    round_inst._handle_player_turn(players[0])
+    _, player_state, _ = provider.call_args.args
+    assert isinstance(player_state, expected_type)
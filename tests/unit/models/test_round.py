@@ -1,11 +1,18 @@
+import logging
+import random
 from unittest.mock import Mock
 
 import pytest
 
+from exceptions.truco_rejected import TrucoRejectedError
+from logging_config import set_headless
 from models.card import Card
+from models.card_set import CARD_BITS
+from models.deck import Deck
+from models.envido import calculate_envido, has_flor
 from models.player import Player
-from models.round import Round
-from schemas.actions import ActionCode
+from models.round import NO_CARD, Round
+from schemas.actions import ActionCode, actions_from_mask, mask_from_actions
 
 
 @pytest.fixture
@@ -109,6 +116,9 @@ def test_play_hand_simple(round_instance, players, mock_action_provider):
 
     winner = round_instance._play_hand(players[0])
     assert winner == players[0]
+    played = [Card(1, "espadas"), Card(4, "copa"), Card(4, "basto"), Card(3, "oro")]
+    assert round_instance.trick_plays[:4] == [card.id for card in played]
+    assert round_instance.trick_plays[4:] == [NO_CARD] * 8
 
 
 def test_play_hand_tie(round_instance, players, mock_action_provider):
@@ -157,3 +167,427 @@ def test_get_team_pie(round_instance, players):
     round_instance._starting_player = players[3]
     assert round_instance._get_team_pie(2).name == "B1"
     assert round_instance._get_team_pie(1).name == "A2"
+
+
+def test_unseen_cards(round_instance, players, mock_action_provider):
+    own = players[0].hand_mask
+    unseen = round_instance.unseen_cards(players[0])
+    assert unseen.bit_count() == 40 - 3 - 1
+    assert not unseen & own
+    assert not unseen & CARD_BITS[round_instance.muestra.id]
+
+    mock_action_provider.return_value = ActionCode.PLAY_CARD_0
+    played = players[1].cards[0]
+    round_instance._handle_player_turn(players[1])
+    assert round_instance.played_mask == CARD_BITS[played.id]
+    assert not round_instance.unseen_cards(players[0]) & CARD_BITS[played.id]
+
+
+def test_hands_are_evaluated_once_at_deal(round_instance, players):
+    for seat, player in enumerate(players):
+        hand = round_instance.round_state.player_initial_hands[player]
+        assert round_instance.hand_envido[seat] == calculate_envido(hand, round_instance.muestra)
+        assert round_instance.hand_flor[seat] == has_flor(hand, round_instance.muestra)
+        piezas = sum(card.is_pieza(round_instance.muestra) for card in hand)
+        assert round_instance.hand_piezas[seat] == piezas
+
+
+def test_legal_action_mask(round_instance, players):
+    player = players[0]
+    mask = round_instance.legal_action_mask(player)
+    assert actions_from_mask(mask) == [
+        ActionCode.PLAY_CARD_0,
+        ActionCode.PLAY_CARD_1,
+        ActionCode.PLAY_CARD_2,
+        ActionCode.OFFER_TRUCO,
+        ActionCode.FLOR,
+        ActionCode.OFFER_ENVIDO,
+    ]
+    assert round_instance._get_available_actions(player) == actions_from_mask(mask)
+    assert round_instance.legal_action_vector(player).tolist() == [
+        bool(mask >> code & 1) for code in ActionCode
+    ]
+
+    player.play_card(0)
+    round_instance.round_state.truco_state = "vale4"
+    assert actions_from_mask(round_instance.legal_action_mask(player)) == [
+        ActionCode.PLAY_CARD_0,
+        ActionCode.PLAY_CARD_1,
+    ]
+
+
+class _MaskedProvider:
+    def __init__(self, action):
+        self.action = action
+        self.masks = []
+
+    def __call__(self, player, player_state, available):
+        raise AssertionError("select_masked should be preferred")
+
+    def select_masked(self, player, player_state, mask):
+        self.masks.append(mask)
+        return self.action
+
+
+def test_request_action_uses_masked_provider(players):
+    provider = _MaskedProvider(ActionCode.PLAY_CARD_1)
+    round_inst = Round(
+        team1=[players[0], players[2]],
+        team2=[players[1], players[3]],
+        ordered_players=players,
+        action_provider=provider,
+        starting_player=players[0],
+    )
+    card = players[0].cards[1]
+    expected_mask = mask_from_actions(round_inst._get_available_actions(players[0]))
+    assert round_inst._handle_player_turn(players[0]) == card
+    assert provider.masks == [expected_mask]
+
+    provider.action = ActionCode.ACCEPT_TRUCO
+    with pytest.raises(ValueError, match="Invalid action"):
+        round_inst._handle_player_turn(players[1])
+
+
+def test_handle_player_turn_raises_on_truco_rejection(
+    round_instance, players, mock_action_provider
+):
+    mock_action_provider.side_effect = [
+        ActionCode.OFFER_TRUCO,
+        ActionCode.REJECT_TRUCO,
+    ]
+
+    with pytest.raises(TrucoRejectedError) as error:
+        round_instance._handle_player_turn(players[0])
+
+    assert error.value.winning_player is players[0]
+    assert round_instance.is_done
+
+
+def test_reset_reuses_round(round_instance, players, mock_action_provider):
+    mock_action_provider.return_value = ActionCode.PLAY_CARD_0
+    round_instance.round_state.truco_state = "truco"
+    round_instance.round_state.flor_calls.append(players[0])
+    round_instance._handle_player_turn(players[1])
+    state = round_instance.round_state
+
+    round_instance.reset(players[1])
+
+    assert round_instance.round_state is state
+    assert state.truco_state == "nada"
+    assert state.flor_calls == []
+    assert state.cards_played_this_round == {}
+    assert round_instance.played_mask == 0
+    assert round_instance.trick_plays == [NO_CARD] * 12
+    assert round_instance._starting_player is players[1]
+    assert len(round_instance.dealer) == 40 - 4 * 3 - 1
+    for player in players:
+        assert len(player.cards) == 3
+        assert player.played_cards == []
+        assert state.player_initial_hands[player] == player.cards
+
+
+def _play_out(round_inst, rng):
+    while not round_inst.is_done:
+        round_inst.step(rng.choice(actions_from_mask(round_inst.current_action_mask())))
+    return round_inst.result()
+
+
+def test_step_plays_a_round_to_completion(round_instance):
+    rng = random.Random(0)
+    assert round_instance.current_player is round_instance.seats.players[0]
+    team_1_points, team_2_points = _play_out(round_instance, rng)
+    assert round_instance.current_player is None
+    assert round_instance.current_action_mask() == 0
+    assert team_1_points > 0 or team_2_points > 0
+    with pytest.raises(ValueError, match="Invalid action"):
+        round_instance.step(ActionCode.PLAY_CARD_0)
+
+
+def test_headless_round_skips_logging_calls(round_instance, players, monkeypatch):
+    failing_logger = Mock(isEnabledFor=logging.getLogger("models.round").isEnabledFor)
+    monkeypatch.setattr("models.round.logger", failing_logger)
+    results_logger = logging.getLogger("tests.headless_results")
+    results_logger.setLevel(logging.INFO)
+    set_headless()
+    try:
+        assert results_logger.isEnabledFor(logging.INFO)
+        for seed in range(10):
+            round_instance.reset(players[seed % 4])
+            _play_out(round_instance, random.Random(seed))
+    finally:
+        set_headless(enabled=False)
+
+    failing_logger.info.assert_not_called()
+    failing_logger.debug.assert_not_called()
+
+
+def test_truco_counter_bid_stops_below_vale4(round_instance, players):
+    round_instance.step(ActionCode.OFFER_TRUCO)  # A1 bids truco, B2 (Pie) answers
+    assert round_instance.current_player is players[3]
+    round_instance.step(ActionCode.OFFER_TRUCO)  # retruco, A2 (Pie) answers
+    assert round_instance.current_player is players[2]
+    # Countering retruco would bid vale4, leaving nothing to counter afterwards
+    assert round_instance.current_action_mask() >> ActionCode.OFFER_TRUCO & 1
+    round_instance.step(ActionCode.OFFER_TRUCO)
+    assert round_instance.round_state.truco_state == "retruco"
+    assert not round_instance.current_action_mask() >> ActionCode.OFFER_TRUCO & 1
+    round_instance.step(ActionCode.ACCEPT_TRUCO)
+    assert round_instance.round_state.truco_state == "vale4"
+    assert round_instance.current_player is players[0]
+
+
+def test_fork_is_independent(round_instance, players):
+    round_instance.step(ActionCode.FLOR)
+    round_instance.step(ActionCode.PLAY_CARD_0)
+    hand = list(players[1].cards)
+    state_before = round_instance.round_state.snapshot()
+
+    fork = round_instance.fork()
+    assert fork.seats.trick_orders is round_instance.seats.trick_orders
+    assert fork.muestra is round_instance.muestra
+    assert fork.current_player.name == "B1"
+    assert [p.name for p in fork.round_state.flor_calls] == ["A1"]
+
+    points = _play_out(fork, random.Random(1))
+    assert fork.is_done
+    assert sum(points) > 0
+
+    assert not round_instance.is_done
+    assert players[1].cards == hand
+    assert round_instance.current_player is players[1]
+    assert round_instance.round_state.snapshot() == state_before
+    assert all(p in round_instance.seats.seat_of for p in round_instance.round_state.flor_calls)
+
+
+def _signature(round_inst):
+    return (
+        round_inst.round_state.snapshot(),
+        [list(p.cards) for p in round_inst.seats.players],
+        [list(p.played_cards) for p in round_inst.seats.players],
+        [(p.hand_mask, p.played_mask) for p in round_inst.seats.players],
+        list(round_inst.trick_plays),
+        round_inst.played_mask,
+        round_inst.last_truco_bidder,
+        round_inst.current_player,
+        round_inst.current_action_mask(),
+    )
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_apply_and_undo_restore_every_position(round_instance, seed):
+    rng = random.Random(seed)
+    signatures = []
+    while not round_instance.is_done:
+        signatures.append(_signature(round_instance))
+        round_instance.apply(rng.choice(actions_from_mask(round_instance.current_action_mask())))
+    points = round_instance.result()
+
+    for expected in reversed(signatures):
+        round_instance.undo()
+        assert _signature(round_instance) == expected
+    with pytest.raises(ValueError, match="No action to undo"):
+        round_instance.undo()
+
+    # Replaying the same actions reaches the same result
+    rng = random.Random(seed)
+    assert _play_out(round_instance, rng) == points
+
+
+def test_decisions_generator_interleaves_rounds():
+    rounds = []
+    for _ in range(2):
+        table = [Player("A1"), Player("B1")]
+        rounds.append(Round([table[0]], [table[1]], table, Mock(), starting_player=table[0]))
+    drivers = [round_inst.decisions() for round_inst in rounds]
+    pending = {i: next(driver) for i, driver in enumerate(drivers)}
+    results = {}
+    rng = random.Random(3)
+    while pending:
+        # Answer every pending decision as one batch, then advance all rounds in lockstep
+        actions = {i: rng.choice(actions_from_mask(mask)) for i, (_, _, mask) in pending.items()}
+        for i, action in actions.items():
+            player, view, _ = pending.pop(i)
+            assert view.player is player
+            try:
+                pending[i] = drivers[i].send(action)
+            except StopIteration as stop:
+                results[i] = stop.value
+    assert results == {i: round_inst.result() for i, round_inst in enumerate(rounds)}
+
+
+def test_decisions_generator_rejects_illegal_action(round_instance):
+    driver = round_instance.decisions()
+    next(driver)
+    with pytest.raises(ValueError, match="Invalid action"):
+        driver.send(ActionCode.ACCEPT_ENVIDO)
+
+
+class _ScriptedProvider:
+    def __init__(self):
+        self.asked = 0
+        self.forced: list[tuple[str, ActionCode]] = []
+
+    def __call__(self, player, player_state, available):
+        self.asked += 1
+        # Depends on the position only, so skipped calls cannot shift later choices.
+        if ActionCode.ACCEPT_TRUCO in available:
+            return ActionCode.ACCEPT_TRUCO
+        if ActionCode.OFFER_TRUCO in available and len(player.cards) == 2:
+            return ActionCode.OFFER_TRUCO
+        return available[0]
+
+    def observe_forced(self, player, player_state, action):
+        self.forced.append((player.name, action))
+
+
+def _play_seeded(seed, *, auto_forced_actions):
+    team1 = [Player("A1"), Player("A2")]
+    team2 = [Player("B1"), Player("B2")]
+    provider = _ScriptedProvider()
+    round_inst = Round(
+        team1,
+        team2,
+        [team1[0], team2[0], team1[1], team2[1]],
+        provider,
+        starting_player=team1[0],
+        dealer=Deck(random.Random(seed)),
+        auto_forced_actions=auto_forced_actions,
+    )
+    return round_inst.play_round(), provider
+
+
+def test_auto_forced_actions_skip_the_provider():
+    forced = 0
+    for seed in range(10):
+        asked_result, asked = _play_seeded(seed, auto_forced_actions=False)
+        auto_result, auto = _play_seeded(seed, auto_forced_actions=True)
+
+        assert auto_result == asked_result
+        assert asked.forced == []
+        assert auto.asked + len(auto.forced) == asked.asked
+        forced += len(auto.forced)
+    assert forced > 0
+
+
+def test_auto_forced_actions_are_not_yielded(round_instance):
+    round_instance.auto_forced_actions = True
+    driver = round_instance.decisions()
+    try:
+        _, _, mask = next(driver)
+        while True:
+            assert mask & (mask - 1)
+            _, _, mask = driver.send(actions_from_mask(mask)[0])
+    except StopIteration:
+        pass
+    assert round_instance.is_done
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_load_bytes_restores_every_position(round_instance, seed):
+    rng = random.Random(seed)
+    positions = []
+    while not round_instance.is_done:
+        positions.append((round_instance.to_bytes(), _signature(round_instance)))
+        round_instance.step(rng.choice(actions_from_mask(round_instance.current_action_mask())))
+    positions.append((round_instance.to_bytes(), _signature(round_instance)))
+    final_result = round_instance.result()
+
+    for data, signature in reversed(positions):
+        round_instance.load_bytes(data)
+        assert _signature(round_instance) == signature
+        assert round_instance.to_bytes() == data
+    round_instance.load_bytes(positions[-1][0])
+    assert round_instance.result() == final_result
+
+
+def test_from_bytes_continues_the_round():
+    a, b = Player("A"), Player("B")
+    original = Round([a], [b], [a, b], None, starting_player=b, dealer=Deck(random.Random(3)))
+    original.step(actions_from_mask(original.current_action_mask())[0])
+    data = original.to_bytes()
+    assert len(data) == 40
+
+    restored = Round.from_bytes(data, None, players=[Player("A"), Player("B")])
+    rng = random.Random(3)
+    while not original.is_done:
+        mask = original.current_action_mask()
+        assert restored.current_action_mask() == mask
+        assert restored.current_player.name == original.current_player.name
+        action = rng.choice(actions_from_mask(mask))
+        original.step(action)
+        restored.step(action)
+    assert restored.is_done
+    assert restored.result() == original.result()
+    assert restored.to_bytes() == original.to_bytes()
+
+
+def test_load_bytes_rejects_incompatible_snapshots(round_instance):
+    data = bytearray(round_instance.to_bytes())
+    a, b = Player("A"), Player("B")
+    two_seats = Round([a], [b], [a, b], None, starting_player=a)
+    with pytest.raises(ValueError, match="4-seat"):
+        two_seats.load_bytes(bytes(data))
+
+    data[0] += 1
+    with pytest.raises(ValueError, match="version"):
+        round_instance.load_bytes(bytes(data))
+    with pytest.raises(ValueError, match="players"):
+        Round.from_bytes(round_instance.to_bytes(), None, players=[a, b])
+
+
+def test_from_bytes_rejects_truncated_snapshots(round_instance):
+    data = round_instance.to_bytes()
+    for size in (0, 10, len(data) - 1):
+        with pytest.raises(ValueError, match="snapshot"):
+            Round.from_bytes(data[:size], None)
+    with pytest.raises(ValueError, match="must be"):
+        round_instance.load_bytes(data + b"\x00")
+
+
+def test_from_bytes_rejects_unknown_rules(round_instance):
+    data = bytearray(round_instance.to_bytes())
+    data[2] = 0xFE
+    with pytest.raises(ValueError, match="Unknown rules variant"):
+        Round.from_bytes(bytes(data), None)
+
+
+def _mid_round_snapshot(round_instance) -> bytes:
+    round_instance.step(ActionCode.FLOR)
+    round_instance.step(ActionCode.PLAY_CARD_0)
+    return round_instance.to_bytes()
+
+
+@pytest.mark.parametrize(
+    ("offset", "value", "match"),
+    [
+        (28, 200, "unknown or repeated cards"),  # card id past the deck
+        (29, "hand 0", "unknown or repeated cards"),  # card dealt twice
+        (3, 0xFF, "unknown or repeated cards"),  # no muestra under uruguayo
+        (3, "hand 0", "unknown or repeated cards"),  # muestra also dealt in a hand
+        (2, 1, "under argentino"),  # muestra under argentino
+        (40, "hand 3", "play 0"),  # seat 0 plays seat 1's card
+        (4, 9, "seat outside"),  # starting seat
+        (7, 7, "seat outside"),  # envido bidder
+        (8, 4, "seat outside"),  # truco bidder
+        (12, 4, "seat outside"),  # actor
+        (13, 4, "seat outside"),  # turn seat
+        (18, 5, "seat outside"),  # best seat
+        (-1, 4, "seat outside"),  # Flor caller
+        (5, 4, "bid state or phase"),  # truco code
+        (6, 4, "bid state or phase"),  # envido code
+        (11, 4, "bid state or phase"),  # phase
+        (14, 4, "trick"),  # trick index
+    ],
+)
+def test_snapshot_rejects_corrupted_fields(round_instance, offset, value, match):
+    data = bytearray(_mid_round_snapshot(round_instance))
+    if isinstance(value, str):
+        value = data[28 + int(value.split()[1])]
+    data[offset] = value
+
+    with pytest.raises(ValueError, match=match):
+        Round.from_bytes(bytes(data), None)
+    before = round_instance.to_bytes()
+    with pytest.raises(ValueError, match="snapshot"):
+        round_instance.load_bytes(bytes(data))
+    assert round_instance.to_bytes() == before
@@ -0,0 +1,61 @@
+import random
+
+import pytest
+
+from models.card import Card
+from models.envido import calculate_envido, has_flor
+from models.player import Player
+from models.round import Round
+from models.rules import get_rules
+
+
+def _ids(cards):
+    return [c.id for c in cards]
+
+
+def test_uruguayan_uses_muestra_rows():
+    rules = get_rules("uruguayo")
+    muestra = Card(10, "oro")
+    row = rules.row(muestra)
+    assert rules.rank_table[row][Card(2, "oro").id] == 18
+    hand = [Card(2, "oro"), Card(6, "espadas"), Card(1, "copa")]
+    assert rules.envido(*_ids(hand), row) == calculate_envido(hand, muestra)
+
+
+def test_argentine_has_no_piezas():
+    rules = get_rules("argentino")
+    assert not rules.uses_muestra
+    row = rules.row(Card(10, "oro"))
+    assert row == 0
+    ranks = rules.rank_table[row]
+    # 2 of oro is a plain card; the ancho de espadas is the top card.
+    assert ranks[Card(1, "espadas").id] > ranks[Card(2, "oro").id]
+    assert ranks[Card(2, "oro").id] == ranks[Card(2, "copa").id]
+
+    hand = [Card(2, "oro"), Card(4, "oro"), Card(1, "espadas")]
+    assert rules.envido(*_ids(hand), row) == calculate_envido(hand, None) == 26
+    assert not rules.has_flor(*_ids(hand), row)
+    flor = [Card(2, "oro"), Card(4, "oro"), Card(5, "oro")]
+    assert rules.has_flor(*_ids(flor), row) == has_flor(flor, None) is True
+
+
+def test_unknown_variant():
+    with pytest.raises(ValueError, match="Unknown rules variant"):
+        get_rules("chileno")
+
+
+def test_round_without_muestra_plays_to_completion():
+    rng = random.Random(3)
+    players = [Player("A1"), Player("B1")]
+    round_inst = Round(
+        team1=[players[0]],
+        team2=[players[1]],
+        ordered_players=players,
+        action_provider=lambda player, state, actions: rng.choice(actions),
+        starting_player=players[0],
+        rules=get_rules("argentino"),
+    )
+    assert round_inst.muestra is None
+    assert len(players[0].cards) == 3
+    team_1_points, team_2_points = round_inst.play_round()
+    assert team_1_points + team_2_points > 0
@@ -0,0 +1,36 @@
+from models.player import Player
+from models.seats import NO_SEAT, SeatTopology
+
+
+def _six_player_table():
+    team1 = [Player("A1"), Player("A2"), Player("A3")]
+    team2 = [Player("B1"), Player("B2"), Player("B3")]
+    ordered = [p for pair in zip(team1, team2) for p in pair]
+    return team1, team2, ordered
+
+
+def test_seats_and_teams():
+    team1, team2, ordered = _six_player_table()
+    seats = SeatTopology(team1, team2, ordered)
+    assert len(seats) == 6
+    assert [seats.seat_of[p] for p in ordered] == list(range(6))
+    assert seats.team_of == (1, 2, 1, 2, 1, 2)
+    assert seats.teammates[0] == (2, 4)
+    assert seats.teammates[3] == (1, 5)
+
+
+def test_trick_orders_and_pies():
+    team1, team2, ordered = _six_player_table()
+    seats = SeatTopology(team1, team2, ordered)
+    assert seats.trick_orders[0] == (0, 1, 2, 3, 4, 5)
+    assert seats.trick_orders[4] == (4, 5, 0, 1, 2, 3)
+    # Starter A1: pies are A3 (seat 4) and B3 (seat 5)
+    assert seats.pies[0] == (4, 5)
+    # Starter B2 (seat 3): order B2, A3, B3, A1, B1, A2 -> pies A2 (2) and B1 (1)
+    assert seats.pies[3] == (2, 1)
+
+
+def test_missing_team_has_no_pie():
+    player = Player("Solo")
+    seats = SeatTopology([player], [], [player])
+    assert seats.pies[0] == (0, NO_SEAT)
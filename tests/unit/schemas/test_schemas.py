@@ -1,4 +1,13 @@
+from models.card import Card
+from models.player import Player
 from schemas.actions import ActionCode, card_index_from_code
+from schemas.round_state import (
+    ENVIDO_QUERIDO,
+    TRUCO_NADA,
+    TRUCO_STATE_TO_INDEX,
+    LiveRoundState,
+    RoundState,
+)
 
 
 def test_action_code_values():
@@ -16,3 +25,42 @@ def test_card_index_from_code():
     assert card_index_from_code(ActionCode.PLAY_CARD_2) == 2
     assert card_index_from_code(ActionCode.OFFER_TRUCO) is None
     assert card_index_from_code(ActionCode.ACCEPT_TRUCO) is None
+
+
+def test_live_round_state_codes():
+    state = LiveRoundState()
+    assert state.truco == TRUCO_NADA
+    assert state.truco_state == "nada"
+    state.truco_state = "retruco"
+    assert state.truco == TRUCO_STATE_TO_INDEX["retruco"]
+    state.envido = ENVIDO_QUERIDO
+    assert state.envido_state == "querido"
+
+
+def test_live_round_state_copy_and_snapshot():
+    player = Player("A1")
+    state = LiveRoundState(player_initial_hands={player: [Card(1, "espadas")]})
+    state.flor_calls.append(player)
+
+    clone = state.copy()
+    clone.flor_calls.clear()
+    clone.envido_points[1] += 2
+    clone.player_initial_hands[player].pop()
+    assert state.flor_calls == [player]
+    assert state.envido_points == {1: 0, 2: 0}
+    assert state.player_initial_hands[player] == [Card(1, "espadas")]
+
+    snapshot = state.snapshot()
+    assert isinstance(snapshot, RoundState)
+    assert snapshot.truco_state == "nada"
+    assert snapshot.flor_calls == [player]
+    assert snapshot.flor_calls is not state.flor_calls
+
+
+def test_round_state_defaults_are_not_shared():
+    first = RoundState(truco_state="nada", cards_played_this_round={})
+    second = RoundState(truco_state="nada", cards_played_this_round={})
+    first.envido_points[1] = 3
+    first.flor_calls.append(Player("A1"))
+    assert second.envido_points == {1: 0, 2: 0}
+    assert second.flor_calls == []